@@ -0,0 +1 @@
+"""Performance benchmarks for the Anthem AV Serial integration."""
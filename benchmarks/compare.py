@@ -0,0 +1,77 @@
+"""Compare two benchmark result files and report regressions.
+
+Usage: ``python -m benchmarks.compare BASELINE CURRENT [--threshold 0.2]``
+
+Exits with status 1 if any metric of a case present in both files grew by
+more than the threshold (a fraction of the baseline value).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+# metrics where a larger value is worse; timings compare their mean
+METRICS = (
+    'poll_cycle_ms',
+    'command_to_state_ms',
+    'serial_lines_per_action',
+    'serial_bytes_per_action',
+    'state_writes_per_idle_tick',
+    'state_writes_per_changed_tick',
+    'memory_per_entity_bytes',
+)
+
+
+def _load(path: Path) -> dict[tuple[str, int, int], dict[str, Any]]:
+    """Load a result file keyed by mode, amp count and zone count."""
+    report = json.loads(path.read_text())
+    return {
+        (result['mode'], result['amps'], result['zones']): result
+        for result in report['results']
+    }
+
+
+def _value(result: dict[str, Any], metric: str) -> float:
+    """Return the comparable value of a metric."""
+    value = result[metric]
+    return value['mean'] if isinstance(value, dict) else value
+
+
+def compare(baseline: Path, current: Path, threshold: float) -> list[str]:
+    """Return a line for every metric that regressed beyond the threshold."""
+    old = _load(baseline)
+    new = _load(current)
+    regressions = []
+    for key in sorted(old.keys() & new.keys()):
+        for metric in METRICS:
+            before = _value(old[key], metric)
+            after = _value(new[key], metric)
+            if after > before * (1 + threshold) and after - before > 1e-9:
+                mode, amps, zones = key
+                regressions.append(
+                    f'{mode} {amps} amps x {zones} zones: '
+                    f'{metric} {before:g} -> {after:g}'
+                )
+    return regressions
+
+
+def main() -> int:
+    """Compare the result files given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('baseline', type=Path)
+    parser.add_argument('current', type=Path)
+    parser.add_argument('--threshold', type=float, default=0.2)
+    args = parser.parse_args()
+
+    regressions = compare(args.baseline, args.current, args.threshold)
+    for line in regressions:
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
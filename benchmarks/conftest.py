@@ -0,0 +1,70 @@
+"""Fixtures for the Anthem AV Serial benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+import json
+import os
+from pathlib import Path
+import platform
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.anthemav_serial.device_index import clear_series_indexes
+from tests.conftest import (  # noqa: F401
+    config_entry_factory,
+    mock_config_entry_data,
+    mock_config_entry_options,
+)
+
+MANIFEST = (
+    Path(__file__).parent.parent / 'custom_components/anthemav_serial/manifest.json'
+)
+
+# where the results are written, overridable to keep one file per release
+RESULTS_ENV = 'ANTHEM_BENCHMARK_RESULTS'
+DEFAULT_RESULTS = 'benchmark-results.json'
+
+
+@pytest.fixture(scope='session')
+def benchmark_results() -> Generator[list[dict[str, Any]]]:
+    """Collect benchmark results and write them as JSON after the session."""
+    results: list[dict[str, Any]] = []
+    yield results
+    if not results:
+        return
+
+    report = {
+        'version': json.loads(MANIFEST.read_text())['version'],
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': sorted(
+            results, key=lambda item: (item['mode'], item['amps'], item['zones'])
+        ),
+    }
+    path = Path(os.environ.get(RESULTS_ENV, DEFAULT_RESULTS))
+    path.write_text(json.dumps(report, indent=2) + '\n')
+
+
+@pytest.fixture
+def bench_device_config() -> Generator[dict]:
+    """Provide a small device configuration for the d2v series."""
+    device_config = {
+        'd2v': {
+            'sources': {
+                1: {'name': 'CD'},
+                2: {'name': 'Tuner'},
+                3: {'name': 'Video 1'},
+                4: {'name': 'Video 2'},
+            }
+        },
+    }
+    clear_series_indexes()
+    with patch(
+        'custom_components.anthemav_serial.coordinator.DEVICE_CONFIG',
+        device_config,
+    ):
+        yield device_config
+    clear_series_indexes()
@@ -0,0 +1,242 @@
+"""Benchmarks of the coordinator and media players against simulated receivers.
+
+Each case runs 1-10 receivers with 1-3 zones on pty-backed Gen1 simulators
+that inject link latency, in both sequential and pipelined polling modes, and
+records:
+
+* poll_cycle_ms: duration of one coordinator refresh
+* command_to_state_ms: time from a media player mute command until the
+  coordinator data reflects it
+* serial_lines_per_action / serial_bytes_per_action: what one user action
+  writes to the receiver, including its confirming status read
+* state_writes_per_idle_tick / state_writes_per_changed_tick: entity state
+  writes per refresh while nothing changed, and after one zone changed
+* memory_per_entity_bytes: memory allocated per media player entity
+
+Both modes drive the integration's native protocol client, which stands in for
+the anthemav_serial controller in sequential mode, so they compare polling
+strategies over the same client rather than the two clients. Every result is
+labelled with ``client: native``.
+
+Run with ``pytest benchmarks``; the results are written as JSON to
+``benchmark-results.json`` (or the path in ``ANTHEM_BENCHMARK_RESULTS``) and
+two result files can be compared with ``python -m benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from functools import partial
+import statistics
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PORT
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.anthemav_serial.const import (
+    CONF_DISCOVERED_ZONES,
+    CONF_PIPELINED_POLLING,
+    CONF_SERIAL_NUMBER,
+    DEFAULT_MAX_VOLUME,
+)
+from custom_components.anthemav_serial.coordinator import AnthemAVSerialCoordinator
+from custom_components.anthemav_serial.media_player import AnthemAVSerialMediaPlayer
+from custom_components.anthemav_serial.protocol import async_open_client
+from tests.simulator import Gen1Simulator
+
+pytest.importorskip('serial_asyncio')
+
+AMP_COUNTS = (1, 2, 5, 10)
+ZONE_COUNTS = (1, 2, 3)
+MODES = ('sequential', 'pipelined')
+# the client every mode runs on, see _async_open_stand_in
+CLIENT = 'native'
+
+# simulated link: reply latency and jitter in seconds, like a USB adapter
+LINK = {'baudrate': 9600, 'latency': 0.01, 'jitter': 0.002, 'seed': 1}
+
+POLL_CYCLES = 5
+ACTIONS = 4
+
+
+@dataclass
+class Amp:
+    """One simulated receiver with its coordinator and entities."""
+
+    simulator: Gen1Simulator
+    coordinator: AnthemAVSerialCoordinator
+    entities: list[AnthemAVSerialMediaPlayer] = field(default_factory=list)
+    unsubs: list[Callable[[], None]] = field(default_factory=list)
+
+
+async def _async_open_stand_in(series: str, port: str, loop: Any) -> Any:
+    """Stand in for the anthemav_serial controller with the native client."""
+    return await async_open_client(port, {'baudrate': LINK['baudrate']})
+
+
+def _create_amp(
+    hass: HomeAssistant,
+    config_entry_factory: Callable[..., ConfigEntry],
+    number: int,
+    zones: int,
+    mode: str,
+) -> Amp:
+    """Start a simulated receiver and create its coordinator."""
+    zone_ids = list(range(1, zones + 1))
+    simulator = Gen1Simulator(zones=tuple(zone_ids), **LINK)
+    simulator.start()
+    for state in simulator.zones.values():
+        state.power = True
+
+    entry = config_entry_factory(
+        data={
+            CONF_PORT: simulator.port,
+            CONF_SERIAL_NUMBER: f'{number:06}',
+            # skip the zone probe, it is not part of a steady-state poll
+            CONF_DISCOVERED_ZONES: {f'{simulator.port}|d2v': zone_ids},
+        },
+        options={CONF_PIPELINED_POLLING: mode == 'pipelined'},
+        entry_id=f'bench_entry_{number}',
+        unique_id=f'{simulator.port}_{number:06}',
+    )
+    return Amp(simulator, AnthemAVSerialCoordinator(hass, entry))
+
+
+def _add_entities(amp: Amp) -> None:
+    """Create the media players of an amp and subscribe them to updates."""
+    for zone_id in amp.coordinator.zones:
+        entity = AnthemAVSerialMediaPlayer(
+            coordinator=amp.coordinator,
+            serial_number=amp.coordinator.config_entry.data[CONF_SERIAL_NUMBER],
+            series='d2v',
+            zone_id=zone_id,
+            zone_name='Main Zone' if zone_id == 1 else f'Zone {zone_id}',
+            max_volume=DEFAULT_MAX_VOLUME,
+        )
+        # no state machine here; the coordinator counts the writes
+        entity.async_write_ha_state = lambda: None
+        amp.entities.append(entity)
+        amp.unsubs.append(
+            amp.coordinator.async_add_listener(entity._handle_coordinator_update)
+        )
+
+
+async def _async_timed(call: Callable[[], Awaitable[Any]]) -> float:
+    """Return how long an awaitable call took, in milliseconds."""
+    start = time.perf_counter()
+    await call()
+    return (time.perf_counter() - start) * 1000
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    """Summarize timing samples."""
+    return {
+        'mean': round(statistics.fmean(samples), 3),
+        'max': round(max(samples), 3),
+    }
+
+
+def _written(amps: list[Amp]) -> int:
+    """Return the total entity state writes of all amps."""
+    return sum(amp.coordinator.state_write_stats['written'] for amp in amps)
+
+
+async def _async_poll_all(amps: list[Amp]) -> list[float]:
+    """Refresh every coordinator concurrently and return each duration."""
+    return list(
+        await asyncio.gather(
+            *(_async_timed(amp.coordinator.async_refresh) for amp in amps)
+        )
+    )
+
+
+@pytest.mark.parametrize('zones', ZONE_COUNTS)
+@pytest.mark.parametrize('amps', AMP_COUNTS)
+@pytest.mark.parametrize('mode', MODES)
+async def test_benchmark(
+    hass: HomeAssistant,
+    config_entry_factory: Callable[..., ConfigEntry],
+    bench_device_config: dict,
+    benchmark_results: list[dict[str, Any]],
+    mode: str,
+    amps: int,
+    zones: int,
+) -> None:
+    """Measure polling, command round trips and entity fan-out."""
+    fleet = [
+        _create_amp(hass, config_entry_factory, number, zones, mode)
+        for number in range(amps)
+    ]
+    entity_count = amps * zones
+    try:
+        with patch(
+            'custom_components.anthemav_serial.coordinator.get_async_amp_controller',
+            _async_open_stand_in,
+        ):
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            for amp in fleet:
+                _add_entities(amp)
+            memory = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+
+            # connect and load the initial state outside the measurements
+            await _async_poll_all(fleet)
+            assert all(amp.coordinator.last_update_success for amp in fleet)
+
+            polls: list[float] = []
+            written = _written(fleet)
+            for _ in range(POLL_CYCLES):
+                polls.extend(await _async_poll_all(fleet))
+            idle_writes = (_written(fleet) - written) / (POLL_CYCLES * amps)
+
+            written = _written(fleet)
+            for cycle in range(POLL_CYCLES):
+                for amp in fleet:
+                    amp.simulator.zones[1].volume = -30.0 - cycle
+                await _async_poll_all(fleet)
+            changed_writes = (_written(fleet) - written) / (POLL_CYCLES * amps)
+
+            commands: list[float] = []
+            lines = sum(len(amp.simulator.received) for amp in fleet)
+            sent = sum(amp.simulator.bytes_in for amp in fleet)
+            for action in range(ACTIONS):
+                mute = action % 2 == 0
+                for amp in fleet:
+                    mute_volume = partial(amp.entities[0].async_mute_volume, mute)
+                    commands.append(await _async_timed(mute_volume))
+                    assert amp.coordinator.data[1]['mute'] is mute
+            actions = ACTIONS * amps
+            lines = sum(len(amp.simulator.received) for amp in fleet) - lines
+            sent = sum(amp.simulator.bytes_in for amp in fleet) - sent
+    finally:
+        for amp in fleet:
+            for unsub in amp.unsubs:
+                unsub()
+            await amp.coordinator.async_disconnect()
+            amp.simulator.stop()
+
+    result = {
+        'client': CLIENT,
+        'mode': mode,
+        'amps': amps,
+        'zones': zones,
+        'poll_cycle_ms': _summary(polls),
+        'command_to_state_ms': _summary(commands),
+        'serial_lines_per_action': lines / actions,
+        'serial_bytes_per_action': sent / actions,
+        'state_writes_per_idle_tick': idle_writes,
+        'state_writes_per_changed_tick': changed_writes,
+        'memory_per_entity_bytes': round(memory / entity_count),
+    }
+    benchmark_results.append(result)
+
+    assert idle_writes == 0
+    assert changed_writes == 1
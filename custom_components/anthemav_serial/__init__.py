@@ -7,17 +7,28 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
 from .coordinator import AnthemAVSerialCoordinator
+from .services import async_setup_services
 
 LOG = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER]
+PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 type AnthemAVSerialConfigEntry = ConfigEntry[AnthemAVSerialCoordinator]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Anthem AV Serial services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: AnthemAVSerialConfigEntry
 ) -> bool:
@@ -26,18 +37,23 @@ async def async_setup_entry(
 
     coordinator = AnthemAVSerialCoordinator(hass, entry)
 
-    # initial data fetch
-    await coordinator.async_config_entry_first_refresh()
-
     # store coordinator in runtime data
     entry.runtime_data = coordinator
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # reload on options update
+    # reload on options update, or when the first connection discovered zones
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
+    # connect and poll in the background so a slow or powered-off receiver
+    # does not hold up startup; entities show their restored state meanwhile
+    entry.async_create_background_task(
+        hass,
+        coordinator.async_refresh(),
+        name=f'{DOMAIN} first refresh {entry.data[CONF_PORT]}',
+    )
+
     LOG.info(
         'Anthem AV Serial integration setup complete for %s', entry.data[CONF_PORT]
     )
@@ -14,6 +14,7 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import callback
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
@@ -28,17 +29,37 @@ from homeassistant.helpers.selector import (
 import voluptuous as vol
 
 from .const import (
+    ALL_ZONES,
+    CONF_ADAPTIVE_POLLING,
+    CONF_DISCOVERED_ZONES,
+    CONF_MAX_SCAN_INTERVAL,
     CONF_MAX_VOLUME,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_OPTIMISTIC,
+    CONF_PIPELINED_POLLING,
+    CONF_PRESETS,
+    CONF_PUSH_UPDATES,
+    CONF_RECONCILE_TIMEOUT,
     CONF_SERIAL_NUMBER,
     CONF_SERIES,
+    CONF_ZONES,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_SCAN_INTERVAL,
     DEFAULT_MAX_VOLUME,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_PIPELINED_POLLING,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_RECONCILE_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SERIAL_NUMBER,
     DEFAULT_SERIES,
     DOMAIN,
     SUPPORTED_SERIES,
 )
+from .presets import parse_presets
+from .protocol import parse_network_port
 
 LOG = logging.getLogger(__name__)
 
@@ -54,6 +75,15 @@ SERIES_OPTIONS: list[SelectOptionDict] = [
 ]
 
 
+def _valid_port_url(port: str) -> bool:
+    """Return whether a port URL is a complete socket:// or rfc2217:// URL."""
+    try:
+        parse_network_port(port)
+    except ValueError:
+        return False
+    return True
+
+
 class AnthemAVSerialConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Anthem AV Serial."""
 
@@ -69,9 +99,11 @@ class AnthemAVSerialConfigFlow(ConfigFlow, domain=DOMAIN):
             port = user_input[CONF_PORT]
             series = user_input[CONF_SERIES]
 
-            # validate series
+            # validate series and, for network bridges, the port URL
             if series not in SUPPORTED_SERIES:
                 errors['base'] = 'invalid_series'
+            elif '://' in port and not _valid_port_url(port):
+                errors[CONF_PORT] = 'invalid_port'
             else:
                 # use port as unique id (simpler than requiring serial number)
                 unique_id = port
@@ -125,12 +157,44 @@ class AnthemAVSerialConfigFlow(ConfigFlow, domain=DOMAIN):
 class AnthemAVSerialOptionsFlow(OptionsFlow):
     """Handle options flow for Anthem AV Serial."""
 
+    def _available_zones(self) -> list[int]:
+        """Return the zones discovered on the receiver, or all zones."""
+        data = self.config_entry.data
+        cache = data.get(CONF_DISCOVERED_ZONES, {})
+        return cache.get(f'{data[CONF_PORT]}|{data[CONF_SERIES]}') or ALL_ZONES
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return self.async_create_entry(title='', data=user_input)
+            try:
+                parse_presets(user_input.get(CONF_PRESETS, ''))
+            except ValueError:
+                errors[CONF_PRESETS] = 'invalid_presets'
+            if not user_input.get(CONF_ZONES):
+                errors['base'] = 'no_zones'
+            elif not (
+                user_input.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+                <= user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                <= user_input.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+            ):
+                errors['base'] = 'invalid_intervals'
+            if not errors:
+                return self.async_create_entry(title='', data=user_input)
+
+        available_zones = self._available_zones()
+        zone_options = [
+            SelectOptionDict(
+                value=str(zone), label='Main Zone' if zone == 1 else f'Zone {zone}'
+            )
+            for zone in available_zones
+        ]
+        current_zones = self.config_entry.options.get(
+            CONF_ZONES, [str(zone) for zone in available_zones]
+        )
 
         current_scan_interval = self.config_entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
@@ -138,6 +202,28 @@ class AnthemAVSerialOptionsFlow(OptionsFlow):
         current_max_volume = self.config_entry.options.get(
             CONF_MAX_VOLUME, DEFAULT_MAX_VOLUME
         )
+        current_pipelined = self.config_entry.options.get(
+            CONF_PIPELINED_POLLING, DEFAULT_PIPELINED_POLLING
+        )
+        current_push = self.config_entry.options.get(
+            CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES
+        )
+        current_optimistic = self.config_entry.options.get(
+            CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC
+        )
+        current_reconcile_timeout = self.config_entry.options.get(
+            CONF_RECONCILE_TIMEOUT, DEFAULT_RECONCILE_TIMEOUT
+        )
+        current_adaptive = self.config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        current_min_scan_interval = self.config_entry.options.get(
+            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+        )
+        current_max_scan_interval = self.config_entry.options.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        current_presets = self.config_entry.options.get(CONF_PRESETS, '')
 
         return self.async_show_form(
             step_id='init',
@@ -164,6 +250,62 @@ class AnthemAVSerialOptionsFlow(OptionsFlow):
                             mode=NumberSelectorMode.SLIDER,
                         )
                     ),
+                    vol.Required(CONF_ZONES, default=current_zones): SelectSelector(
+                        SelectSelectorConfig(
+                            options=zone_options,
+                            multiple=True,
+                            mode=SelectSelectorMode.LIST,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_PIPELINED_POLLING, default=current_pipelined
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_PUSH_UPDATES, default=current_push
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_OPTIMISTIC, default=current_optimistic
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_RECONCILE_TIMEOUT, default=current_reconcile_timeout
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=30,
+                            step=1,
+                            mode=NumberSelectorMode.SLIDER,
+                            unit_of_measurement='seconds',
+                        )
+                    ),
+                    vol.Required(
+                        CONF_ADAPTIVE_POLLING, default=current_adaptive
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_MIN_SCAN_INTERVAL, default=current_min_scan_interval
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=60,
+                            step=1,
+                            mode=NumberSelectorMode.SLIDER,
+                            unit_of_measurement='seconds',
+                        )
+                    ),
+                    vol.Required(
+                        CONF_MAX_SCAN_INTERVAL, default=current_max_scan_interval
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=10,
+                            max=900,
+                            step=10,
+                            mode=NumberSelectorMode.SLIDER,
+                            unit_of_measurement='seconds',
+                        )
+                    ),
+                    vol.Optional(CONF_PRESETS, default=current_presets): TextSelector(
+                        TextSelectorConfig(type=TextSelectorType.TEXT, multiline=True)
+                    ),
                 }
             ),
+            errors=errors,
         )
@@ -0,0 +1,110 @@
+"""Connection state machine for the Anthem device link."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import random
+from typing import Any
+
+
+class ConnectionState(StrEnum):
+    """State of the link to the Anthem device."""
+
+    DISCONNECTED = 'disconnected'
+    CONNECTED = 'connected'
+    DEGRADED = 'degraded'
+    BACKING_OFF = 'backing_off'
+    OPEN_CIRCUIT = 'open_circuit'
+
+
+class ReconnectPolicy:
+    """Decide when to retry a failed connection.
+
+    Failed attempts back off exponentially with jitter. After a run of
+    failures the circuit opens and attempts fail fast for a longer period;
+    the next attempt after that acts as a half-open probe.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        failure_threshold: int = 5,
+        open_duration: float = 300.0,
+        jitter: float = 0.2,
+    ) -> None:
+        """Initialize the policy."""
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._failure_threshold = failure_threshold
+        self._open_duration = open_duration
+        self._jitter = jitter
+
+        self.state = ConnectionState.DISCONNECTED
+        self.consecutive_failures = 0
+        self.reconnects = 0
+        self._next_attempt = 0.0
+        self._last_error: str | None = None
+        self._ever_connected = False
+
+    def allow_attempt(self, now: float) -> bool:
+        """Return whether a connection attempt may be made now."""
+        if self.state in (ConnectionState.BACKING_OFF, ConnectionState.OPEN_CIRCUIT):
+            return now >= self._next_attempt
+        return True
+
+    def retry_in(self, now: float) -> float:
+        """Return the seconds until the next attempt is allowed."""
+        return max(0.0, self._next_attempt - now)
+
+    def reset(self) -> None:
+        """Allow an immediate attempt, e.g. after the port reappeared."""
+        self._next_attempt = 0.0
+
+    def record_success(self) -> None:
+        """Record a successful connection."""
+        if self._ever_connected:
+            self.reconnects += 1
+        self._ever_connected = True
+        self.consecutive_failures = 0
+        self._last_error = None
+        self.state = ConnectionState.CONNECTED
+
+    def record_failure(self, now: float, error: str | None = None) -> None:
+        """Record a failed connection attempt and schedule the next one."""
+        self.consecutive_failures += 1
+        self._last_error = error
+
+        if self.consecutive_failures >= self._failure_threshold:
+            self.state = ConnectionState.OPEN_CIRCUIT
+            delay = self._open_duration
+        else:
+            self.state = ConnectionState.BACKING_OFF
+            delay = min(
+                self._max_delay,
+                self._base_delay * 2 ** (self.consecutive_failures - 1),
+            )
+            delay *= random.uniform(1 - self._jitter, 1 + self._jitter)
+
+        self._next_attempt = now + delay
+
+    def record_poll(self, healthy: bool) -> None:
+        """Mark a connected link degraded while zones fail to answer."""
+        if self.state is ConnectionState.CONNECTED and not healthy:
+            self.state = ConnectionState.DEGRADED
+        elif self.state is ConnectionState.DEGRADED and healthy:
+            self.state = ConnectionState.CONNECTED
+
+    def record_disconnect(self) -> None:
+        """Record that an established link was lost."""
+        self.state = ConnectionState.DISCONNECTED
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the policy state for diagnostics."""
+        return {
+            'state': self.state.value,
+            'consecutive_failures': self.consecutive_failures,
+            'reconnects': self.reconnects,
+            'retry_in': round(self.retry_in(now), 1),
+            'last_error': self._last_error,
+        }
@@ -12,7 +12,30 @@ CONF_SERIAL_NUMBER: Final[str] = 'serial_number'
 CONF_SERIES: Final[str] = 'series'
 CONF_SOURCES: Final[str] = 'sources'
 CONF_ZONES: Final[str] = 'zones'
+CONF_DISCOVERED_ZONES: Final[str] = 'discovered_zones'
 CONF_MAX_VOLUME: Final[str] = 'max_volume'
+CONF_PIPELINED_POLLING: Final[str] = 'pipelined_polling'
+CONF_PUSH_UPDATES: Final[str] = 'push_updates'
+CONF_OPTIMISTIC: Final[str] = 'optimistic'
+CONF_RECONCILE_TIMEOUT: Final[str] = 'reconcile_timeout'
+CONF_ADAPTIVE_POLLING: Final[str] = 'adaptive_polling'
+CONF_MIN_SCAN_INTERVAL: Final[str] = 'min_scan_interval'
+CONF_MAX_SCAN_INTERVAL: Final[str] = 'max_scan_interval'
+CONF_PRESETS: Final[str] = 'presets'
+
+# Services
+SERVICE_DISCOVER_ZONES: Final[str] = 'discover_zones'
+SERVICE_SNAPSHOT: Final[str] = 'snapshot'
+SERVICE_RESTORE: Final[str] = 'restore'
+SERVICE_BATCH: Final[str] = 'batch'
+SERVICE_RAMP_VOLUME: Final[str] = 'ramp_volume'
+
+# Service attributes
+ATTR_CONFIG_ENTRY_ID: Final[str] = 'config_entry_id'
+ATTR_COMMANDS: Final[str] = 'commands'
+ATTR_ZONE: Final[str] = 'zone'
+ATTR_DURATION: Final[str] = 'duration'
+ATTR_CURVE: Final[str] = 'curve'
 
 # Defaults
 DEFAULT_NAME: Final[str] = 'Anthem Receiver'
@@ -20,6 +43,38 @@ DEFAULT_SERIAL_NUMBER: Final[str] = '000000'
 DEFAULT_SERIES: Final[str] = 'd2v'
 DEFAULT_SCAN_INTERVAL: Final[int] = 10
 DEFAULT_MAX_VOLUME: Final[float] = 0.6
+DEFAULT_PIPELINED_POLLING: Final[bool] = False
+DEFAULT_PUSH_UPDATES: Final[bool] = False
+DEFAULT_OPTIMISTIC: Final[bool] = False
+DEFAULT_RECONCILE_TIMEOUT: Final[int] = 5
+DEFAULT_ADAPTIVE_POLLING: Final[bool] = False
+DEFAULT_MIN_SCAN_INTERVAL: Final[int] = 2
+DEFAULT_MAX_SCAN_INTERVAL: Final[int] = 120
+
+# with push updates, polling is only a safety net for missed messages
+PUSH_SAFETY_SCAN_INTERVAL: Final[int] = 300
+
+# adaptive polling stays at the floor for this long after a command, and
+# multiplies the interval by the back-off factor on each all-standby poll
+ADAPTIVE_ACTIVITY_WINDOW: Final[int] = 60
+ADAPTIVE_BACKOFF_FACTOR: Final[float] = 1.5
+
+# serial traffic rates are averaged over the samples taken within this window
+TRAFFIC_RATE_WINDOW: Final[int] = 600
+
+# zone settings a command can change, in the order they are applied
+ZONE_SETTINGS: Final[tuple[str, ...]] = ('power', 'source', 'volume', 'mute')
+
+# a zone turned on ignores other commands until it is ready; its power is
+# polled at this interval, in seconds, for up to the timeout
+POWER_ON_POLL_INTERVAL: Final[float] = 0.5
+POWER_ON_TIMEOUT: Final[float] = 15.0
+
+# time between the levels sent by a volume ramp, in seconds
+RAMP_STEP_INTERVAL: Final[float] = 0.25
+
+# zones a Gen1 receiver can have; the ones actually wired are discovered
+ALL_ZONES: Final[list[int]] = [1, 2, 3]
 
 # Supported series (Gen1 RS232 protocol)
 SUPPORTED_SERIES: Final[list[str]] = [
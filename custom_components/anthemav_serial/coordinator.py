@@ -3,26 +3,95 @@
 from __future__ import annotations
 
 import logging
+import asyncio
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
 from datetime import timedelta
+from functools import partial
+import math
+import os
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.importlib import async_import_module
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from anthemav_serial import get_async_amp_controller
-from anthemav_serial.config import DEVICE_CONFIG
-
+from .connection import ConnectionState, ReconnectPolicy
 from .const import (
+    ADAPTIVE_ACTIVITY_WINDOW,
+    ADAPTIVE_BACKOFF_FACTOR,
+    CONF_ADAPTIVE_POLLING,
+    CONF_DISCOVERED_ZONES,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MAX_VOLUME,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_OPTIMISTIC,
+    CONF_PIPELINED_POLLING,
+    CONF_PRESETS,
+    CONF_PUSH_UPDATES,
+    CONF_RECONCILE_TIMEOUT,
     CONF_SERIES,
-    CONF_SOURCES,
+    CONF_ZONES,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MAX_VOLUME,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_PIPELINED_POLLING,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_RECONCILE_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    POWER_ON_POLL_INTERVAL,
+    POWER_ON_TIMEOUT,
+    PUSH_SAFETY_SCAN_INTERVAL,
+    RAMP_STEP_INTERVAL,
+    TRAFFIC_RATE_WINDOW,
+    ZONE_SETTINGS,
+)
+from .device_index import SeriesIndex, build_series_index, get_series_index
+from .metrics import LinkMetrics
+from .presets import TunerPreset, parse_presets
+from .protocol import (
+    TUNER_ZONE,
+    VOLUME_STEP,
+    AnthemGen1Client,
+    async_open_client,
+    decode_status_line,
+    is_network_port,
+    volume_to_db,
 )
+from .scheduler import LinkScheduler, Priority
 
 LOG = logging.getLogger(__name__)
 
+# the anthemav_serial device configuration, imported when the first
+# coordinator connects rather than when Home Assistant loads the integration
+DEVICE_CONFIG: Mapping[str, Any] = {}
+
+
+async def async_load_device_config(hass: HomeAssistant) -> Mapping[str, Any]:
+    """Import the anthemav_serial library and return its device configuration."""
+    global DEVICE_CONFIG
+    if not DEVICE_CONFIG:
+        config = await async_import_module(hass, 'anthemav_serial.config')
+        DEVICE_CONFIG = config.DEVICE_CONFIG
+    return DEVICE_CONFIG
+
+
+async def get_async_amp_controller(
+    series: str, port: str, loop: asyncio.AbstractEventLoop
+) -> Any:
+    """Create an anthemav_serial controller once the library is loaded."""
+    from anthemav_serial import get_async_amp_controller as create_controller
+
+    return await create_controller(series, port, loop)
+
 
 class AnthemAVSerialCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
     """Coordinator for managing Anthem AV Serial device data."""
@@ -39,39 +108,122 @@ class AnthemAVSerialCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]
         self._amp: Any | None = None
         self._port: str = config_entry.data[CONF_PORT]
         self._series: str = config_entry.data[CONF_SERIES]
-        self._sources: dict[int, str] = {}
         self._zones: list[int] = []
+        # zones found by probing are cached in the entry per port and series,
+        # so the probe only runs again on request or when either changes
+        self._discovery_key = f'{self._port}|{self._series}'
+        self._zones_probed: bool = False
         self._connected: bool = False
+        self._reconnect = ReconnectPolicy()
+        # whether the local port path existed at the last failed attempt
+        self._port_present: bool | None = None
+        self._scheduler = LinkScheduler()
+        self._metrics = LinkMetrics()
+        # (time, total bytes) of the native client, sampled on every update
+        self._traffic: deque[tuple[float, int]] = deque()
+        # bumped on every targeted zone refresh, so a poll that was pre-empted
+        # does not overwrite a newer read with the value it got before
+        self._refresh_generation: dict[int, int] = {}
+        self._pipelined: bool = config_entry.options.get(
+            CONF_PIPELINED_POLLING, DEFAULT_PIPELINED_POLLING
+        )
+        self._push: bool = config_entry.options.get(
+            CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES
+        )
+        self._unsub_push: list[Callable[[], None]] = []
+        self._unsub_link_lost: Callable[[], None] | None = None
+
+        # optimistic state: expected values per zone with their deadline, laid
+        # over the last values read from the device until confirmed or expired
+        self._optimistic: bool = config_entry.options.get(
+            CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC
+        )
+        self._reconcile_timeout: float = config_entry.options.get(
+            CONF_RECONCILE_TIMEOUT, DEFAULT_RECONCILE_TIMEOUT
+        )
+        self._device_data: dict[int, dict[str, Any]] = {}
+        self._expected: dict[int, dict[str, tuple[Any, float]]] = {}
+        self._unsub_reconcile: dict[int, CALLBACK_TYPE] = {}
+
+        # volume commands waiting to be sent; a burst collapses into the latest
+        # absolute level plus the net number of up/down steps queued after it
+        self._max_volume: float = config_entry.options.get(
+            CONF_MAX_VOLUME, DEFAULT_MAX_VOLUME
+        )
+        self._pending_volume: dict[int, float] = {}
+        self._pending_steps: dict[int, int] = {}
+        self._volume_locks: dict[int, asyncio.Lock] = {}
+
+        # zone groups: leader zone to the zones following its source, volume
+        # and mute
+        self._groups: dict[int, list[int]] = {}
+        # zones whose group or tuner station changed, written on the next notify
+        self._touched_zones: set[int] = set()
+
+        # tuner presets, and the (band, frequency) the tuner was last seen on;
+        # the tuner is shared by all zones
+        self._presets = parse_presets(config_entry.options.get(CONF_PRESETS, ''))
+        self._tuned: tuple[str, float] | None = None
+
+        # volume ramps in progress, per zone
+        self._ramps: dict[int, asyncio.Task[None]] = {}
+
+        # zone settings saved by the snapshot service, for a later restore
+        self._snapshot: dict[int, dict[str, Any]] | None = None
+
+        # change detection: zones whose data differs from the last notification
+        self._notified_data: dict[int, dict[str, Any]] = {}
+        self._notified_success: bool | None = None
+        self._changed_zones: set[int] = set()
+        self._state_writes: int = 0
+        self._state_writes_skipped: int = 0
 
         scan_interval = config_entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
+        self._scan_interval = timedelta(seconds=scan_interval)
+
+        # adaptive polling: fast after commands, scan interval while a zone is
+        # on, and a gradual back-off towards the ceiling while all are off
+        self._adaptive: bool = config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        self._min_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+            )
+        )
+        self._max_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+            )
+        )
+        self._last_activity: float | None = None
 
         super().__init__(
             hass,
             LOG,
+            config_entry=config_entry,
             name=f'{DOMAIN}_{self._port}',
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=self._scan_interval,
         )
 
-        # load source configuration from the anthemav_serial library
-        self._load_device_config()
+        # source and zone lookups shared by all entries of the same series; an
+        # empty index stands in until the device configuration is loaded
+        if DEVICE_CONFIG:
+            self._index = get_series_index(self._series, DEVICE_CONFIG)
+        else:
+            self._index = build_series_index(self._series, {})
+        # use the zones discovered earlier, else all zones until probed
+        self._zones = self._enabled_zones(self.discovered_zones or self._index.zones)
 
-    def _load_device_config(self) -> None:
-        """Load device configuration from anthemav_serial library."""
-        if self._series in DEVICE_CONFIG:
-            device_conf = DEVICE_CONFIG[self._series]
-            # extract sources
-            raw_sources = device_conf.get(CONF_SOURCES, {})
-            for source_id, source_data in raw_sources.items():
-                if isinstance(source_data, dict) and 'name' in source_data:
-                    self._sources[int(source_id)] = source_data['name']
-                elif isinstance(source_data, str):
-                    self._sources[int(source_id)] = source_data
-
-            # default to 3 zones for most Anthem receivers
-            self._zones = [1, 2, 3]
-            LOG.debug('Loaded config for %s: sources=%s', self._series, self._sources)
+    def _enabled_zones(self, zones: Iterable[int]) -> list[int]:
+        """Return the zones not disabled in the options."""
+        enabled = self.config_entry.options.get(CONF_ZONES)
+        if enabled is None:
+            return list(zones)
+        enabled_ids = {int(zone) for zone in enabled}
+        return [zone for zone in zones if zone in enabled_ids]
 
     @property
     def amp(self) -> Any | None:
@@ -79,15 +231,39 @@ class AnthemAVSerialCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]
         return self._amp
 
     @property
-    def sources(self) -> dict[int, str]:
+    def index(self) -> SeriesIndex:
+        """Return the shared source and zone index of the series."""
+        return self._index
+
+    @property
+    def sources(self) -> Mapping[int | str, str]:
         """Return source name mapping."""
-        return self._sources
+        return self._index.source_names
+
+    @property
+    def presets(self) -> Mapping[str, TunerPreset]:
+        """Return the tuner presets, or none if the series has no tuner input."""
+        return self._presets if self._index.tuner_source is not None else {}
+
+    @property
+    def active_preset(self) -> str | None:
+        """Return the preset the tuner is on, if any."""
+        for name, preset in self.presets.items():
+            if (preset.band, preset.frequency) == self._tuned:
+                return name
+        return None
 
     @property
     def zones(self) -> list[int]:
         """Return list of zone IDs."""
         return self._zones
 
+    @property
+    def discovered_zones(self) -> list[int] | None:
+        """Return the zones cached from an earlier probe, if any."""
+        cache = self.config_entry.data.get(CONF_DISCOVERED_ZONES, {})
+        return cache.get(self._discovery_key)
+
     @property
     def series(self) -> str:
         """Return the device series."""
@@ -98,34 +274,305 @@ class AnthemAVSerialCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]
         """Return connection status."""
         return self._connected
 
+    @property
+    def connection_state(self) -> ConnectionState:
+        """Return the state of the link to the device."""
+        return self._reconnect.state
+
+    @property
+    def connection_stats(self) -> dict[str, Any]:
+        """Return the connection state and retry schedule."""
+        return self._reconnect.as_dict(time.monotonic())
+
+    @property
+    def state_write_stats(self) -> dict[str, int]:
+        """Return how many entity state writes were made and skipped."""
+        return {
+            'written': self._state_writes,
+            'skipped': self._state_writes_skipped,
+        }
+
+    @property
+    def scheduler(self) -> LinkScheduler:
+        """Return the scheduler that owns the amp link."""
+        return self._scheduler
+
+    @property
+    def metrics(self) -> LinkMetrics:
+        """Return the latency and outcome statistics of the amp link."""
+        return self._metrics
+
+    @property
+    def reconnects(self) -> int:
+        """Return how many times the link was re-established."""
+        return self._reconnect.reconnects
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Return the number of connection failures since the last success."""
+        return self._reconnect.consecutive_failures
+
+    @property
+    def last_poll_duration(self) -> float | None:
+        """Return how long the last full refresh took, in milliseconds."""
+        stats = self._metrics.get('refresh')
+        return stats.last_ms if stats is not None else None
+
+    @property
+    def command_latency_p95(self) -> float | None:
+        """Return the 95th percentile of recent command latencies in milliseconds."""
+        return self._metrics.recent_command_percentile(0.95)
+
+    @property
+    def serial_bytes_per_minute(self) -> float | None:
+        """Return the recent link traffic, if the native client is in use."""
+        if len(self._traffic) < 2:
+            return None
+        (start, start_bytes), (end, end_bytes) = self._traffic[0], self._traffic[-1]
+        if end <= start:
+            return None
+        return (end_bytes - start_bytes) / (end - start) * 60
+
+    @property
+    def snapshot(self) -> dict[int, dict[str, Any]] | None:
+        """Return the zone settings saved by the last snapshot, if any."""
+        return self._snapshot
+
+    @property
+    def pipelined(self) -> bool:
+        """Return whether zone status queries are pipelined."""
+        return self._pipelined
+
+    @property
+    def push(self) -> bool:
+        """Return whether unsolicited status from the amp is consumed."""
+        return self._push
+
+    @property
+    def optimistic(self) -> bool:
+        """Return whether commands are reflected before the device confirms."""
+        return self._optimistic
+
     async def async_connect(self) -> bool:
-        """Establish connection to the Anthem device."""
+        """Establish connection to the Anthem device.
+
+        After a failure, attempts are skipped until the reconnect policy's
+        back-off has elapsed, unless the local port has reappeared meanwhile.
+        """
         if self._connected and self._amp is not None:
             return True
 
+        if not self._reconnect.allow_attempt(time.monotonic()):
+            if not await self._async_port_reappeared():
+                return False
+            LOG.info('%s reappeared, reconnecting', self._port)
+            self._reconnect.reset()
+
+        start = time.perf_counter()
         try:
-            LOG.info('Connecting to Anthem %s at %s', self._series, self._port)
-            self._amp = await get_async_amp_controller(
-                self._series,
-                self._port,
-                self.hass.loop,
-            )
+            device_config = await async_load_device_config(self.hass)
+            self._async_set_index(get_series_index(self._series, device_config))
 
-            if self._amp is None:
-                LOG.error('Failed to create amp controller for %s', self._port)
-                return False
+            LOG.debug('Connecting to Anthem %s at %s', self._series, self._port)
+            if self._pipelined or self._push or is_network_port(self._port):
+                # pipelining and push updates need the native client, which
+                # matches responses by zone and reads the serial stream
+                # continuously; it also keeps network ports on one TCP socket
+                serial_config = device_config[self._series].get('rs232_defaults', {})
+                self._amp = await async_open_client(self._port, dict(serial_config))
+            else:
+                self._amp = await get_async_amp_controller(
+                    self._series,
+                    self._port,
+                    self.hass.loop,
+                )
 
-            self._connected = True
-            LOG.info('Connected to Anthem %s at %s', self._series, self._port)
-            return True
+            if self._amp is None:
+                raise ConnectionError('Failed to create amp controller')
 
-        except Exception:
-            LOG.exception('Error connecting to Anthem at %s', self._port)
+        except Exception as err:
+            self._metrics.record('connect', (time.perf_counter() - start) * 1000, err)
             self._connected = False
+            await self._async_record_connect_failure(err)
+            return False
+
+        self._metrics.record('connect', (time.perf_counter() - start) * 1000)
+        self._connected = True
+        self._reconnect.record_success()
+        self._port_present = None
+        if isinstance(self._amp, AnthemGen1Client):
+            # a dropped link (e.g. a network bridge restarting) is reopened on
+            # the next poll; the coordinator and its entities stay in place
+            self._unsub_link_lost = self._amp.add_disconnect_listener(
+                self._async_handle_link_lost
+            )
+        if self._push:
+            self._async_start_push()
+        # the receiver may have been retuned or power cycled while unreachable
+        await self._async_read_tuner()
+        LOG.info('Connected to Anthem %s at %s', self._series, self._port)
+        return True
+
+    @callback
+    def _async_set_index(self, index: SeriesIndex) -> None:
+        """Switch to the index built from the loaded device configuration."""
+        if index is self._index:
+            return
+        self._index = index
+        self._zones = self._enabled_zones(self.discovered_zones or index.zones)
+        LOG.debug('Loaded config for %s: sources=%s', self._series, self.sources)
+
+    async def _async_record_connect_failure(self, err: Exception) -> None:
+        """Schedule the next attempt, logging only the first of a run of failures."""
+        self._reconnect.record_failure(time.monotonic(), str(err))
+        self._port_present = await self._async_port_exists()
+        # a failed connect never reaches async_set_updated_data, so push the
+        # new failure count to the link sensors here
+        self.async_update_listeners()
+
+        failures = self._reconnect.consecutive_failures
+        retry_in = self._reconnect.retry_in(time.monotonic())
+        if failures == 1:
+            LOG.warning('Error connecting to Anthem at %s: %s', self._port, err)
+        elif self._reconnect.state is ConnectionState.OPEN_CIRCUIT:
+            LOG.warning(
+                'Anthem at %s unreachable after %s attempts, retrying in %.0f s',
+                self._port,
+                failures,
+                retry_in,
+            )
+        else:
+            LOG.debug(
+                'Error connecting to Anthem at %s (attempt %s, retrying in %.1f s): %s',
+                self._port,
+                failures,
+                retry_in,
+                err,
+            )
+
+    async def _async_port_exists(self) -> bool | None:
+        """Return whether a local port path exists, or None for URL ports."""
+        if '://' in self._port:
+            return None
+        return await self.hass.async_add_executor_job(os.path.exists, self._port)
+
+    async def _async_port_reappeared(self) -> bool:
+        """Return whether a port that was missing at the last failure is back."""
+        if self._port_present is not False:
             return False
+        self._port_present = await self._async_port_exists()
+        return bool(self._port_present)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Record which zones changed since the last notification, then notify."""
+        data = self.data or {}
+        if self.last_update_success != self._notified_success:
+            # availability changed, so every entity has to write its state
+            self._changed_zones = set(self._zones) | set(data)
+        else:
+            self._changed_zones = {
+                zone
+                for zone in set(data) | set(self._notified_data)
+                if data.get(zone) != self._notified_data.get(zone)
+            }
+        self._changed_zones |= self._touched_zones
+        self._touched_zones = set()
+        self._notified_data = {zone: dict(status) for zone, status in data.items()}
+        self._notified_success = self.last_update_success
+        self._async_sample_traffic()
+        super().async_update_listeners()
+
+    @callback
+    def _async_sample_traffic(self) -> None:
+        """Record the bytes moved over the link so far, for the traffic rate."""
+        if not isinstance(self._amp, AnthemGen1Client):
+            return
+        now = time.monotonic()
+        total = self._amp.bytes_sent + self._amp.bytes_received
+        if self._traffic and total < self._traffic[-1][1]:
+            # a new client after a reconnect counts from zero again
+            self._traffic.clear()
+        self._traffic.append((now, total))
+        while (
+            len(self._traffic) > 2 and now - self._traffic[0][0] > TRAFFIC_RATE_WINDOW
+        ):
+            self._traffic.popleft()
+
+    @callback
+    def zone_changed(self, zone: int) -> bool:
+        """Return whether a zone changed in the update being notified."""
+        return zone in self._changed_zones
+
+    @callback
+    def async_record_state_write(self, written: bool) -> None:
+        """Count an entity state write, or one skipped as unchanged."""
+        if written:
+            self._state_writes += 1
+        else:
+            self._state_writes_skipped += 1
+
+    @callback
+    def _async_start_push(self) -> None:
+        """Listen for unsolicited status and drop polling to a safety sweep."""
+        self._async_stop_push()
+        self._unsub_push = [self._amp.add_listener(self._async_handle_push_update)]
+        self.update_interval = timedelta(seconds=PUSH_SAFETY_SCAN_INTERVAL)
+
+    @callback
+    def _async_stop_push(self) -> None:
+        """Stop listening for unsolicited status."""
+        for unsub in self._unsub_push:
+            unsub()
+        self._unsub_push = []
+
+    @callback
+    def _async_handle_push_update(self, zone: int, status: dict[str, Any]) -> None:
+        """Merge a status line transmitted by the amp into the zone data."""
+        if zone == TUNER_ZONE:
+            self._async_set_tuned((status['band'], status['frequency']))
+            self.async_update_listeners()
+            return
+        if zone not in self._zones:
+            return
+
+        zone_data = dict(self._device_data)
+        if status.get('power') is False:
+            # an off zone reports nothing else, so drop any stale settings
+            zone_data[zone] = status
+        else:
+            zone_data[zone] = {**zone_data.get(zone, {}), **status}
+
+        LOG.debug('Push update for zone %s: %s', zone, status)
+        self._device_data = zone_data
+        self.async_set_updated_data(self._async_reconcile())
+
+        if status.get('power') is True and 'source' not in zone_data[zone]:
+            # a zone turned on only reports its power; read the rest now rather
+            # than at the next safety sweep
+            self.hass.async_create_task(self.async_refresh_zone(zone))
+
+    @callback
+    def _async_handle_link_lost(self) -> None:
+        """Reconnect on the next poll, polling regularly until push resumes."""
+        LOG.warning('Lost connection to Anthem at %s', self._port)
+        self._unsub_link_lost = None
+        self._async_stop_push()
+        self._connected = False
+        self._reconnect.record_disconnect()
+        self.update_interval = self._scan_interval
+        self.hass.async_create_task(self.async_request_refresh())
 
     async def async_disconnect(self) -> None:
         """Disconnect from the Anthem device."""
+        self._async_stop_push()
+        if self._unsub_link_lost is not None:
+            self._unsub_link_lost()
+            self._unsub_link_lost = None
+        for zone in list(self._expected):
+            self._async_clear_expected(zone)
+        for zone in list(self._ramps):
+            self._async_cancel_ramp(zone)
         if self._amp is not None:
             try:
                 # the anthemav_serial library may have a close method
@@ -138,19 +585,94 @@ class AnthemAVSerialCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]
             finally:
                 self._amp = None
                 self._connected = False
+                self._reconnect.record_disconnect()
 
     async def _async_update_data(self) -> dict[int, dict[str, Any]]:
         """Fetch data from the Anthem device."""
+        with self._metrics.measure('refresh'):
+            return await self._async_poll()
+
+    async def _async_poll(self) -> dict[int, dict[str, Any]]:
+        """Connect if needed and read every enabled zone."""
         if not self._connected:
             if not await self.async_connect():
-                raise UpdateFailed('Failed to connect to Anthem device')
+                raise UpdateFailed(
+                    f'Failed to connect to Anthem device ({self._reconnect.state})'
+                )
+
+        if not self._zones_probed and self.discovered_zones is None:
+            await self._async_discover_zones()
 
+        # zones being ramped are written to continuously; read them at the end
+        zones = [zone for zone in self._zones if zone not in self._ramps]
+        generation = dict(self._refresh_generation)
+        if self._pipelined:
+            zone_data = await self._async_fetch_zones_pipelined(zones)
+        else:
+            zone_data = await self._async_fetch_zones_sequential(zones)
+        for zone_id in self._ramps:
+            if zone_id in self._device_data:
+                zone_data[zone_id] = self._device_data[zone_id]
+
+        for zone_id, current in self._refresh_generation.items():
+            if current != generation.get(zone_id) and zone_id in self._device_data:
+                zone_data[zone_id] = self._device_data[zone_id]
+
+        LOG.debug('Updated zone data: %s', zone_data)
+        self._reconnect.record_poll(all(zone_data.get(z) for z in self._zones))
+        self._device_data = zone_data
+        self._async_adapt_interval()
+        return self._async_reconcile()
+
+    @callback
+    def _async_adapt_interval(self) -> None:
+        """Choose the interval until the next poll from zone power and activity."""
+        if not self._adaptive or self._unsub_push:
+            return
+
+        if (
+            self._last_activity is not None
+            and time.monotonic() - self._last_activity < ADAPTIVE_ACTIVITY_WINDOW
+        ):
+            interval = self._min_interval
+        elif any(zone.get('power') for zone in self._device_data.values()):
+            interval = self._scan_interval
+        else:
+            current = self.update_interval or self._scan_interval
+            interval = max(current, self._scan_interval) * ADAPTIVE_BACKOFF_FACTOR
+
+        interval = max(self._min_interval, min(interval, self._max_interval))
+        if interval != self.update_interval:
+            LOG.debug('Polling %s every %s', self._port, interval)
+            self.update_interval = interval
+
+    @callback
+    def _async_note_activity(self, *zones: int) -> None:
+        """Switch to fast polling after a user command, ending ramps it overrides."""
+        for zone in zones:
+            self._async_cancel_ramp(zone)
+        self._last_activity = time.monotonic()
+        if self._adaptive and not self._unsub_push:
+            # takes effect when the command's zone refresh reschedules the poll
+            self.update_interval = self._min_interval
+
+    async def _async_fetch_zones_sequential(
+        self, zones: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """Query each zone in turn, waiting for every reply.
+
+        A zone that is off answers the status query with a short off line, so
+        zones in standby cost no more than a power query would.
+        """
         zone_data: dict[int, dict[str, Any]] = {}
 
-        for zone_id in self._zones:
+        for zone_id in zones:
             try:
                 if self._amp is not None:
-                    status = await self._amp.zone_status(zone_id)
+                    # yield the link between zones so commands are not delayed
+                    async with self._scheduler.slot(Priority.POLL):
+                        with self._metrics.measure(f'zone_status_{zone_id}'):
+                            status = await self._amp.zone_status(zone_id)
                     if status:
                         zone_data[zone_id] = status
                     else:
@@ -159,71 +681,805 @@ class AnthemAVSerialCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]
                 LOG.exception('Error fetching status for zone %s', zone_id)
                 zone_data[zone_id] = {}
 
-        LOG.debug('Updated zone data: %s', zone_data)
         return zone_data
 
+    async def _async_query_power(self, zone: int) -> dict[str, Any]:
+        """Send a power query for a zone and return the decoded reply."""
+        if isinstance(self._amp, AnthemGen1Client):
+            return await self._amp.power_status(zone)
+
+        response = await self._amp.send_command(
+            'power_status', {'zone': zone}, wait_for_reply=True
+        )
+        decoded = decode_status_line(response) if isinstance(response, str) else None
+        return decoded[1] if decoded and decoded[0] == zone else {}
+
+    async def _async_discover_zones(self) -> list[int]:
+        """Probe which zones answer a power query and cache them in the entry.
+
+        If no zone answers (e.g. the receiver cannot reply yet), all zones are
+        kept and the probe is retried on the next start.
+        """
+        self._zones_probed = True
+        found: list[int] = []
+        for zone in self._index.zones:
+            try:
+                async with self._scheduler.slot(Priority.POLL):
+                    status = await self._async_query_power(zone)
+            except Exception as err:
+                LOG.debug('Zone %s did not answer the probe: %s', zone, err)
+                continue
+            if 'power' in status:
+                found.append(zone)
+
+        if not found:
+            LOG.warning('No zone answered at %s, polling all zones', self._port)
+            return self._zones
+
+        LOG.info('Discovered zones %s on Anthem at %s', found, self._port)
+        self._zones = self._enabled_zones(found)
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={
+                **self.config_entry.data,
+                CONF_DISCOVERED_ZONES: {self._discovery_key: found},
+            },
+        )
+        return found
+
+    async def async_rediscover_zones(self) -> list[int]:
+        """Probe the zones again, e.g. after the receiver was rewired.
+
+        A changed result updates the config entry, which reloads it so the
+        entities match the zones found.
+        """
+        if not await self.async_connect():
+            raise HomeAssistantError(f'Cannot probe zones: {self._port} unreachable')
+        return await self._async_discover_zones()
+
+    async def _async_fetch_zones_pipelined(
+        self, zones: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """Write all zone queries back-to-back and collect replies as they arrive."""
+        zone_data: dict[int, dict[str, Any]] = {}
+        if self._amp is None or not zones:
+            return zone_data
+
+        async with self._scheduler.slot(Priority.POLL):
+            start = time.perf_counter()
+            results = await self._amp.zone_status_many(zones)
+            self._async_record_burst(
+                dict.fromkeys(zones, 'zone_status'), results, start
+            )
+
+        for zone_id, result in results.items():
+            if isinstance(result, Exception):
+                LOG.warning('Error fetching status for zone %s: %s', zone_id, result)
+                zone_data[zone_id] = {}
+            else:
+                zone_data[zone_id] = result or {}
+
+        # a lost link fails every zone; reconnect on the next poll
+        if not self._amp.is_connected:
+            self._connected = False
+            self._reconnect.record_disconnect()
+
+        return zone_data
+
+    @callback
+    def _async_record_burst(
+        self,
+        queries: Mapping[int, str],
+        results: Mapping[int, dict[str, Any] | Exception],
+        start: float,
+    ) -> None:
+        """Record a pipelined burst as one query per zone lasting the burst."""
+        duration = (time.perf_counter() - start) * 1000
+        for zone_id, query in queries.items():
+            result = results.get(zone_id)
+            self._metrics.record(
+                f'{query}_{zone_id}',
+                duration,
+                result if isinstance(result, Exception) else None,
+            )
+
+    async def async_refresh_zone(self, zone: int) -> None:
+        """Re-read a single zone and merge it into the coordinator data."""
+        await self.async_refresh_zones([zone])
+
+    async def async_refresh_zones(self, zones: Iterable[int]) -> None:
+        """Re-read some zones and merge them into the coordinator data at once.
+
+        The native client reads them in one pipelined burst.
+        """
+        zones = list(zones)
+        if self._amp is None or not zones:
+            return
+
+        results: dict[int, dict[str, Any] | Exception] = {}
+        async with self._scheduler.slot(Priority.REFRESH):
+            if isinstance(self._amp, AnthemGen1Client):
+                start = time.perf_counter()
+                results = await self._amp.zone_status_many(zones)
+                self._async_record_burst(
+                    dict.fromkeys(zones, 'zone_status'), results, start
+                )
+            else:
+                for zone in zones:
+                    try:
+                        with self._metrics.measure(f'zone_status_{zone}'):
+                            results[zone] = await self._amp.zone_status(zone)
+                    except Exception as err:
+                        results[zone] = err
+
+        statuses: dict[int, dict[str, Any]] = {}
+        for zone, result in results.items():
+            if isinstance(result, Exception):
+                LOG.warning('Error fetching status for zone %s: %s', zone, result)
+                continue
+            self._refresh_generation[zone] = self._refresh_generation.get(zone, 0) + 1
+            statuses[zone] = result or {}
+
+        if statuses:
+            self._device_data = {**self._device_data, **statuses}
+            self.async_set_updated_data(self._async_reconcile())
+
+    @callback
+    def _async_reconcile(self) -> dict[int, dict[str, Any]]:
+        """Return device data with unconfirmed optimistic values laid over it.
+
+        An expected value that the device reports is confirmed and dropped. One
+        that still differs is kept until its deadline, after which the device
+        value wins and the optimistic change is rolled back.
+        """
+        zone_data = dict(self._device_data)
+        now = time.monotonic()
+
+        for zone, expected in list(self._expected.items()):
+            device = zone_data.get(zone, {})
+            overlay: dict[str, Any] = {}
+            for key, (value, deadline) in list(expected.items()):
+                if _values_match(device.get(key), value):
+                    del expected[key]
+                elif now < deadline:
+                    overlay[key] = value
+                else:
+                    LOG.debug(
+                        'Rolling back optimistic %s=%s for zone %s (device: %s)',
+                        key,
+                        value,
+                        zone,
+                        device.get(key),
+                    )
+                    del expected[key]
+
+            if overlay:
+                zone_data[zone] = {**device, **overlay}
+            if not expected:
+                self._async_clear_expected(zone)
+
+        return zone_data
+
+    @callback
+    def _async_apply_optimistic(self, zone: int, changes: dict[str, Any]) -> None:
+        """Show the expected effect of a command before the device confirms it."""
+        if not self._optimistic:
+            return
+
+        deadline = time.monotonic() + self._reconcile_timeout
+        expected = self._expected.setdefault(zone, {})
+        for key, value in changes.items():
+            expected[key] = (value, deadline)
+
+        # re-read the zone at the deadline so a change is never shown for longer
+        if unsub := self._unsub_reconcile.pop(zone, None):
+            unsub()
+        self._unsub_reconcile[zone] = async_call_later(
+            self.hass,
+            self._reconcile_timeout,
+            partial(self._async_reconcile_expired, zone),
+        )
+        self.async_set_updated_data(self._async_reconcile())
+
+    @callback
+    def _async_rollback_optimistic(self, zone: int) -> None:
+        """Drop optimistic values for a zone after a command failed."""
+        if zone not in self._expected:
+            return
+        self._async_clear_expected(zone)
+        self.async_set_updated_data(self._async_reconcile())
+
+    @callback
+    def _async_clear_expected(self, zone: int) -> None:
+        """Forget the expected values for a zone and cancel its timer."""
+        self._expected.pop(zone, None)
+        if unsub := self._unsub_reconcile.pop(zone, None):
+            unsub()
+
+    @callback
+    def _async_reconcile_expired(self, zone: int, _now: Any) -> None:
+        """Read the device once the reconciliation timeout has passed."""
+        self._unsub_reconcile.pop(zone, None)
+        if zone in self._expected:
+            self.hass.async_create_task(self.async_refresh_zone(zone))
+
     async def async_set_power(self, zone: int, power: bool) -> None:
         """Set power state for a zone."""
         if self._amp is None:
             LOG.warning('Cannot set power: not connected')
             return
+        self._async_note_activity(zone)
+        self._async_apply_optimistic(zone, {'power': power})
         try:
-            await self._amp.set_power(zone, power)
-            await self.async_request_refresh()
+            async with self._scheduler.slot(Priority.COMMAND):
+                with self._metrics.measure('set_power'):
+                    await self._amp.set_power(zone, power)
+            await self.async_refresh_zone(zone)
         except Exception:
+            self._async_rollback_optimistic(zone)
             LOG.exception('Error setting power for zone %s', zone)
 
     async def async_set_volume(self, zone: int, volume: float) -> None:
-        """Set volume level for a zone."""
+        """Set volume level for a zone.
+
+        Calls made while an earlier volume command is still in flight are
+        superseded by the newest level, for a group leader as for a zone alone.
+        """
         if self._amp is None:
             LOG.warning('Cannot set volume: not connected')
             return
-        try:
-            await self._amp.set_volume(zone, volume)
-            await self.async_request_refresh()
-        except Exception:
-            LOG.exception('Error setting volume for zone %s', zone)
+        self._async_note_activity(zone)
+        self._pending_volume[zone] = volume
+        self._pending_steps.pop(zone, None)
+        self._async_apply_optimistic(zone, {'volume': volume})
+        await self._async_flush_volume(zone)
 
     async def async_volume_up(self, zone: int) -> None:
         """Increase volume for a zone."""
         if self._amp is None:
             LOG.warning('Cannot increase volume: not connected')
             return
-        try:
-            await self._amp.volume_up(zone)
-            await self.async_request_refresh()
-        except Exception:
-            LOG.exception('Error increasing volume for zone %s', zone)
+        self._async_note_activity(zone)
+        self._pending_steps[zone] = self._pending_steps.get(zone, 0) + 1
+        await self._async_flush_volume(zone)
 
     async def async_volume_down(self, zone: int) -> None:
         """Decrease volume for a zone."""
         if self._amp is None:
             LOG.warning('Cannot decrease volume: not connected')
             return
-        try:
-            await self._amp.volume_down(zone)
-            await self.async_request_refresh()
-        except Exception:
-            LOG.exception('Error decreasing volume for zone %s', zone)
+        self._async_note_activity(zone)
+        self._pending_steps[zone] = self._pending_steps.get(zone, 0) - 1
+        await self._async_flush_volume(zone)
+
+    async def _async_flush_volume(self, zone: int) -> None:
+        """Send the coalesced volume change for a zone.
+
+        Only one volume command per zone is in flight at a time. Callers that
+        queue up behind it find their change already folded into the next
+        send, or already sent, and return without touching the link. The
+        change of a group leader is sent to its whole group.
+        """
+        lock = self._volume_locks.setdefault(zone, asyncio.Lock())
+        async with lock:
+            volume = self._pending_volume.pop(zone, None)
+            steps = self._pending_steps.pop(zone, 0)
+            if volume is None and steps == 0:
+                return
+            if self._groups.get(zone):
+                await self._async_fan_out_volume(zone, volume, steps)
+                return
+
+            try:
+                async with self._scheduler.slot(Priority.COMMAND):
+                    with self._metrics.measure('set_volume'):
+                        await self._async_send_volume(zone, volume, steps)
+                await self.async_refresh_zone(zone)
+            except Exception:
+                self._async_rollback_optimistic(zone)
+                LOG.exception('Error changing volume for zone %s', zone)
+
+    async def _async_send_volume(
+        self, zone: int, volume: float | None, steps: int
+    ) -> None:
+        """Send an absolute level with any steps queued after it folded in.
+
+        Steps queued without a level are netted onto the zone's last read
+        volume, see _async_send_steps.
+        """
+        if volume is None:
+            await self._async_send_steps(zone, steps)
+            return
+
+        if steps:
+            volume = self._clamp_volume(volume + steps * VOLUME_STEP)
+            self._async_apply_optimistic(zone, {'volume': volume})
+
+        await self._amp.set_volume(zone, volume)
+
+    async def _async_send_steps(self, zone: int, steps: int) -> None:
+        """Send up/down steps, dropping up steps that would pass the volume limit.
+
+        With the zone's volume known the net steps go out as one absolute
+        level; only a zone not read yet is sent one up/down command per step.
+        """
+        current = self._device_data.get(zone, {}).get('volume')
+        if current is None:
+            command = self._amp.volume_up if steps > 0 else self._amp.volume_down
+            for _ in range(abs(steps)):
+                await command(zone)
+            return
+
+        if steps > 0:
+            # tolerate float error for a zone sitting exactly at the limit
+            headroom = math.floor((self._max_volume - current) / VOLUME_STEP + 1e-6)
+            if headroom < steps:
+                LOG.debug('Zone %s limited to max volume %s', zone, self._max_volume)
+                steps = max(0, headroom)
+        volume = max(0.0, current + steps * VOLUME_STEP)
+        if steps and volume != current:
+            await self._amp.set_volume(zone, volume)
 
     async def async_set_mute(self, zone: int, mute: bool) -> None:
         """Set mute state for a zone."""
         if self._amp is None:
             LOG.warning('Cannot set mute: not connected')
             return
+        if self._groups.get(zone):
+            await self._async_fan_out(zone, 'mute', mute)
+            return
+        self._async_note_activity(zone)
+        self._async_apply_optimistic(zone, {'mute': mute})
         try:
-            await self._amp.set_mute(zone, mute)
-            await self.async_request_refresh()
+            async with self._scheduler.slot(Priority.COMMAND):
+                with self._metrics.measure('set_mute'):
+                    await self._amp.set_mute(zone, mute)
+            await self.async_refresh_zone(zone)
         except Exception:
+            self._async_rollback_optimistic(zone)
             LOG.exception('Error setting mute for zone %s', zone)
 
-    async def async_set_source(self, zone: int, source_id: int) -> None:
+    async def async_set_source(self, zone: int, source_id: int | str) -> None:
         """Set input source for a zone."""
         if self._amp is None:
             LOG.warning('Cannot set source: not connected')
             return
+        if self._groups.get(zone):
+            await self._async_fan_out(zone, 'source', source_id)
+            return
+        self._async_note_activity(zone)
+        self._async_apply_optimistic(zone, {'source': source_id})
         try:
-            await self._amp.set_source(zone, source_id)
-            await self.async_request_refresh()
+            async with self._scheduler.slot(Priority.COMMAND):
+                with self._metrics.measure('set_source'):
+                    await self._amp.set_source(zone, source_id)
+            await self.async_refresh_zone(zone)
         except Exception:
+            self._async_rollback_optimistic(zone)
             LOG.exception('Error setting source for zone %s', zone)
+
+    async def async_select_preset(self, zone: int, name: str) -> None:
+        """Switch a zone to the tuner input and tune it to a preset.
+
+        The tuner is only tuned when its station differs, and the source only
+        changes for zones not already on the tuner, so selecting the preset
+        that is playing sends no command. Without push updates the tuner is
+        read first, in case it was retuned.
+        """
+        if self._amp is None:
+            LOG.warning('Cannot select preset: not connected')
+            return
+        preset = self.presets.get(name)
+        if preset is None:
+            raise HomeAssistantError(f'Unknown tuner preset: {name}')
+        tuner = self._index.tuner_source
+
+        station = (preset.band, preset.frequency)
+        if station == self._tuned and not self._push:
+            # the tuner may have been retuned from the front panel or remote;
+            # with push updates the amp already reported any retune
+            await self._async_read_tuner()
+        if station != self._tuned:
+            self._async_note_activity()
+            try:
+                async with self._scheduler.slot(Priority.COMMAND):
+                    with self._metrics.measure('tune'):
+                        await self._amp.send_command(
+                            preset.command, {'channel': preset.channel}
+                        )
+            except Exception:
+                LOG.exception('Error tuning to preset %s', name)
+                return
+            self._async_set_tuned(station)
+
+        zones = self.group(zone) or [zone]
+        data = self.data or {}
+        if all(data.get(member, {}).get('source') == tuner for member in zones):
+            self.async_update_listeners()
+            return
+        await self.async_set_source(zone, tuner)
+
+    async def _async_read_tuner(self) -> None:
+        """Read the station the tuner is on, if presets are configured.
+
+        A tuner that does not answer is treated as tuned to an unknown station.
+        """
+        if not self.presets or self._amp is None:
+            return
+        station: tuple[str, float] | None = None
+        try:
+            async with self._scheduler.slot(Priority.REFRESH):
+                with self._metrics.measure('tuner_status'):
+                    status = await self._async_query_tuner()
+        except Exception as err:
+            LOG.debug('Tuner did not answer a status query: %s', err)
+        else:
+            if 'band' in status:
+                station = (status['band'], status['frequency'])
+        self._async_set_tuned(station)
+
+    async def _async_query_tuner(self) -> dict[str, Any]:
+        """Send a tuner status query and return the decoded reply."""
+        if isinstance(self._amp, AnthemGen1Client):
+            return await self._amp.tuner_status()
+
+        # 'tuner_frequeny' is the command's name in anthemav_serial
+        response = await self._amp.send_command(
+            'tuner_frequeny', {}, wait_for_reply=True
+        )
+        decoded = decode_status_line(response) if isinstance(response, str) else None
+        return decoded[1] if decoded and decoded[0] == TUNER_ZONE else {}
+
+    @callback
+    def _async_set_tuned(self, station: tuple[str, float] | None) -> None:
+        """Record the tuner station, rewriting the zones listening to it."""
+        if station == self._tuned:
+            return
+        self._tuned = station
+        tuner = self._index.tuner_source
+        self._touched_zones.update(
+            zone
+            for zone, status in (self.data or {}).items()
+            if status.get('source') == tuner
+        )
+
+    async def async_batch(self, operations: Iterable[tuple[int, str, Any]]) -> None:
+        """Send settings for several zones in one burst, then read them once.
+
+        Operations are (zone, setting, value) tuples, setting being one of
+        ZONE_SETTINGS. Volume levels are held to the volume limit.
+        """
+        await self._async_send_batch(
+            (zone, setting, self._clamp_volume(value) if setting == 'volume' else value)
+            for zone, setting, value in operations
+        )
+
+    async def _async_send_batch(
+        self, operations: Iterable[tuple[int, str, Any]]
+    ) -> None:
+        """Send settings as given in one burst, then read every zone touched once.
+
+        Zones turned on are powered first and waited for; the other settings
+        are then written in the given order while holding the link.
+        """
+        operations = list(operations)
+        if not operations:
+            return
+        if self._amp is None:
+            raise HomeAssistantError(f'Cannot send commands: {self._port} offline')
+
+        changes: dict[int, dict[str, Any]] = {}
+        for zone, setting, value in operations:
+            changes.setdefault(zone, {})[setting] = value
+        powering = [
+            zone
+            for zone, zone_changes in changes.items()
+            if zone_changes.get('power') is True
+            and self._device_data.get(zone, {}).get('power') is not True
+        ]
+        await self._async_power_on(powering)
+        operations = [
+            (zone, setting, value)
+            for zone, setting, value in operations
+            if setting != 'power' or zone not in powering
+        ]
+        self._async_note_activity(*changes)
+        for zone, zone_changes in changes.items():
+            self._async_apply_optimistic(zone, zone_changes)
+
+        try:
+            async with self._scheduler.slot(Priority.COMMAND):
+                for zone, setting, value in operations:
+                    with self._metrics.measure(f'set_{setting}'):
+                        await getattr(self._amp, f'set_{setting}')(zone, value)
+        except Exception as err:
+            for zone in changes:
+                self._async_rollback_optimistic(zone)
+            raise HomeAssistantError(
+                f'Error sending commands to Anthem at {self._port}: {err}'
+            ) from err
+
+        await self.async_refresh_zones(changes)
+
+    async def _async_power_on(self, zones: Iterable[int]) -> None:
+        """Turn zones on and wait until each reports power on.
+
+        A zone that was off ignores other commands until it is ready, so its
+        power is polled until then, giving up after POWER_ON_TIMEOUT.
+        """
+        zones = list(zones)
+        if not zones:
+            return
+        if self._amp is None:
+            raise HomeAssistantError(f'Cannot send commands: {self._port} offline')
+
+        self._async_note_activity(*zones)
+        for zone in zones:
+            self._async_apply_optimistic(zone, {'power': True})
+        try:
+            async with self._scheduler.slot(Priority.COMMAND):
+                for zone in zones:
+                    with self._metrics.measure('set_power'):
+                        await self._amp.set_power(zone, True)
+        except Exception as err:
+            for zone in zones:
+                self._async_rollback_optimistic(zone)
+            raise HomeAssistantError(
+                f'Error sending commands to Anthem at {self._port}: {err}'
+            ) from err
+
+        pending = set(zones)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + POWER_ON_TIMEOUT
+        while True:
+            for zone in sorted(pending):
+                try:
+                    async with self._scheduler.slot(Priority.COMMAND):
+                        with self._metrics.measure(f'power_status_{zone}'):
+                            status = await self._async_query_power(zone)
+                except Exception as err:
+                    LOG.debug('Zone %s did not answer a power query: %s', zone, err)
+                    continue
+                if status.get('power') is True:
+                    pending.discard(zone)
+            if not pending:
+                return
+            if loop.time() >= deadline:
+                LOG.warning(
+                    'Zones %s did not turn on at %s', sorted(pending), self._port
+                )
+                return
+            await asyncio.sleep(POWER_ON_POLL_INTERVAL)
+
+    def group(self, zone: int) -> list[int]:
+        """Return the zones grouped with a zone, leader first, or [] if ungrouped."""
+        for leader, members in self._groups.items():
+            if zone == leader or zone in members:
+                return [leader, *members]
+        return []
+
+    async def async_join(self, leader: int, members: Iterable[int]) -> None:
+        """Make zones follow the source, volume and mute of a leader zone.
+
+        Members leave any group they were in; a member that led a group
+        dissolves it. If the leader is on, the members are turned on and
+        brought to its current settings in one batch.
+        """
+        members = [zone for zone in members if zone != leader]
+        self._async_leave_group(leader)
+        for zone in members:
+            self._async_leave_group(zone)
+            for follower in self._groups.pop(zone, []):
+                self._touched_zones.add(follower)
+
+        group = self._groups.setdefault(leader, [])
+        group.extend(zone for zone in members if zone not in group)
+        if not group:
+            del self._groups[leader]
+        self._touched_zones.update([leader, *members])
+        self.async_update_listeners()
+
+        data = self.data or {}
+        current = data.get(leader, {})
+        if current.get('power') is True:
+            await self._async_send_batch(
+                (zone, setting, current[setting])
+                for zone in members
+                for setting in ZONE_SETTINGS
+                if setting in current
+                and (setting != 'power' or data.get(zone, {}).get('power') is not True)
+            )
+
+    @callback
+    def async_unjoin(self, zone: int) -> None:
+        """Remove a zone from its group, dissolving the group of a leader."""
+        if zone in self._groups:
+            self._touched_zones.update([zone, *self._groups.pop(zone)])
+        else:
+            self._async_leave_group(zone)
+        self.async_update_listeners()
+
+    @callback
+    def _async_leave_group(self, zone: int) -> None:
+        """Drop a zone from the group it follows, if any."""
+        for leader, members in list(self._groups.items()):
+            if zone not in members:
+                continue
+            members.remove(zone)
+            self._touched_zones.update([leader, zone, *members])
+            if not members:
+                del self._groups[leader]
+
+    async def _async_fan_out(self, leader: int, setting: str, value: Any) -> None:
+        """Apply a leader's setting to its whole group as one batch."""
+        try:
+            await self.async_batch(
+                (zone, setting, value) for zone in [leader, *self._groups[leader]]
+            )
+        except HomeAssistantError:
+            LOG.exception('Error setting %s for zone group %s', setting, leader)
+
+    async def _async_fan_out_volume(
+        self, leader: int, volume: float | None, steps: int
+    ) -> None:
+        """Send a leader's coalesced volume change to its whole group.
+
+        A level, with any steps queued after it folded in, goes out as one
+        batch. Steps alone move each zone from its own volume, up steps
+        stopping at the volume limit.
+        """
+        if volume is not None:
+            await self._async_fan_out(leader, 'volume', volume + steps * VOLUME_STEP)
+            return
+
+        zones = [leader, *self._groups[leader]]
+        self._async_note_activity(*zones)
+        try:
+            async with self._scheduler.slot(Priority.COMMAND):
+                for zone in zones:
+                    with self._metrics.measure('set_volume'):
+                        await self._async_send_steps(zone, steps)
+        except Exception:
+            LOG.exception('Error stepping volume for zone group %s', leader)
+            return
+        await self.async_refresh_zones(zones)
+
+    async def async_ramp_volume(
+        self, zone: int, volume: float, duration: float, curve: str = 'linear'
+    ) -> None:
+        """Start fading a zone's volume to a level over a duration.
+
+        Returns once the ramp is scheduled. Levels are sent at a steady rate
+        along the curve, without reading the zone in between; the zone is read
+        once the ramp ends. Any other command for the zone, or a new ramp,
+        cancels the ramp where it is.
+        """
+        if self._amp is None:
+            raise HomeAssistantError(f'Cannot ramp volume: {self._port} offline')
+        start = self._device_data.get(zone, {}).get('volume')
+        if start is None:
+            raise HomeAssistantError(f'Volume of zone {zone} is not known yet')
+
+        self._async_cancel_ramp(zone)
+        task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_run_ramp(
+                zone, start, self._clamp_volume(volume), duration, RAMP_CURVES[curve]
+            ),
+            name=f'{DOMAIN} volume ramp {self._port} zone {zone}',
+        )
+        self._ramps[zone] = task
+
+    async def _async_run_ramp(
+        self,
+        zone: int,
+        start: float,
+        target: float,
+        duration: float,
+        curve: Callable[[float], float],
+    ) -> None:
+        """Send the levels of a volume ramp, then read the zone.
+
+        The amp only resolves 0.5 dB, so a level is sent only when it lands on
+        a different setting than the last one sent.
+        """
+        loop = asyncio.get_running_loop()
+        steps = max(1, math.ceil(duration / RAMP_STEP_INTERVAL))
+        interval = duration / steps
+        began = loop.time()
+        sent_db = volume_to_db(start)
+        try:
+            for step in range(1, steps + 1):
+                level = start + (target - start) * curve(step / steps)
+                if (db := volume_to_db(level)) != sent_db:
+                    async with self._scheduler.slot(Priority.COMMAND):
+                        with self._metrics.measure('set_volume'):
+                            await self._amp.set_volume(zone, level)
+                    sent_db = db
+                    self._device_data = {
+                        **self._device_data,
+                        zone: {**self._device_data.get(zone, {}), 'volume': level},
+                    }
+                    self.async_set_updated_data(self._async_reconcile())
+                if step < steps:
+                    # pace from the start so slow writes do not stretch the ramp
+                    await asyncio.sleep(max(0.0, began + step * interval - loop.time()))
+        except Exception:
+            LOG.exception('Error ramping volume for zone %s', zone)
+        finally:
+            if self._ramps.get(zone) is asyncio.current_task():
+                del self._ramps[zone]
+        await self.async_refresh_zone(zone)
+
+    @callback
+    def _async_cancel_ramp(self, zone: int) -> None:
+        """Stop a volume ramp of a zone, if one is running."""
+        if (task := self._ramps.pop(zone, None)) is not None:
+            LOG.debug('Cancelling volume ramp for zone %s', zone)
+            task.cancel()
+
+    def _clamp_volume(self, volume: float) -> float:
+        """Limit a volume level to the configured maximum."""
+        return max(0.0, min(volume, self._max_volume))
+
+    @callback
+    def async_take_snapshot(self) -> dict[int, dict[str, Any]]:
+        """Save the current settings of every zone, without querying the device."""
+        if not self.data:
+            raise HomeAssistantError(f'No state read from {self._port} to snapshot')
+        self._snapshot = {
+            zone: {key: status[key] for key in ZONE_SETTINGS if key in status}
+            for zone, status in self.data.items()
+            if 'power' in status
+        }
+        LOG.debug('Saved snapshot of %s: %s', self._port, self._snapshot)
+        return self._snapshot
+
+    async def async_restore_snapshot(self) -> None:
+        """Return every zone to the settings saved by the last snapshot.
+
+        Only settings that differ from the current state are sent, per zone in
+        the order power, source, volume, mute, as one batch. Saved volumes
+        were read from the device and are not held to the limit.
+        """
+        if self._snapshot is None:
+            raise HomeAssistantError(f'No snapshot of {self._port} to restore')
+
+        await self._async_send_batch(
+            (zone, setting, value)
+            for zone, saved in self._snapshot.items()
+            for setting, value in _restore_changes(
+                (self.data or {}).get(zone, {}), saved
+            ).items()
+        )
+
+
+def _values_match(actual: Any, expected: Any) -> bool:
+    """Compare a device value with an optimistic one."""
+    if isinstance(actual, int | float) and isinstance(expected, int | float):
+        return math.isclose(actual, expected, abs_tol=0.005)
+    return actual == expected
+
+
+def _restore_changes(current: dict[str, Any], saved: dict[str, Any]) -> dict[str, Any]:
+    """Return the settings to send to bring a zone back to saved ones, in order."""
+    if saved.get('power') is False:
+        return {'power': False} if current.get('power') is not False else {}
+
+    changes: dict[str, Any] = {}
+    if current.get('power') is not True:
+        # a zone that was off reports nothing else, so send every setting
+        changes['power'] = True
+        current = {}
+    for key in ZONE_SETTINGS[1:]:
+        if key in saved and not _values_match(current.get(key), saved[key]):
+            changes[key] = saved[key]
+    return changes
+
+
+# shapes of a volume ramp: fraction of the change applied at a fraction of time
+RAMP_CURVES: dict[str, Callable[[float], float]] = {
+    'linear': lambda progress: progress,
+    'ease_in': lambda progress: progress**2,
+    'ease_out': lambda progress: 1 - (1 - progress) ** 2,
+}
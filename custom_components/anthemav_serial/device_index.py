@@ -0,0 +1,83 @@
+"""Precomputed per-series index of the anthemav_serial device configuration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import re
+from types import MappingProxyType
+from typing import Any
+
+from .const import ALL_ZONES, CONF_SOURCES, CONF_ZONES
+from .protocol import decode_source
+
+# one index per series, shared by every config entry and entity
+_INDEXES: dict[str, SeriesIndex] = {}
+
+# source names of the receiver's built-in AM/FM tuner
+TUNER_SOURCE_PATTERN = re.compile(r'\b(?:tuner|fm|am)\b', re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesIndex:
+    """Immutable source and zone lookups for one receiver series."""
+
+    series: str
+    source_names: Mapping[int | str, str]
+    source_ids: Mapping[str, int | str]
+    source_list: tuple[str, ...]
+    zones: tuple[int, ...]
+    tuner_source: int | str | None = None
+
+    def source_name(self, source_id: int | str) -> str:
+        """Return the name of a source, or a generic one for unknown ids."""
+        return self.source_names.get(source_id) or f'Source {source_id}'
+
+    def source_id(self, name: str) -> int | str | None:
+        """Return the id of a source name, including generic 'Source N' names."""
+        if (source_id := self.source_ids.get(name)) is not None:
+            return source_id
+        prefix, _, source_id = name.partition(' ')
+        if prefix == 'Source' and source_id.isalnum():
+            return decode_source(source_id)
+        return None
+
+
+def build_series_index(series: str, series_config: Mapping[str, Any]) -> SeriesIndex:
+    """Normalize the device configuration of a series into a SeriesIndex.
+
+    Source ids are keyed like the amp reports them: numeric ids as int,
+    lettered ids (e.g. 'd' on the d2v) as str.
+    """
+    names: dict[int | str, str] = {}
+    for source_id, source_data in series_config.get(CONF_SOURCES, {}).items():
+        source_id = decode_source(str(source_id))
+        if isinstance(source_data, dict) and 'name' in source_data:
+            names[source_id] = source_data['name']
+        elif isinstance(source_data, str):
+            names[source_id] = source_data
+
+    return SeriesIndex(
+        series=series,
+        source_names=MappingProxyType(names),
+        source_ids=MappingProxyType({name: sid for sid, name in names.items()}),
+        source_list=tuple(names.values()),
+        zones=tuple(int(zone) for zone in series_config.get(CONF_ZONES, ALL_ZONES)),
+        tuner_source=next(
+            (sid for sid, name in names.items() if TUNER_SOURCE_PATTERN.search(name)),
+            None,
+        ),
+    )
+
+
+def get_series_index(series: str, device_config: Mapping[str, Any]) -> SeriesIndex:
+    """Return the shared index for a series, building it on first use."""
+    if (index := _INDEXES.get(series)) is None:
+        index = build_series_index(series, device_config.get(series, {}))
+        _INDEXES[series] = index
+    return index
+
+
+def clear_series_indexes() -> None:
+    """Forget all built indexes, e.g. after the device configuration changed."""
+    _INDEXES.clear()
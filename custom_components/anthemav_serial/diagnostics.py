@@ -9,11 +9,12 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_SERIAL_NUMBER, DOMAIN
+from .const import CONF_DISCOVERED_ZONES, CONF_SERIAL_NUMBER, DOMAIN
 from .coordinator import AnthemAVSerialCoordinator
 
-# keys to redact from diagnostics output
-REDACT_KEYS = {CONF_SERIAL_NUMBER, CONF_PORT}
+# keys to redact from diagnostics output; the discovered zones cache is keyed
+# by port, so it is reported through the coordinator instead
+REDACT_KEYS = {CONF_SERIAL_NUMBER, CONF_PORT, CONF_DISCOVERED_ZONES}
 
 
 async def async_get_config_entry_diagnostics(
@@ -34,14 +35,19 @@ async def async_get_config_entry_diagnostics(
         'coordinator': {
             'series': coordinator.series,
             'is_connected': coordinator.is_connected,
+            'connection': coordinator.connection_stats,
             'zones': coordinator.zones,
-            'sources': coordinator.sources,
+            'discovered_zones': coordinator.discovered_zones,
+            'sources': dict(coordinator.sources),
             'last_update_success': coordinator.last_update_success,
             'update_interval': (
                 coordinator.update_interval.total_seconds()
                 if coordinator.update_interval
                 else None
             ),
+            'scheduler': coordinator.scheduler.stats(),
+            'metrics': coordinator.metrics.as_dict(),
+            'state_writes': coordinator.state_write_stats,
         },
         'zone_data': coordinator.data if coordinator.data else {},
     }
@@ -6,27 +6,47 @@ import logging
 from typing import Any
 
 from homeassistant.components.media_player import (
+    ATTR_INPUT_SOURCE,
+    ATTR_MEDIA_VOLUME_LEVEL,
+    ATTR_MEDIA_VOLUME_MUTED,
+    DOMAIN as MEDIA_PLAYER_DOMAIN,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_platform, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+import voluptuous as vol
 
 from .const import (
+    ATTR_CURVE,
+    ATTR_DURATION,
     CONF_MAX_VOLUME,
     CONF_SERIAL_NUMBER,
     CONF_SERIES,
     DEFAULT_MAX_VOLUME,
     DOMAIN,
+    SERVICE_RAMP_VOLUME,
 )
-from .coordinator import AnthemAVSerialCoordinator
+from .coordinator import RAMP_CURVES, AnthemAVSerialCoordinator
 
 LOG = logging.getLogger(__name__)
 
+RAMP_VOLUME_SCHEMA: dict[vol.Marker, Any] = {
+    vol.Required(ATTR_MEDIA_VOLUME_LEVEL): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=1)
+    ),
+    vol.Required(ATTR_DURATION): vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+    vol.Optional(ATTR_CURVE, default='linear'): vol.In(RAMP_CURVES),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -55,14 +75,32 @@ async def async_setup_entry(
         entities.append(entity)
         LOG.info('Adding Anthem %s zone %s (%s)', series, zone_id, zone_name)
 
+    # drop the entities of zones that were disabled or not found on the device
+    unique_ids = {entity.unique_id for entity in entities}
+    entity_registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        if (
+            registry_entry.domain == 'media_player'
+            and registry_entry.unique_id not in unique_ids
+        ):
+            LOG.info('Removing %s, zone no longer enabled', registry_entry.entity_id)
+            entity_registry.async_remove(registry_entry.entity_id)
+
     async_add_entities(entities)
+
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_RAMP_VOLUME, RAMP_VOLUME_SCHEMA, 'async_ramp_volume'
+    )
     LOG.info(
         'Anthem %s media player setup complete with %s zones', series, len(entities)
     )
 
 
 class AnthemAVSerialMediaPlayer(
-    CoordinatorEntity[AnthemAVSerialCoordinator], MediaPlayerEntity
+    CoordinatorEntity[AnthemAVSerialCoordinator], MediaPlayerEntity, RestoreEntity
 ):
     """Entity for controlling Anthem AV receiver zones."""
 
@@ -74,6 +112,7 @@ class AnthemAVSerialMediaPlayer(
         | MediaPlayerEntityFeature.VOLUME_MUTE
         | MediaPlayerEntityFeature.VOLUME_STEP
         | MediaPlayerEntityFeature.SELECT_SOURCE
+        | MediaPlayerEntityFeature.GROUPING
     )
 
     def __init__(
@@ -98,10 +137,30 @@ class AnthemAVSerialMediaPlayer(
         self._attr_unique_id = f'{DOMAIN}_{serial_number}_{zone_id}'
         self._attr_name = zone_name
 
-        # build source name to id mapping
-        self._source_name_to_id: dict[str, int] = {}
-        for source_id, source_name in coordinator.sources.items():
-            self._source_name_to_id[source_name] = source_id
+        # last saved state, shown until the coordinator has polled the device
+        self._restored_data: dict[str, Any] = {}
+        self._restored_source: str | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last known state while the device is being connected."""
+        await super().async_added_to_hass()
+        if self.coordinator.data is None:
+            await self._async_restore_last_state()
+
+    async def _async_restore_last_state(self) -> None:
+        """Load the zone state saved before the last shutdown."""
+        if (last_state := await self.async_get_last_state()) is None:
+            return
+
+        power = {STATE_ON: True, STATE_OFF: False}.get(last_state.state)
+        if power is not None:
+            self._restored_data['power'] = power
+        if (volume := last_state.attributes.get(ATTR_MEDIA_VOLUME_LEVEL)) is not None:
+            self._restored_data['volume'] = volume
+        if (mute := last_state.attributes.get(ATTR_MEDIA_VOLUME_MUTED)) is not None:
+            self._restored_data['mute'] = mute
+        # kept by name: the source index is not loaded before the first connect
+        self._restored_source = last_state.attributes.get(ATTR_INPUT_SOURCE)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -118,7 +177,7 @@ class AnthemAVSerialMediaPlayer(
     def _zone_data(self) -> dict[str, Any]:
         """Return current zone data from coordinator."""
         if self.coordinator.data is None:
-            return {}
+            return self._restored_data
         return self.coordinator.data.get(self._zone_id, {})
 
     @property
@@ -153,23 +212,68 @@ class AnthemAVSerialMediaPlayer(
     @property
     def source(self) -> str | None:
         """Return the current input source."""
+        if self.coordinator.data is None:
+            return self._restored_source
         source_id = self._zone_data.get('source')
         if source_id is None:
             return None
-
-        source_name = self.coordinator.sources.get(source_id)
-        if source_name is None:
-            # dynamically add source if not in configuration
-            source_name = f'Source {source_id}'
-            self.coordinator.sources[source_id] = source_name
-            self._source_name_to_id[source_name] = source_id
-
-        return source_name
+        if source_id == self.coordinator.index.tuner_source and (
+            preset := self.coordinator.active_preset
+        ):
+            return preset
+        return self.coordinator.index.source_name(source_id)
 
     @property
     def source_list(self) -> list[str]:
-        """Return all available input sources."""
-        return list(self._source_name_to_id.keys())
+        """Return all available input sources, followed by the tuner presets."""
+        return [*self.coordinator.index.source_list, *self.coordinator.presets]
+
+    @property
+    def group_members(self) -> list[str]:
+        """Return the entity ids of this zone's group, leader first."""
+        zone_entities = self._zone_entity_ids()
+        return [
+            zone_entities[zone_id]
+            for zone_id in self.coordinator.group(self._zone_id)
+            if zone_id in zone_entities
+        ]
+
+    def _zone_entity_ids(self) -> dict[int, str]:
+        """Return the entity id of each zone of this entity's receiver.
+
+        Looked up from the entities of this config entry, since receivers
+        that share the default serial number produce the same unique ids.
+        """
+        prefix = f'{DOMAIN}_{self._serial_number}_'
+        return {
+            int(entry.unique_id.removeprefix(prefix)): entry.entity_id
+            for entry in er.async_entries_for_config_entry(
+                er.async_get(self.hass), self.coordinator.config_entry.entry_id
+            )
+            if entry.domain == MEDIA_PLAYER_DOMAIN
+            and entry.unique_id.startswith(prefix)
+        }
+
+    async def async_join_players(self, group_members: list[str]) -> None:
+        """Make other zones of this receiver follow this zone."""
+        entity_zones = {
+            entity_id: zone_id for zone_id, entity_id in self._zone_entity_ids().items()
+        }
+        zones: list[int] = []
+        for entity_id in group_members:
+            if entity_id not in entity_zones:
+                raise ServiceValidationError(
+                    f'{entity_id} is not a zone of the same Anthem receiver'
+                )
+            zones.append(entity_zones[entity_id])
+
+        LOG.info('Grouping zones %s with %s', zones, self._zone_name)
+        await self.coordinator.async_join(self._zone_id, zones)
+
+    async def async_unjoin_player(self) -> None:
+        """Remove this zone from its group."""
+        LOG.info('Ungrouping %s (zone %s)', self._zone_name, self._zone_id)
+        self.coordinator.async_unjoin(self._zone_id)
 
     async def async_turn_on(self) -> None:
         """Turn on the zone."""
@@ -208,6 +312,20 @@ class AnthemAVSerialMediaPlayer(
         LOG.debug('Decreasing volume for %s (zone %s)', self._zone_name, self._zone_id)
         await self.coordinator.async_volume_down(self._zone_id)
 
+    async def async_ramp_volume(
+        self, volume_level: float, duration: float, curve: str
+    ) -> None:
+        """Fade the volume to a level over a duration."""
+        volume = min(volume_level, self._max_volume)
+        LOG.info(
+            'Ramping %s (zone %s) volume to %s over %s s',
+            self._zone_name,
+            self._zone_id,
+            volume,
+            duration,
+        )
+        await self.coordinator.async_ramp_volume(self._zone_id, volume, duration, curve)
+
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute or unmute the volume."""
         LOG.info(
@@ -216,8 +334,17 @@ class AnthemAVSerialMediaPlayer(
         await self.coordinator.async_set_mute(self._zone_id, mute)
 
     async def async_select_source(self, source: str) -> None:
-        """Select input source."""
-        source_id = self._source_name_to_id.get(source)
+        """Select input source, or a tuner preset."""
+        source_id = self.coordinator.index.source_id(source)
+        if source_id is None and source in self.coordinator.presets:
+            LOG.info(
+                'Selecting preset "%s" for %s (zone %s)',
+                source,
+                self._zone_name,
+                self._zone_id,
+            )
+            await self.coordinator.async_select_preset(self._zone_id, source)
+            return
         if source_id is None:
             LOG.warning(
                 'Source "%s" not found for %s (zone %s)',
@@ -238,5 +365,9 @@ class AnthemAVSerialMediaPlayer(
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Handle updated data from the coordinator, if this zone changed."""
+        if not self.coordinator.zone_changed(self._zone_id):
+            self.coordinator.async_record_state_write(False)
+            return
+        self.coordinator.async_record_state_write(True)
         self.async_write_ha_state()
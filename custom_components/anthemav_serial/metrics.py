@@ -0,0 +1,172 @@
+"""Latency histograms and outcome counters for operations on the amp link."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import math
+import time
+from typing import Any
+
+# upper bounds of the latency buckets in milliseconds; slower operations fall
+# into a final overflow bucket
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+)
+
+# command durations kept for the rolling percentile
+RECENT_SAMPLES = 100
+
+# operations that send a command to the amp
+COMMAND_OPERATIONS: tuple[str, ...] = (
+    'set_power',
+    'set_volume',
+    'set_mute',
+    'set_source',
+    'tune',
+)
+
+
+@dataclass(slots=True)
+class OperationStats:
+    """Latency histogram and outcome counters for one operation."""
+
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    success: int = 0
+    timeout: int = 0
+    error: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float | None = None
+    last_error: str | None = None
+    last_error_at: float | None = None
+
+    @property
+    def count(self) -> int:
+        """Return the number of recorded operations."""
+        return self.success + self.timeout + self.error
+
+    def record(self, duration_ms: float, error: BaseException | None) -> None:
+        """Record the duration and outcome of one operation."""
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.total_ms += duration_ms
+        self.last_ms = duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+        if error is None:
+            self.success += 1
+            return
+        if isinstance(error, TimeoutError):
+            self.timeout += 1
+        else:
+            self.error += 1
+        self.last_error = str(error) or type(error).__name__
+        self.last_error_at = time.time()
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket bound below which a fraction of durations fall.
+
+        Durations in the overflow bucket are reported as the maximum seen.
+        """
+        if not (count := self.count):
+            return None
+        rank = fraction * count
+        seen = 0
+        for bound, bucket in zip(LATENCY_BUCKETS_MS, self.buckets, strict=False):
+            seen += bucket
+            if seen >= rank:
+                return bound
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram and counters for diagnostics."""
+        count = self.count
+        return {
+            'count': count,
+            'success': self.success,
+            'timeout': self.timeout,
+            'error': self.error,
+            'avg_ms': round(self.total_ms / count, 2) if count else 0.0,
+            'max_ms': round(self.max_ms, 2),
+            'last_ms': round(self.last_ms, 2) if self.last_ms is not None else None,
+            'p95_ms': self.percentile(0.95),
+            'buckets_ms': {
+                f'le_{bound:g}': bucket
+                for bound, bucket in zip(LATENCY_BUCKETS_MS, self.buckets, strict=False)
+            }
+            | {'overflow': self.buckets[-1]},
+            'last_error': self.last_error,
+            'last_error_at': (
+                datetime.fromtimestamp(self.last_error_at, UTC).isoformat()
+                if self.last_error_at is not None
+                else None
+            ),
+        }
+
+
+class LinkMetrics:
+    """Per-operation statistics of an amp link.
+
+    Recording is a bucket lookup and a few counter updates, cheap enough to
+    run around every exchange.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self._operations: dict[str, OperationStats] = {}
+        self._recent_commands: deque[float] = deque(maxlen=RECENT_SAMPLES)
+
+    def get(self, operation: str) -> OperationStats | None:
+        """Return the statistics of an operation, if it was recorded."""
+        return self._operations.get(operation)
+
+    def record(
+        self, operation: str, duration_ms: float, error: BaseException | None = None
+    ) -> None:
+        """Record the duration and outcome of an operation."""
+        if (stats := self._operations.get(operation)) is None:
+            stats = self._operations[operation] = OperationStats()
+        stats.record(duration_ms, error)
+        if operation in COMMAND_OPERATIONS:
+            self._recent_commands.append(duration_ms)
+
+    @contextmanager
+    def measure(self, operation: str) -> Iterator[None]:
+        """Time the operation run inside the context, recording any exception."""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as err:
+            self.record(operation, (time.perf_counter() - start) * 1000, err)
+            raise
+        self.record(operation, (time.perf_counter() - start) * 1000)
+
+    def recent_command_percentile(self, fraction: float) -> float | None:
+        """Return a percentile of the durations of the last commands sent."""
+        if not self._recent_commands:
+            return None
+        samples = sorted(self._recent_commands)
+        return samples[max(0, math.ceil(fraction * len(samples)) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of every operation for diagnostics."""
+        return {
+            operation: stats.as_dict()
+            for operation, stats in sorted(self._operations.items())
+        }
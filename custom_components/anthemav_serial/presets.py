@@ -0,0 +1,56 @@
+"""Tuner presets entered in the options, one station per line."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+# tuning range per band: FM in MHz, AM in kHz
+BAND_RANGES: dict[str, tuple[float, float]] = {
+    'fm': (87.5, 108.0),
+    'am': (520.0, 1710.0),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TunerPreset:
+    """A named station on the receiver's tuner."""
+
+    name: str
+    band: str
+    frequency: float
+
+    @property
+    def command(self) -> str:
+        """Return the anthemav_serial command that tunes the station."""
+        return f'{self.band}_tune'
+
+    @property
+    def channel(self) -> float | int:
+        """Return the frequency as the tune command expects it."""
+        return int(self.frequency) if self.band == 'am' else self.frequency
+
+
+def parse_presets(text: str) -> Mapping[str, TunerPreset]:
+    """Parse lines like 'KEXP: FM 90.3' into presets by name.
+
+    Blank lines are skipped. Raises ValueError naming the first line that has
+    no name, an unknown band, a frequency outside the band, or a duplicate name.
+    """
+    presets: dict[str, TunerPreset] = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        name, _, station = line.rpartition(':')
+        name = name.strip()
+        band, _, frequency = station.strip().lower().partition(' ')
+        try:
+            value = float(frequency)
+        except ValueError:
+            raise ValueError(f'Invalid preset: {line.strip()}') from None
+        low, high = BAND_RANGES.get(band, (0.0, -1.0))
+        if not name or name in presets or not low <= value <= high:
+            raise ValueError(f'Invalid preset: {line.strip()}')
+        presets[name] = TunerPreset(name, band, value)
+    return MappingProxyType(presets)
@@ -0,0 +1,466 @@
+"""Native Anthem Gen1 RS232 line protocol client.
+
+The anthemav_serial library implements strict request/reply semantics: every
+query waits for its response before the next one is written. This client keeps
+a single line-oriented connection open and matches responses to outstanding
+queries by zone, which allows several queries to be written back-to-back.
+"""
+
+from __future__ import annotations
+
+import logging
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import re
+import socket
+from typing import Any
+from urllib.parse import urlsplit
+
+LOG = logging.getLogger(__name__)
+
+EOL: bytes = b'\n'
+DEFAULT_RESPONSE_TIMEOUT: float = 2.0
+CONNECT_TIMEOUT: float = 10.0
+
+# serial-to-Ethernet bridges: raw TCP, or RFC 2217 (handled by pyserial)
+SOCKET_SCHEME = 'socket'
+RFC2217_SCHEME = 'rfc2217'
+NETWORK_SCHEMES = (SOCKET_SCHEME, RFC2217_SCHEME)
+
+# detect a dead bridge within about a minute on an otherwise idle link
+TCP_KEEPALIVE_IDLE = 30
+TCP_KEEPALIVE_INTERVAL = 10
+TCP_KEEPALIVE_COUNT = 3
+
+# subset of the Gen1 command set (see anthem_rs232_gen1.yaml in anthemav_serial)
+COMMANDS: dict[str, str] = {
+    'power_on': 'P{zone}P1',
+    'power_off': 'P{zone}P0',
+    'power_status': 'P{zone}P?',
+    'zone_status': 'P{zone}?',
+    'set_volume': 'P{zone}VM{volume:.1f}',
+    'volume_up': 'P{zone}VMU',
+    'volume_down': 'P{zone}VMD',
+    'mute_on': 'P{zone}M1',
+    'mute_off': 'P{zone}M0',
+    'source_select': 'P{zone}S{source}',
+    'fm_tune': 'TFT{channel:05.1f}',
+    'am_tune': 'TAT{channel:04d}',
+    'tuner_status': 'TT?',
+    'query_version': '?',
+}
+
+ZONE_STATUS_PATTERN = re.compile(
+    r'^P(?P<zone>[1-3])S(?P<source>[0-9a-z]+)V(?P<volume>[-0-9.]+)M(?P<mute>[01])'
+)
+POWER_STATUS_PATTERN = re.compile(r'^P(?P<zone>[1-3])P(?P<power>[01])$')
+
+# partial status lines the amp transmits on its own when a setting changes
+VOLUME_STATUS_PATTERN = re.compile(r'^P(?P<zone>[1-3])VM?(?P<volume>[-0-9.]+)$')
+MUTE_STATUS_PATTERN = re.compile(r'^P(?P<zone>[1-3])M(?P<mute>[01])$')
+SOURCE_STATUS_PATTERN = re.compile(r'^P(?P<zone>[1-3])S(?P<source>[0-9a-z]+)$')
+
+# the tuner's station, answering a tuner status query and transmitted by the
+# amp whenever the tuner is retuned
+FM_STATUS_PATTERN = re.compile(r'^TFT(?P<frequency>[0-9.]+)$')
+AM_STATUS_PATTERN = re.compile(r'^TAT(?P<frequency>\d+)$')
+
+# the tuner is shared by all zones; its status lines are reported as this zone
+TUNER_ZONE = 0
+
+# a zone that is off answers a status query with one of these lines
+ZONE_OFF_RESPONSES: dict[str, int] = {
+    'Main Off': 1,
+    'Zone2 Off': 2,
+    'Zone3 Off': 3,
+}
+
+# Gen1 volume runs from -95.5 dB in 0.5 dB steps; Home Assistant's 0-1
+# volume level maps linearly onto it, with 1.0 at the 0 dB reference level
+MIN_VOLUME_DB = -95.5
+MAX_VOLUME_DB = 0.0
+VOLUME_STEP_DB = 0.5
+# 0-1 level change of one volume up/down step
+VOLUME_STEP = VOLUME_STEP_DB / (MAX_VOLUME_DB - MIN_VOLUME_DB)
+
+
+def is_network_port(port: str) -> bool:
+    """Return whether a port is a socket:// or rfc2217:// URL."""
+    return urlsplit(port).scheme in NETWORK_SCHEMES
+
+
+def parse_network_port(port: str) -> tuple[str, str, int]:
+    """Split a network port URL into (scheme, host, TCP port).
+
+    Raises ValueError if the URL is not a complete socket:// or rfc2217:// URL.
+    """
+    url = urlsplit(port)
+    if url.scheme not in NETWORK_SCHEMES:
+        raise ValueError(f'Unsupported port URL scheme: {url.scheme}')
+    if not url.hostname or url.port is None:
+        raise ValueError(f'Port URL must include host and port: {port}')
+    return url.scheme, url.hostname, url.port
+
+
+def _configure_socket(sock: Any) -> None:
+    """Disable Nagle and enable TCP keepalive on a bridge connection."""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for option, value in (
+        ('TCP_KEEPIDLE', TCP_KEEPALIVE_IDLE),
+        ('TCP_KEEPINTVL', TCP_KEEPALIVE_INTERVAL),
+        ('TCP_KEEPCNT', TCP_KEEPALIVE_COUNT),
+    ):
+        # not every platform exposes the keepalive timers
+        if hasattr(socket, option):
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
+
+def volume_to_db(volume: float) -> float:
+    """Return the dB setting, on the 0.5 dB grid, for a 0-1 volume level."""
+    volume = max(0.0, min(volume, 1.0))
+    db = MIN_VOLUME_DB + volume * (MAX_VOLUME_DB - MIN_VOLUME_DB)
+    return round(db / VOLUME_STEP_DB) * VOLUME_STEP_DB
+
+
+def db_to_volume(db: float) -> float:
+    """Return the 0-1 volume level of a dB reading."""
+    volume = (db - MIN_VOLUME_DB) / (MAX_VOLUME_DB - MIN_VOLUME_DB)
+    return max(0.0, min(volume, 1.0))
+
+
+def format_command(command: str, **args: Any) -> bytes:
+    """Encode a Gen1 command, including the line terminator."""
+    return COMMANDS[command].format(**args).encode('ascii') + EOL
+
+
+def decode_source(source: str) -> int | str:
+    """Return numeric source ids as int, lettered ids (e.g. 'd') unchanged."""
+    return int(source) if source.isdigit() else source
+
+
+def decode_status_line(line: str) -> tuple[int, dict[str, Any]] | None:
+    """Decode a Gen1 status line into (zone, status), or None if unrecognized.
+
+    Tuner lines decode to TUNER_ZONE with the band and frequency tuned.
+    """
+    if (zone := ZONE_OFF_RESPONSES.get(line)) is not None:
+        return zone, {'zone': zone, 'power': False}
+
+    if match := ZONE_STATUS_PATTERN.match(line):
+        zone = int(match['zone'])
+        return zone, {
+            'zone': zone,
+            'power': True,
+            'source': decode_source(match['source']),
+            'volume': db_to_volume(float(match['volume'])),
+            'mute': match['mute'] == '1',
+        }
+
+    if match := POWER_STATUS_PATTERN.match(line):
+        zone = int(match['zone'])
+        return zone, {'zone': zone, 'power': match['power'] == '1'}
+
+    if match := VOLUME_STATUS_PATTERN.match(line):
+        zone = int(match['zone'])
+        return zone, {'zone': zone, 'volume': db_to_volume(float(match['volume']))}
+
+    if match := MUTE_STATUS_PATTERN.match(line):
+        zone = int(match['zone'])
+        return zone, {'zone': zone, 'mute': match['mute'] == '1'}
+
+    if match := SOURCE_STATUS_PATTERN.match(line):
+        zone = int(match['zone'])
+        return zone, {'zone': zone, 'source': decode_source(match['source'])}
+
+    for band, pattern in (('fm', FM_STATUS_PATTERN), ('am', AM_STATUS_PATTERN)):
+        if match := pattern.match(line):
+            return TUNER_ZONE, {
+                'zone': TUNER_ZONE,
+                'band': band,
+                'frequency': float(match['frequency']),
+            }
+
+    return None
+
+
+def is_complete_status(status: dict[str, Any]) -> bool:
+    """Return whether a decoded line fully describes its zone.
+
+    Only complete lines can answer a zone status query; partial lines (for
+    example a volume change echoed by the amp) are unsolicited updates.
+    """
+    if status.get('power') is False:
+        return True
+    return all(key in status for key in ('source', 'volume', 'mute'))
+
+
+def answers_query(query: str, status: dict[str, Any]) -> bool:
+    """Return whether a decoded line is a reply to the given query command."""
+    if query == 'power_status':
+        return 'power' in status
+    if query == 'tuner_status':
+        return 'band' in status
+    return is_complete_status(status)
+
+
+class AnthemGen1Protocol(asyncio.Protocol):
+    """Split the incoming byte stream into lines and hand them to the client."""
+
+    def __init__(self, client: AnthemGen1Client) -> None:
+        """Initialize the protocol."""
+        self._client = client
+        self._buffer = bytearray()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Attach the transport to the client."""
+        self._client.connection_made(transport)  # type: ignore[arg-type]
+
+    def data_received(self, data: bytes) -> None:
+        """Buffer data and dispatch every complete line."""
+        self._client.bytes_received += len(data)
+        self._buffer += data
+        while (index := self._buffer.find(EOL)) >= 0:
+            raw = bytes(self._buffer[:index])
+            del self._buffer[: index + 1]
+            line = raw.decode('ascii', errors='ignore').strip()
+            if line:
+                self._client.handle_line(line)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Notify the client that the link is gone."""
+        self._client.connection_lost(exc)
+
+
+class AnthemGen1Client:
+    """Gen1 amp controller with pipelined zone status queries.
+
+    Mirrors the interface of the anthemav_serial async controller so the
+    coordinator can use either one.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_RESPONSE_TIMEOUT) -> None:
+        """Initialize the client."""
+        self._timeout = timeout
+        self._transport: asyncio.WriteTransport | None = None
+        self._pending: dict[int, deque[tuple[str, asyncio.Future[dict[str, Any]]]]] = {}
+        self._listeners: list[Callable[[int, dict[str, Any]], None]] = []
+        self._disconnect_listeners: list[Callable[[], None]] = []
+        self._attached = asyncio.Event()
+        # link traffic since the client was created
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the underlying transport is open."""
+        return self._transport is not None and not self._transport.is_closing()
+
+    def connection_made(self, transport: asyncio.WriteTransport) -> None:
+        """Store the transport once the link is open."""
+        self._transport = transport
+        self._attached.set()
+
+    async def async_wait_connected(self) -> None:
+        """Wait until the transport has been attached to the client."""
+        await self._attached.wait()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Fail all outstanding queries when the link goes away."""
+        self._transport = None
+        self._attached.clear()
+        error = exc or ConnectionError('Connection to Anthem device lost')
+        for queries in self._pending.values():
+            for _, future in queries:
+                if not future.done():
+                    future.set_exception(error)
+        self._pending.clear()
+        for listener in list(self._disconnect_listeners):
+            listener()
+
+    def add_listener(
+        self, listener: Callable[[int, dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Register a callback for status the amp sends without being asked."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def add_disconnect_listener(
+        self, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Register a callback for when the link is lost."""
+        self._disconnect_listeners.append(listener)
+        return lambda: self._disconnect_listeners.remove(listener)
+
+    def handle_line(self, line: str) -> None:
+        """Resolve the oldest outstanding query for the zone a line refers to.
+
+        Lines that do not answer a query are passed to the registered
+        listeners as unsolicited status.
+        """
+        decoded = decode_status_line(line)
+        if decoded is None:
+            LOG.debug('Ignoring unrecognized line from Anthem device: %s', line)
+            return
+
+        zone, status = decoded
+        for query, future in self._pending.get(zone, ()):
+            if not future.done() and answers_query(query, status):
+                self._pending[zone].remove((query, future))
+                future.set_result(status)
+                return
+
+        LOG.debug('Unsolicited status for zone %s: %s', zone, status)
+        for listener in list(self._listeners):
+            listener(zone, status)
+
+    def _write(self, data: bytes) -> None:
+        """Write raw bytes to the link."""
+        if self._transport is None:
+            raise ConnectionError('Not connected to Anthem device')
+        LOG.debug('Sending %s', data)
+        self._transport.write(data)
+        self.bytes_sent += len(data)
+
+    async def send_command(
+        self, command: str, args: dict[str, Any] | None = None
+    ) -> None:
+        """Send a Gen1 command that has no reply."""
+        self._write(format_command(command, **(args or {})))
+
+    async def query_many(
+        self, queries: dict[int, str]
+    ) -> dict[int, dict[str, Any] | Exception]:
+        """Send one query per zone in a single back-to-back write.
+
+        Takes a mapping of zone to query command ('zone_status' or
+        'power_status'). Returns a mapping of zone to decoded status, or to the
+        exception raised for that zone, so one missing response does not fail
+        the other zones.
+        """
+        loop = asyncio.get_running_loop()
+        futures: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        for zone, query in queries.items():
+            future: asyncio.Future[dict[str, Any]] = loop.create_future()
+            self._pending.setdefault(zone, deque()).append((query, future))
+            futures[zone] = future
+
+        try:
+            self._write(b''.join(format_command(q, zone=z) for z, q in queries.items()))
+        except ConnectionError as err:
+            for zone, future in futures.items():
+                self._discard(zone, future)
+            return dict.fromkeys(queries, err)
+
+        await asyncio.wait(futures.values(), timeout=self._timeout)
+
+        results: dict[int, dict[str, Any] | Exception] = {}
+        for zone, future in futures.items():
+            if not future.done():
+                self._discard(zone, future)
+                results[zone] = TimeoutError(f'No response for zone {zone}')
+            elif (exc := future.exception()) is not None:
+                results[zone] = exc  # type: ignore[assignment]
+            else:
+                results[zone] = future.result()
+        return results
+
+    async def zone_status_many(
+        self, zones: list[int]
+    ) -> dict[int, dict[str, Any] | Exception]:
+        """Query the full status of several zones with a single write."""
+        return await self.query_many(dict.fromkeys(zones, 'zone_status'))
+
+    def _discard(self, zone: int, future: asyncio.Future[dict[str, Any]]) -> None:
+        """Remove an abandoned query so later responses are not misattributed."""
+        future.cancel()
+        queries = self._pending.get(zone, deque())
+        for entry in list(queries):
+            if entry[1] is future:
+                queries.remove(entry)
+
+    async def _query(self, query: str, zone: int) -> dict[str, Any]:
+        """Send a single query and return its decoded reply."""
+        result = (await self.query_many({zone: query}))[zone]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def zone_status(self, zone: int) -> dict[str, Any]:
+        """Return a dictionary containing status details for the zone."""
+        return await self._query('zone_status', zone)
+
+    async def power_status(self, zone: int) -> dict[str, Any]:
+        """Return only the power state of a zone (a much shorter exchange)."""
+        return await self._query('power_status', zone)
+
+    async def tuner_status(self) -> dict[str, Any]:
+        """Return the band and frequency the tuner is on."""
+        return await self._query('tuner_status', TUNER_ZONE)
+
+    async def set_power(self, zone: int, power: bool) -> None:
+        """Turn a zone on or off."""
+        await self.send_command('power_on' if power else 'power_off', {'zone': zone})
+
+    async def set_mute(self, zone: int, mute: bool) -> None:
+        """Mute or unmute a zone."""
+        await self.send_command('mute_on' if mute else 'mute_off', {'zone': zone})
+
+    async def set_volume(self, zone: int, volume: float) -> None:
+        """Set the volume of a zone to a 0-1 level."""
+        await self.send_command(
+            'set_volume', {'zone': zone, 'volume': volume_to_db(volume)}
+        )
+
+    async def volume_up(self, zone: int) -> None:
+        """Increase volume for a zone by one step."""
+        await self.send_command('volume_up', {'zone': zone})
+
+    async def volume_down(self, zone: int) -> None:
+        """Decrease volume for a zone by one step."""
+        await self.send_command('volume_down', {'zone': zone})
+
+    async def set_source(self, zone: int, source: int | str) -> None:
+        """Select the input source for a zone."""
+        await self.send_command('source_select', {'zone': zone, 'source': source})
+
+    async def close(self) -> None:
+        """Close the link."""
+        if self._transport is not None:
+            self._transport.close()
+        self.connection_lost(None)
+
+
+async def async_open_client(
+    port: str,
+    serial_config: dict[str, Any],
+    timeout: float = DEFAULT_RESPONSE_TIMEOUT,
+) -> AnthemGen1Client:
+    """Open a serial port or network bridge and return a connected Gen1 client.
+
+    socket:// ports get a single long-lived TCP connection with Nagle disabled
+    and keepalive enabled; rfc2217:// ports and local devices are opened with
+    pyserial, which negotiates the serial settings with RFC 2217 bridges.
+    """
+    loop = asyncio.get_running_loop()
+    client = AnthemGen1Client(timeout=timeout)
+
+    if urlsplit(port).scheme == SOCKET_SCHEME:
+        _, host, tcp_port = parse_network_port(port)
+        transport, _ = await asyncio.wait_for(
+            loop.create_connection(lambda: AnthemGen1Protocol(client), host, tcp_port),
+            CONNECT_TIMEOUT,
+        )
+        _configure_socket(transport.get_extra_info('socket'))
+        return client
+
+    # imported on first use so loading the integration does not load pyserial
+    from serial_asyncio import create_serial_connection
+
+    await create_serial_connection(
+        loop, lambda: AnthemGen1Protocol(client), port, **serial_config
+    )
+    # pyserial-asyncio attaches the transport in a later loop iteration
+    await asyncio.wait_for(client.async_wait_connected(), CONNECT_TIMEOUT)
+    return client
@@ -0,0 +1,117 @@
+"""Prioritized access to the half-duplex RS232 link of an Anthem device."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+import heapq
+import itertools
+import time
+from typing import Any
+
+
+class Priority(IntEnum):
+    """Priority classes for link access; lower values are served first."""
+
+    COMMAND = 0
+    REFRESH = 1
+    POLL = 2
+
+
+@dataclass
+class _WaitStats:
+    """Wait time statistics for one priority class."""
+
+    granted: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    last_wait: float = 0.0
+
+    def record(self, wait: float) -> None:
+        """Record the time a caller waited for the link."""
+        self.granted += 1
+        self.total_wait += wait
+        self.last_wait = wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in milliseconds."""
+        return {
+            'granted': self.granted,
+            'avg_wait_ms': (
+                round(self.total_wait / self.granted * 1000, 2) if self.granted else 0.0
+            ),
+            'max_wait_ms': round(self.max_wait * 1000, 2),
+            'last_wait_ms': round(self.last_wait * 1000, 2),
+        }
+
+
+class LinkScheduler:
+    """Serialize use of the amp link, granting it in priority order.
+
+    Holders keep the link only for a single exchange, so a long operation such
+    as a multi-zone poll can be pre-empted by a user command between zones.
+    Callers of equal priority are served first come, first served.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._busy = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._stats = {priority: _WaitStats() for priority in Priority}
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of callers waiting for the link."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        """Hold the link for the duration of the context."""
+        start = time.monotonic()
+        await self._acquire(priority)
+        self._stats[priority].record(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: Priority) -> None:
+        """Wait until the link is granted to this caller."""
+        if not self._busy and not self.queue_depth:
+            self._busy = True
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # granted just before being cancelled: pass the link on
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the link to the highest priority waiter, if any."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and wait times per priority class."""
+        return {
+            'queue_depth': self.queue_depth,
+            'busy': self._busy,
+            'wait': {
+                priority.name.lower(): stats.as_dict()
+                for priority, stats in self._stats.items()
+            },
+        }
@@ -0,0 +1,119 @@
+"""Diagnostic sensors for the link to Anthem A/V Receivers via RS232."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import CONF_SERIAL_NUMBER, DEFAULT_SERIAL_NUMBER, DOMAIN
+from .coordinator import AnthemAVSerialCoordinator
+
+
+@dataclass(frozen=True, kw_only=True)
+class AnthemAVSerialSensorEntityDescription(SensorEntityDescription):
+    """Describes an Anthem link health sensor."""
+
+    value_fn: Callable[[AnthemAVSerialCoordinator], float | int | None]
+
+
+SENSORS: tuple[AnthemAVSerialSensorEntityDescription, ...] = (
+    AnthemAVSerialSensorEntityDescription(
+        key='last_poll_duration',
+        translation_key='last_poll_duration',
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: coordinator.last_poll_duration,
+    ),
+    AnthemAVSerialSensorEntityDescription(
+        key='command_latency_p95',
+        translation_key='command_latency_p95',
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: coordinator.command_latency_p95,
+    ),
+    AnthemAVSerialSensorEntityDescription(
+        key='consecutive_failures',
+        translation_key='consecutive_failures',
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.consecutive_failures,
+    ),
+    AnthemAVSerialSensorEntityDescription(
+        key='reconnects',
+        translation_key='reconnects',
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.reconnects,
+    ),
+    AnthemAVSerialSensorEntityDescription(
+        key='serial_bytes_per_minute',
+        translation_key='serial_bytes_per_minute',
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement='B/min',
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: coordinator.serial_bytes_per_minute,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Anthem link health sensors from a config entry."""
+    coordinator: AnthemAVSerialCoordinator = hass.data[DOMAIN][entry.entry_id]
+    serial_number = entry.data.get(CONF_SERIAL_NUMBER, DEFAULT_SERIAL_NUMBER)
+
+    async_add_entities(
+        AnthemAVSerialSensor(coordinator, entry.entry_id, serial_number, description)
+        for description in SENSORS
+    )
+
+
+class AnthemAVSerialSensor(CoordinatorEntity[AnthemAVSerialCoordinator], SensorEntity):
+    """Diagnostic sensor fed from the coordinator's link statistics."""
+
+    entity_description: AnthemAVSerialSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: AnthemAVSerialCoordinator,
+        entry_id: str,
+        serial_number: str,
+        description: AnthemAVSerialSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        # every receiver is set up with the default serial number, so key the
+        # ids by config entry to keep each receiver's sensors apart
+        self._attr_unique_id = f'{DOMAIN}_{entry_id}_{description.key}'
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, serial_number)})
+
+    @property
+    def available(self) -> bool:
+        """Return True, link health is reported while the device is unreachable."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current value from the coordinator."""
+        return self.entity_description.value_fn(self.coordinator)
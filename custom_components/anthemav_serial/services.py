@@ -0,0 +1,136 @@
+"""Services for the Anthem AV Serial integration."""
+
+from __future__ import annotations
+
+import logging
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+
+from .const import (
+    ALL_ZONES,
+    ATTR_COMMANDS,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_ZONE,
+    DOMAIN,
+    SERVICE_BATCH,
+    SERVICE_DISCOVER_ZONES,
+    SERVICE_RESTORE,
+    SERVICE_SNAPSHOT,
+    ZONE_SETTINGS,
+)
+from .coordinator import AnthemAVSerialCoordinator
+
+LOG = logging.getLogger(__name__)
+
+# services that act on one receiver, or on all of them if none is given
+ENTRY_SERVICE_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+# one zone's settings; without a zone they apply to every zone of the receiver
+COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ZONE): vol.All(vol.Coerce(int), vol.In(ALL_ZONES)),
+        vol.Optional('power'): cv.boolean,
+        vol.Optional('source'): vol.Any(cv.positive_int, cv.string),
+        vol.Optional('volume'): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+        vol.Optional('mute'): cv.boolean,
+    }
+)
+
+BATCH_SCHEMA = ENTRY_SERVICE_SCHEMA.extend(
+    {vol.Required(ATTR_COMMANDS): vol.All(cv.ensure_list, [COMMAND_SCHEMA])}
+)
+
+
+def _get_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[AnthemAVSerialCoordinator]:
+    """Return the coordinator of the requested entry, or of every entry."""
+    coordinators: dict[str, AnthemAVSerialCoordinator] = hass.data.get(DOMAIN, {})
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is None:
+        return list(coordinators.values())
+    if entry_id not in coordinators:
+        raise ServiceValidationError(f'Anthem receiver {entry_id} is not loaded')
+    return [coordinators[entry_id]]
+
+
+def _batch_operations(
+    coordinator: AnthemAVSerialCoordinator, commands: list[dict[str, Any]]
+) -> list[tuple[int, str, Any]]:
+    """Expand batch service commands into (zone, setting, value) operations."""
+    operations: list[tuple[int, str, Any]] = []
+    for command in commands:
+        if (zone := command.get(ATTR_ZONE)) is None:
+            zones = coordinator.zones
+        elif zone in coordinator.zones:
+            zones = [zone]
+        else:
+            raise ServiceValidationError(
+                f'Zone {zone} is not enabled on Anthem {coordinator.series}'
+            )
+
+        for setting in ZONE_SETTINGS:
+            if (value := command.get(setting)) is None:
+                continue
+            if setting == 'source' and isinstance(value, str):
+                if (source_id := coordinator.index.source_id(value)) is None:
+                    raise ServiceValidationError(f'Unknown source "{value}"')
+                value = source_id
+            operations.extend((zone_id, setting, value) for zone_id in zones)
+    return operations
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_discover_zones(call: ServiceCall) -> None:
+        """Probe the zones of one or all receivers again."""
+        for coordinator in _get_coordinators(hass, call):
+            zones = await coordinator.async_rediscover_zones()
+            LOG.info('Zones of Anthem %s: %s', coordinator.series, zones)
+
+    async def async_snapshot(call: ServiceCall) -> None:
+        """Save the zone settings of one or all receivers."""
+        for coordinator in _get_coordinators(hass, call):
+            coordinator.async_take_snapshot()
+
+    async def async_restore(call: ServiceCall) -> None:
+        """Return one or all receivers to their saved zone settings."""
+        # each receiver has its own link, so they are restored concurrently
+        await asyncio.gather(
+            *(
+                coordinator.async_restore_snapshot()
+                for coordinator in _get_coordinators(hass, call)
+            )
+        )
+
+    async def async_batch(call: ServiceCall) -> None:
+        """Send settings for several zones as one burst per receiver."""
+        # validate the commands for every receiver before sending any of them
+        batches = [
+            (coordinator, _batch_operations(coordinator, call.data[ATTR_COMMANDS]))
+            for coordinator in _get_coordinators(hass, call)
+        ]
+        await asyncio.gather(
+            *(
+                coordinator.async_batch(operations)
+                for coordinator, operations in batches
+            )
+        )
+
+    for service, handler in (
+        (SERVICE_DISCOVER_ZONES, async_discover_zones),
+        (SERVICE_SNAPSHOT, async_snapshot),
+        (SERVICE_RESTORE, async_restore),
+    ):
+        hass.services.async_register(
+            DOMAIN, service, handler, schema=ENTRY_SERVICE_SCHEMA
+        )
+    hass.services.async_register(
+        DOMAIN, SERVICE_BATCH, async_batch, schema=BATCH_SCHEMA
+    )
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT, CONF_SCAN_INTERVAL
 import pytest
 
@@ -15,7 +16,11 @@ from custom_components.anthemav_serial.const import (
     CONF_SERIES,
     DEFAULT_MAX_VOLUME,
     DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
 )
+from custom_components.anthemav_serial.device_index import clear_series_indexes
+
+from .simulator import Gen1Simulator
 
 
 @pytest.fixture
@@ -37,6 +42,52 @@ def mock_config_entry_options() -> dict[str, Any]:
     }
 
 
+@pytest.fixture
+def config_entry_factory(
+    mock_config_entry_data: dict[str, Any],
+    mock_config_entry_options: dict[str, Any],
+) -> Callable[..., ConfigEntry]:
+    """Return a factory for config entries built on the mock data and options.
+
+    data and options are merged into the mock ones; a second receiver needs
+    its own entry_id and unique_id.
+    """
+
+    def factory(
+        *,
+        data: dict[str, Any] | None = None,
+        options: dict[str, Any] | None = None,
+        entry_id: str = 'test_entry_id',
+        unique_id: str = '/dev/ttyUSB0_123456',
+    ) -> ConfigEntry:
+        return ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title='Test Anthem',
+            data={**mock_config_entry_data, **(data or {})},
+            source='user',
+            options={**mock_config_entry_options, **(options or {})},
+            unique_id=unique_id,
+            entry_id=entry_id,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def mock_config_entry(
+    request: pytest.FixtureRequest,
+    config_entry_factory: Callable[..., ConfigEntry],
+) -> ConfigEntry:
+    """Create a mock config entry.
+
+    Parametrize indirectly with a dict of options to set on top of the mock
+    options, e.g. to enable pipelined polling or push updates.
+    """
+    return config_entry_factory(options=getattr(request, 'param', {}))
+
+
 @pytest.fixture
 def mock_amp() -> MagicMock:
     """Create a mock amp controller."""
@@ -55,6 +106,7 @@ def mock_amp() -> MagicMock:
     amp.volume_down = AsyncMock()
     amp.set_mute = AsyncMock()
     amp.set_source = AsyncMock()
+    amp.send_command = AsyncMock(return_value=None)
     amp.close = AsyncMock()
     return amp
 
@@ -89,8 +141,25 @@ def mock_device_config() -> Generator[dict]:
             }
         },
     }
+    clear_series_indexes()
     with patch(
         'custom_components.anthemav_serial.coordinator.DEVICE_CONFIG',
         device_config,
     ):
         yield device_config
+    clear_series_indexes()
+
+
+@pytest.fixture
+async def anthem_simulator(
+    request: pytest.FixtureRequest,
+) -> AsyncGenerator[Gen1Simulator]:
+    """Run a pty-backed Gen1 receiver simulator.
+
+    Parametrize indirectly with a dict of Gen1Simulator keyword arguments to
+    configure series, zones, baud rate, latency, jitter, drops or chunking.
+    """
+    simulator = Gen1Simulator(**getattr(request, 'param', {}))
+    simulator.start()
+    yield simulator
+    simulator.stop()
@@ -0,0 +1,244 @@
+"""Pseudo-terminal backed Anthem Gen1 RS232 device simulator.
+
+The simulator owns the master end of a pty and speaks the Gen1 line protocol;
+the integration opens the slave end (``Gen1Simulator.port``) like any serial
+port. Replies are paced like a real link: each byte takes the time it needs at
+the configured baud rate, after a fixed latency with optional jitter, and may
+be split into several reads or lose bytes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import os
+import random
+import re
+import tty
+
+from custom_components.anthemav_serial.const import SUPPORTED_SERIES
+
+EOL = b'\n'
+
+COMMAND_PATTERN = re.compile(r'^P(?P<zone>[1-3])(?P<arg>.*)$')
+TUNE_PATTERN = re.compile(r'^T(?P<band>[FA])T(?P<frequency>[0-9.]+)$')
+OFF_RESPONSES = {1: 'Main Off', 2: 'Zone2 Off', 3: 'Zone3 Off'}
+
+# dB change of a single VMU/VMD step
+VOLUME_STEP_DB = 0.5
+
+
+@dataclass
+class ZoneState:
+    """State of one simulated zone."""
+
+    power: bool = False
+    source: int | str = 1
+    volume: float = -40.0
+    mute: bool = False
+
+
+class Gen1Simulator:
+    """Anthem Gen1 receiver on the slave end of a pty."""
+
+    def __init__(
+        self,
+        series: str = 'd2v',
+        *,
+        zones: tuple[int, ...] = (1, 2, 3),
+        baudrate: int = 9600,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        chunk_size: int = 0,
+        power_on_delay: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the simulator.
+
+        latency is the delay before a reply starts, jitter the maximum random
+        deviation from it, drop_rate the probability of losing each reply
+        byte, and chunk_size splits replies into reads of that many bytes. A
+        zone turned on stays off for power_on_delay seconds, like a receiver
+        warming up.
+        """
+        if series not in SUPPORTED_SERIES:
+            raise ValueError(f'Unsupported series: {series}')
+        self.series = series
+        self.zones = {zone: ZoneState() for zone in zones}
+        # (band, frequency) the tuner is on, shared by all zones
+        self.tuner: tuple[str, float] = ('fm', 87.5)
+        self.byte_time = 10 / baudrate
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.chunk_size = chunk_size
+        self.power_on_delay = power_on_delay
+
+        self.received: list[str] = []
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+        self._random = random.Random(seed)
+        self._buffer = bytearray()
+        self._downlink_free = 0.0
+        self._pending: set[asyncio.TimerHandle] = set()
+        self._master: int | None = None
+        self._slave: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def port(self) -> str:
+        """Return the device path to open as the serial port."""
+        assert self._slave is not None, 'simulator not started'
+        return os.ttyname(self._slave)
+
+    def start(self) -> None:
+        """Open the pty and start answering on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._master, self._slave = os.openpty()
+        # no echo or newline translation, like a real serial line
+        tty.setraw(self._master)
+        tty.setraw(self._slave)
+        os.set_blocking(self._master, False)
+        self._loop.add_reader(self._master, self._read)
+
+    def stop(self) -> None:
+        """Stop answering and close the pty."""
+        if self._master is None:
+            return
+        assert self._loop is not None
+        for handle in self._pending:
+            handle.cancel()
+        self._pending.clear()
+        self._loop.remove_reader(self._master)
+        os.close(self._master)
+        os.close(self._slave)
+        self._master = self._slave = None
+
+    def status_line(self, zone: int) -> str:
+        """Return the full status line a zone status query is answered with."""
+        state = self.zones[zone]
+        if not state.power:
+            return OFF_RESPONSES[zone]
+        return f'P{zone}S{state.source}V{state.volume:.1f}M{int(state.mute)}'
+
+    def front_panel(self, zone: int, **changes: bool | float | int | str) -> None:
+        """Change zone settings as the front panel would and transmit them."""
+        state = self.zones[zone]
+        for key, value in changes.items():
+            setattr(state, key, value)
+            if key == 'power':
+                self._transmit(f'P{zone}P1' if value else OFF_RESPONSES[zone])
+            elif key == 'volume':
+                self._transmit(f'P{zone}VM{value:.1f}')
+            elif key == 'mute':
+                self._transmit(f'P{zone}M{int(value)}')
+            elif key == 'source':
+                self._transmit(f'P{zone}S{value}')
+
+    def tuner_line(self) -> str:
+        """Return the line a tuner status query is answered with."""
+        band, frequency = self.tuner
+        if band == 'am':
+            return f'TAT{int(frequency):04d}'
+        return f'TFT{frequency:05.1f}'
+
+    def retune(self, band: str, frequency: float) -> None:
+        """Tune the tuner as the front panel would and transmit the station."""
+        self.tuner = (band, frequency)
+        self._transmit(self.tuner_line())
+
+    def _read(self) -> None:
+        """Read commands written by the client and answer each complete line."""
+        assert self._master is not None
+        try:
+            data = os.read(self._master, 1024)
+        except BlockingIOError:
+            return
+        self.bytes_in += len(data)
+        self._buffer += data
+        while (index := self._buffer.find(EOL)) >= 0:
+            line = bytes(self._buffer[:index]).decode('ascii', 'ignore').strip()
+            del self._buffer[: index + 1]
+            if line:
+                self._handle(line)
+
+    def _handle(self, line: str) -> None:
+        """Apply a command and transmit its reply, if it has one."""
+        self.received.append(line)
+        if line == '?':
+            self._transmit(f'IDQ{self.series.upper()}')
+            return
+        if line == 'TT?':
+            self._transmit(self.tuner_line())
+            return
+        if match := TUNE_PATTERN.match(line):
+            band = 'fm' if match['band'] == 'F' else 'am'
+            self.retune(band, float(match['frequency']))
+            return
+
+        match = COMMAND_PATTERN.match(line)
+        if match is None or int(match['zone']) not in self.zones:
+            # unknown commands and unwired zones get no reply
+            return
+
+        zone = int(match['zone'])
+        arg = match['arg']
+        state = self.zones[zone]
+        if arg == '?':
+            self._transmit(self.status_line(zone))
+        elif arg == 'P?':
+            self._transmit(f'P{zone}P{int(state.power)}')
+        elif arg == 'P1' and self.power_on_delay and not state.power:
+            self._pending.add(
+                self._loop.call_later(
+                    self.power_on_delay, setattr, state, 'power', True
+                )
+            )
+        elif arg in ('P0', 'P1'):
+            state.power = arg == 'P1'
+        elif not state.power:
+            # an off zone ignores everything but power commands
+            return
+        elif arg == 'VMU':
+            state.volume += VOLUME_STEP_DB
+        elif arg == 'VMD':
+            state.volume -= VOLUME_STEP_DB
+        elif arg.startswith('VM'):
+            state.volume = float(arg[2:])
+        elif arg in ('M0', 'M1'):
+            state.mute = arg == 'M1'
+        elif arg.startswith('S'):
+            source = arg[1:]
+            state.source = int(source) if source.isdigit() else source
+
+    def _transmit(self, line: str) -> None:
+        """Schedule a line to arrive at the pace of the simulated link."""
+        assert self._loop is not None
+        data = line.encode('ascii') + EOL
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(-self.jitter, self.jitter)
+        start = max(self._loop.time() + max(delay, 0.0), self._downlink_free)
+        self._downlink_free = start + len(data) * self.byte_time
+
+        if self.drop_rate:
+            data = bytes(b for b in data if self._random.random() >= self.drop_rate)
+
+        chunk_size = self.chunk_size or len(data) or 1
+        for offset in range(0, len(data), chunk_size):
+            chunk = data[offset : offset + chunk_size]
+            arrival = start + (offset + len(chunk)) * self.byte_time
+            self._pending.add(self._loop.call_at(arrival, self._write, chunk))
+
+    def _write(self, data: bytes) -> None:
+        """Write reply bytes to the client end of the pty."""
+        assert self._loop is not None
+        # forget the handles that have fired, so stop() only cancels the rest
+        now = self._loop.time()
+        self._pending = {handle for handle in self._pending if handle.when() > now}
+        if self._master is None:
+            return
+        self.bytes_out += len(data)
+        os.write(self._master, data)
@@ -9,11 +9,15 @@ from homeassistant.const import CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.anthemav_serial.const import (
+    CONF_MAX_SCAN_INTERVAL,
     CONF_MAX_VOLUME,
+    CONF_MIN_SCAN_INTERVAL,
     CONF_SERIAL_NUMBER,
     CONF_SERIES,
+    CONF_ZONES,
     DEFAULT_MAX_VOLUME,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SERIAL_NUMBER,
@@ -106,6 +110,36 @@ async def test_form_invalid_series(hass: HomeAssistant) -> None:
     assert result2['errors'] == {'base': 'invalid_series'}
 
 
+@pytest.mark.parametrize(
+    ('port', 'errors'),
+    [
+        ('socket://', {CONF_PORT: 'invalid_port'}),
+        ('tcp://192.168.1.50:4999', {CONF_PORT: 'invalid_port'}),
+        ('socket://192.168.1.50:4999', None),
+        ('rfc2217://bridge.local:2217', None),
+    ],
+)
+async def test_form_network_port(
+    hass: HomeAssistant, port: str, errors: dict[str, str] | None
+) -> None:
+    """Test network bridge URLs are validated."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={'source': config_entries.SOURCE_USER}
+    )
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result['flow_id'],
+        {CONF_PORT: port, CONF_SERIES: 'd2v', CONF_NAME: 'Rack'},
+    )
+
+    if errors is None:
+        assert result2['type'] == FlowResultType.CREATE_ENTRY
+        assert result2['data'][CONF_PORT] == port
+    else:
+        assert result2['type'] == FlowResultType.FORM
+        assert result2['errors'] == errors
+
+
 async def test_form_duplicate_unique_id(hass: HomeAssistant) -> None:
     """Test config flow aborts when unique ID is already configured."""
     # create an initial entry
@@ -156,3 +190,32 @@ async def test_form_all_supported_series(hass: HomeAssistant, series: str) -> No
 
     assert result2['type'] == FlowResultType.CREATE_ENTRY
     assert result2['data'][CONF_SERIES] == series
+
+
+async def test_options_reject_inconsistent_intervals(hass: HomeAssistant) -> None:
+    """Test the options need fastest <= update <= slowest interval."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_PORT: '/dev/ttyUSB0', CONF_SERIES: 'd2v'},
+        options={CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL},
+    )
+    entry.add_to_hass(hass)
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    options = {
+        CONF_SCAN_INTERVAL: 10,
+        CONF_MAX_VOLUME: DEFAULT_MAX_VOLUME,
+        CONF_ZONES: ['1'],
+        CONF_MIN_SCAN_INTERVAL: 20,
+        CONF_MAX_SCAN_INTERVAL: 120,
+    }
+
+    result2 = await hass.config_entries.options.async_configure(
+        result['flow_id'], options
+    )
+    assert result2['type'] == FlowResultType.FORM
+    assert result2['errors'] == {'base': 'invalid_intervals'}
+
+    result3 = await hass.config_entries.options.async_configure(
+        result2['flow_id'], {**options, CONF_MIN_SCAN_INTERVAL: 2}
+    )
+    assert result3['type'] == FlowResultType.CREATE_ENTRY
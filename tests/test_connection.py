@@ -0,0 +1,74 @@
+"""Tests for the Anthem connection state machine."""
+
+from __future__ import annotations
+
+from custom_components.anthemav_serial.connection import (
+    ConnectionState,
+    ReconnectPolicy,
+)
+
+
+def test_backoff_grows_exponentially() -> None:
+    """Test the retry delay doubles with every failure up to the maximum."""
+    policy = ReconnectPolicy(base_delay=1.0, max_delay=8.0, jitter=0.0)
+
+    delays = []
+    for _ in range(4):
+        policy.record_failure(0.0)
+        delays.append(policy.retry_in(0.0))
+
+    assert delays == [1.0, 2.0, 4.0, 8.0]
+    assert policy.state is ConnectionState.BACKING_OFF
+    assert not policy.allow_attempt(7.9)
+    assert policy.allow_attempt(8.0)
+
+
+def test_backoff_jitter_stays_in_range() -> None:
+    """Test jitter spreads retries around the nominal delay."""
+    policy = ReconnectPolicy(base_delay=10.0, jitter=0.2)
+
+    policy.record_failure(0.0)
+
+    assert 8.0 <= policy.retry_in(0.0) <= 12.0
+
+
+def test_circuit_opens_after_repeated_failures() -> None:
+    """Test the circuit opens and fails fast for the open duration."""
+    policy = ReconnectPolicy(failure_threshold=3, open_duration=300.0)
+
+    for _ in range(3):
+        policy.record_failure(0.0, 'timeout')
+
+    assert policy.state is ConnectionState.OPEN_CIRCUIT
+    assert not policy.allow_attempt(299.0)
+    assert policy.allow_attempt(300.0)
+    assert policy.as_dict(0.0)['last_error'] == 'timeout'
+
+    policy.reset()
+    assert policy.allow_attempt(0.0)
+
+
+def test_success_closes_circuit_and_counts_reconnects() -> None:
+    """Test a success resets failures and later successes count as reconnects."""
+    policy = ReconnectPolicy()
+
+    policy.record_success()
+    policy.record_disconnect()
+    policy.record_failure(0.0)
+    policy.record_success()
+
+    assert policy.state is ConnectionState.CONNECTED
+    assert policy.consecutive_failures == 0
+    assert policy.reconnects == 1
+
+
+def test_poll_health_toggles_degraded() -> None:
+    """Test failing zones degrade a connected link until they answer again."""
+    policy = ReconnectPolicy()
+    policy.record_success()
+
+    policy.record_poll(healthy=False)
+    assert policy.state is ConnectionState.DEGRADED
+
+    policy.record_poll(healthy=True)
+    assert policy.state is ConnectionState.CONNECTED
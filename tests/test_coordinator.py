@@ -2,38 +2,40 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+import time
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 import pytest
 
+from custom_components.anthemav_serial.connection import ConnectionState
 from custom_components.anthemav_serial.const import (
-    DOMAIN,
+    CONF_ADAPTIVE_POLLING,
+    CONF_DISCOVERED_ZONES,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_OPTIMISTIC,
+    CONF_PIPELINED_POLLING,
+    CONF_PRESETS,
+    CONF_PUSH_UPDATES,
+    CONF_RECONCILE_TIMEOUT,
+    CONF_SERIES,
+    CONF_ZONES,
+    DEFAULT_MAX_VOLUME,
+    PUSH_SAFETY_SCAN_INTERVAL,
 )
 from custom_components.anthemav_serial.coordinator import AnthemAVSerialCoordinator
-
-
-@pytest.fixture
-def mock_config_entry(
-    hass: HomeAssistant,
-    mock_config_entry_data: dict[str, Any],
-    mock_config_entry_options: dict[str, Any],
-) -> ConfigEntry:
-    """Create a mock config entry."""
-    entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title='Test Anthem',
-        data=mock_config_entry_data,
-        source='user',
-        options=mock_config_entry_options,
-        unique_id='/dev/ttyUSB0_123456',
-        entry_id='test_entry_id',
-    )
-    return entry
+from custom_components.anthemav_serial.protocol import (
+    VOLUME_STEP,
+    AnthemGen1Client,
+    volume_to_db,
+)
 
 
 async def test_coordinator_initialization(
@@ -202,3 +204,876 @@ async def test_coordinator_operations_when_not_connected(
     await coordinator.async_volume_down(1)
 
     assert not coordinator.is_connected
+
+
+@pytest.mark.parametrize(
+    'mock_config_entry', [{CONF_PIPELINED_POLLING: True}], indirect=True
+)
+async def test_coordinator_pipelined_update_isolates_zone_errors(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test pipelined polling keeps good zones when one zone fails."""
+    mock_amp.is_connected = True
+    mock_amp.zone_status_many = AsyncMock(
+        return_value={
+            1: {'power': True, 'volume': 0.5, 'mute': False, 'source': 1},
+            2: TimeoutError('No status response for zone 2'),
+            3: {'power': False},
+        }
+    )
+
+    with patch(
+        'custom_components.anthemav_serial.coordinator.async_open_client',
+        new_callable=AsyncMock,
+        return_value=mock_amp,
+    ) as mock_open:
+        coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+        data = await coordinator._async_update_data()
+
+    mock_open.assert_called_once()
+    mock_amp.zone_status_many.assert_called_once_with([1, 2, 3])
+    mock_amp.zone_status.assert_not_called()
+    assert data[1]['volume'] == 0.5
+    assert data[2] == {}
+    assert data[3] == {'power': False}
+
+
+@pytest.mark.parametrize(
+    'mock_config_entry', [{CONF_PUSH_UPDATES: True}], indirect=True
+)
+async def test_coordinator_push_updates(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test unsolicited status is merged and polling drops to a safety sweep."""
+    listeners: list = []
+    mock_amp.add_listener = MagicMock(side_effect=listeners.append)
+    mock_amp.add_disconnect_listener = MagicMock()
+
+    with patch(
+        'custom_components.anthemav_serial.coordinator.async_open_client',
+        new_callable=AsyncMock,
+        return_value=mock_amp,
+    ):
+        coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+        await coordinator.async_refresh()
+
+    assert coordinator.update_interval == timedelta(seconds=PUSH_SAFETY_SCAN_INTERVAL)
+    assert len(listeners) == 1
+
+    listeners[0](1, {'zone': 1, 'volume': 0.3})
+    assert coordinator.data[1]['volume'] == 0.3
+    assert coordinator.data[1]['source'] == 1
+
+    listeners[0](2, {'zone': 2, 'power': False})
+    assert coordinator.data[2] == {'zone': 2, 'power': False}
+
+    # a zone turned on is read in full right away
+    mock_amp.zone_status.reset_mock()
+    listeners[0](2, {'zone': 2, 'power': True})
+    await hass.async_block_till_done()
+    mock_amp.zone_status.assert_awaited_once_with(2)
+    assert coordinator.data[2]['source'] == 1
+
+
+async def test_coordinator_command_refreshes_only_affected_zone(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a command re-reads only its own zone and keeps the others."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.zone_status.reset_mock()
+    mock_amp.zone_status.return_value = {
+        'power': True,
+        'volume': 0.75,
+        'mute': False,
+        'source': 1,
+    }
+
+    await coordinator.async_set_volume(2, 0.75)
+
+    mock_amp.zone_status.assert_called_once_with(2)
+    assert coordinator.data[2]['volume'] == 0.75
+    assert coordinator.data[1]['volume'] == 0.5
+    assert coordinator.data[3]['volume'] == 0.5
+
+
+@pytest.fixture
+def mock_optimistic_config_entry(
+    config_entry_factory: Callable[..., ConfigEntry],
+) -> ConfigEntry:
+    """Create a mock config entry with optimistic state enabled."""
+    return config_entry_factory(
+        options={CONF_OPTIMISTIC: True, CONF_RECONCILE_TIMEOUT: 5}
+    )
+
+
+async def test_coordinator_optimistic_state_rolls_back_after_timeout(
+    hass: HomeAssistant,
+    mock_optimistic_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test an unconfirmed change is shown until the reconciliation timeout."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_optimistic_config_entry)
+    await coordinator.async_refresh()
+
+    # the device keeps reporting the zone as on
+    await coordinator.async_set_power(1, False)
+    assert coordinator.data[1]['power'] is False
+
+    with patch(
+        'custom_components.anthemav_serial.coordinator.time.monotonic',
+        return_value=time.monotonic() + 10,
+    ):
+        await coordinator.async_refresh_zone(1)
+
+    assert coordinator.data[1]['power'] is True
+    await coordinator.async_disconnect()
+
+
+async def test_coordinator_optimistic_state_confirmed(
+    hass: HomeAssistant,
+    mock_optimistic_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a change the device reports is kept after the timeout."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_optimistic_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.zone_status.return_value = {
+        'power': True,
+        'volume': 0.5,
+        'mute': False,
+        'source': 2,
+    }
+
+    await coordinator.async_set_source(1, 2)
+
+    with patch(
+        'custom_components.anthemav_serial.coordinator.time.monotonic',
+        return_value=time.monotonic() + 10,
+    ):
+        await coordinator.async_refresh_zone(1)
+
+    assert coordinator.data[1]['source'] == 2
+    await coordinator.async_disconnect()
+
+
+async def test_coordinator_optimistic_state_failed_command(
+    hass: HomeAssistant,
+    mock_optimistic_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a failed command rolls back its optimistic change immediately."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_optimistic_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.set_mute.side_effect = OSError('write failed')
+
+    await coordinator.async_set_mute(1, True)
+
+    assert coordinator.data[1]['mute'] is False
+    await coordinator.async_disconnect()
+
+
+async def _slow_write(*args: Any) -> None:
+    """Simulate the time a command takes on the serial link."""
+    await asyncio.sleep(0.01)
+
+
+async def test_coordinator_coalesces_volume_burst(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a burst of absolute volume calls sends a bounded number of writes."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.set_volume.side_effect = _slow_write
+
+    levels = [i / 100 for i in range(20, 40)]
+    await asyncio.gather(*(coordinator.async_set_volume(1, v) for v in levels))
+
+    # the first call goes out at once, the rest collapse into the newest level
+    assert mock_amp.set_volume.call_count == 2
+    assert mock_amp.set_volume.call_args_list[-1].args == (1, levels[-1])
+
+
+async def test_coordinator_folds_volume_steps(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test queued volume steps net into one level, stopping at max volume."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.set_volume.side_effect = _slow_write
+
+    # current volume is 0.5; max volume is 0.6, 19 steps above it
+    await asyncio.gather(*(coordinator.async_volume_up(1) for _ in range(30)))
+
+    # the first press goes out at once, the other 29 as one level limited to
+    # the headroom
+    levels = [call.args[1] for call in mock_amp.set_volume.await_args_list]
+    assert levels == pytest.approx([0.5 + VOLUME_STEP, 0.5 + 19 * VOLUME_STEP])
+    mock_amp.volume_up.assert_not_called()
+
+    # opposite steps queued together cancel out
+    mock_amp.reset_mock()
+    await asyncio.gather(
+        coordinator.async_volume_down(1),
+        coordinator.async_volume_down(1),
+        coordinator.async_volume_up(1),
+        coordinator.async_volume_down(1),
+    )
+    levels = [call.args[1] for call in mock_amp.set_volume.await_args_list]
+    assert levels == pytest.approx([0.5 - VOLUME_STEP, 0.5 - VOLUME_STEP])
+    mock_amp.volume_down.assert_not_called()
+
+
+async def test_coordinator_steps_unknown_volume(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test steps for a zone whose volume was not read go out one by one."""
+    mock_amp.zone_status.return_value = {'power': True}
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.volume_down.side_effect = _slow_write
+
+    await asyncio.gather(*(coordinator.async_volume_down(1) for _ in range(4)))
+
+    assert mock_amp.volume_down.await_count == 1 + 3
+    mock_amp.set_volume.assert_not_called()
+
+
+async def test_coordinator_command_preempts_poll(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a command issued mid-poll is sent before the remaining zones."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_connect()
+    calls: list[str] = []
+    first_zone_started = asyncio.Event()
+
+    async def zone_status(zone: int) -> dict[str, Any]:
+        calls.append(f'status {zone}')
+        first_zone_started.set()
+        await asyncio.sleep(0.01)
+        return {'power': True, 'volume': 0.5, 'mute': False, 'source': 1}
+
+    async def set_power(zone: int, power: bool) -> None:
+        calls.append(f'power {zone}')
+
+    mock_amp.zone_status.side_effect = zone_status
+    mock_amp.set_power.side_effect = set_power
+
+    poll = asyncio.create_task(coordinator._async_update_data())
+    await first_zone_started.wait()
+    await coordinator.async_set_power(3, False)
+    await poll
+
+    assert calls[:3] == ['status 1', 'power 3', 'status 2']
+    assert coordinator.scheduler.queue_depth == 0
+
+
+@pytest.mark.parametrize(
+    'mock_config_entry',
+    [
+        {
+            CONF_ADAPTIVE_POLLING: True,
+            CONF_MIN_SCAN_INTERVAL: 2,
+            CONF_MAX_SCAN_INTERVAL: 30,
+        }
+    ],
+    indirect=True,
+)
+async def test_coordinator_adaptive_polling(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test the poll interval backs off in standby and speeds up on activity."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+
+    # every zone in standby: back off gradually up to the ceiling
+    mock_amp.zone_status.return_value = {'power': False}
+    intervals = []
+    for _ in range(4):
+        await coordinator._async_update_data()
+        intervals.append(coordinator.update_interval.total_seconds())
+    assert intervals == [15.0, 22.5, 30.0, 30.0]
+
+    # a command switches to the floor
+    await coordinator.async_set_power(1, True)
+    assert coordinator.update_interval == timedelta(seconds=2)
+
+    # a zone on without recent activity polls at the scan interval
+    mock_amp.zone_status.return_value = {'power': True}
+    with patch(
+        'custom_components.anthemav_serial.coordinator.time.monotonic',
+        return_value=time.monotonic() + 120,
+    ):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=10)
+
+
+async def test_coordinator_wakes_zone_in_one_query(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a zone turned on in standby is read with its single status query."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    mock_amp.zone_status.return_value = {'power': False}
+    await coordinator._async_update_data()
+
+    # zone 1 was turned on at the front panel, zones 2 and 3 are still off
+    mock_amp.zone_status.reset_mock()
+    mock_amp.zone_status.side_effect = lambda zone: (
+        {'power': True, 'volume': 0.5} if zone == 1 else {'power': False}
+    )
+
+    data = await coordinator._async_update_data()
+
+    assert [call.args for call in mock_amp.zone_status.await_args_list] == [
+        (1,),
+        (2,),
+        (3,),
+    ]
+    mock_amp.send_command.assert_not_called()
+    assert data[1] == {'power': True, 'volume': 0.5}
+    assert data[2] == {'power': False}
+
+
+async def test_coordinator_tracks_changed_zones(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test only zones whose data changed are reported as changed."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+    assert all(coordinator.zone_changed(zone) for zone in (1, 2, 3))
+
+    await coordinator.async_refresh()
+    assert not any(coordinator.zone_changed(zone) for zone in (1, 2, 3))
+
+    mock_amp.zone_status.return_value = {'power': True, 'volume': 0.4}
+    await coordinator.async_refresh_zone(2)
+    assert coordinator.zone_changed(2)
+    assert not coordinator.zone_changed(1)
+
+
+async def test_coordinator_backs_off_after_connect_failure(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test failed connects are not retried until the back-off has elapsed."""
+    with patch(
+        'custom_components.anthemav_serial.coordinator.get_async_amp_controller',
+        new_callable=AsyncMock,
+        side_effect=OSError('No such device'),
+    ) as mock_controller:
+        coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+        assert await coordinator.async_connect() is False
+        assert coordinator.connection_state is ConnectionState.BACKING_OFF
+
+        # fast-fail while backing off, without touching the port
+        assert await coordinator.async_connect() is False
+        assert mock_controller.call_count == 1
+
+        with patch(
+            'custom_components.anthemav_serial.coordinator.time.monotonic',
+            return_value=time.monotonic() + 60,
+        ):
+            assert await coordinator.async_connect() is False
+        assert mock_controller.call_count == 2
+
+    assert coordinator.connection_stats['consecutive_failures'] == 2
+
+
+async def test_coordinator_reconnects_when_port_reappears(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a missing port coming back skips the remaining back-off."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    with (
+        patch(
+            'custom_components.anthemav_serial.coordinator.get_async_amp_controller',
+            new_callable=AsyncMock,
+            side_effect=[OSError('No such device'), mock_amp],
+        ),
+        patch(
+            'custom_components.anthemav_serial.coordinator.os.path.exists',
+            return_value=False,
+        ) as mock_exists,
+    ):
+        assert await coordinator.async_connect() is False
+        assert await coordinator.async_connect() is False
+
+        mock_exists.return_value = True
+        assert await coordinator.async_connect() is True
+
+    assert coordinator.connection_state is ConnectionState.CONNECTED
+
+
+async def test_coordinator_discovers_zones(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test only zones that answer the probe are polled and the result is cached."""
+    # zone 3 is not wired, so its power query gets no reply
+    mock_amp.send_command.side_effect = lambda command, args, **kwargs: (
+        None if args['zone'] == 3 else f'P{args["zone"]}P1'
+    )
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+
+    with patch.object(hass.config_entries, 'async_update_entry') as mock_update:
+        data = await coordinator._async_update_data()
+
+    assert coordinator.zones == [1, 2]
+    assert set(data) == {1, 2}
+    assert mock_update.call_args.kwargs['data'][CONF_DISCOVERED_ZONES] == {
+        '/dev/ttyUSB0|d2v': [1, 2]
+    }
+
+
+async def test_coordinator_uses_cached_zones(
+    hass: HomeAssistant,
+    config_entry_factory: Callable[..., ConfigEntry],
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test cached zones are reused without probing, unless the series changed."""
+    entry = config_entry_factory(
+        data={CONF_DISCOVERED_ZONES: {'/dev/ttyUSB0|d2v': [1]}}
+    )
+    coordinator = AnthemAVSerialCoordinator(hass, entry)
+
+    data = await coordinator._async_update_data()
+
+    assert coordinator.zones == [1]
+    assert set(data) == {1}
+    mock_amp.send_command.assert_not_called()
+
+    entry = config_entry_factory(data={**entry.data, CONF_SERIES: 'd2'})
+    assert AnthemAVSerialCoordinator(hass, entry).zones == [1, 2, 3]
+
+
+async def test_coordinator_polls_only_enabled_zones(
+    hass: HomeAssistant,
+    config_entry_factory: Callable[..., ConfigEntry],
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test zones disabled in the options are never queried."""
+    entry = config_entry_factory(
+        data={CONF_DISCOVERED_ZONES: {'/dev/ttyUSB0|d2v': [1, 2, 3]}},
+        options={CONF_ZONES: ['1']},
+    )
+    coordinator = AnthemAVSerialCoordinator(hass, entry)
+
+    data = await coordinator._async_update_data()
+
+    assert coordinator.zones == [1]
+    assert set(data) == {1}
+    mock_amp.zone_status.assert_called_once_with(1)
+
+
+async def test_coordinator_records_link_metrics(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test connects, polls, zone reads and commands are timed and counted."""
+    status = {'power': True, 'volume': 0.5, 'mute': False, 'source': 1}
+    mock_amp.zone_status.side_effect = [status, TimeoutError(), status, status]
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+
+    with patch.object(hass.config_entries, 'async_update_entry'):
+        await coordinator._async_update_data()
+    await coordinator.async_set_mute(1, True)
+
+    metrics = coordinator.metrics
+    assert metrics.get('connect').success == 1
+    assert metrics.get('refresh').success == 1
+    assert metrics.get('zone_status_1').success == 2
+    assert metrics.get('zone_status_2').timeout == 1
+    assert metrics.get('zone_status_2').last_error_at is not None
+    assert metrics.get('set_mute').success == 1
+    assert metrics.as_dict()['zone_status_3']['count'] == 1
+    assert coordinator.last_poll_duration == metrics.get('refresh').last_ms
+    assert coordinator.command_latency_p95 == metrics.get('set_mute').last_ms
+
+
+async def test_coordinator_serial_traffic_rate(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test the traffic rate is taken from the native client's byte counters."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    client = AnthemGen1Client()
+    coordinator._amp = client
+
+    with patch(
+        'custom_components.anthemav_serial.coordinator.time.monotonic'
+    ) as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        coordinator.async_update_listeners()
+        assert coordinator.serial_bytes_per_minute is None
+
+        client.bytes_sent, client.bytes_received = 40, 80
+        mock_monotonic.return_value = 130.0
+        coordinator.async_update_listeners()
+        assert coordinator.serial_bytes_per_minute == 240.0
+
+        # a new client after a reconnect starts counting from zero
+        client.bytes_sent, client.bytes_received = 0, 10
+        mock_monotonic.return_value = 160.0
+        coordinator.async_update_listeners()
+        assert coordinator.serial_bytes_per_minute is None
+
+
+async def test_coordinator_restores_snapshot_with_minimal_commands(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a restore only sends the settings that changed since the snapshot."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_connect()
+    # set above the volume limit on the front panel
+    saved = {'power': True, 'volume': 0.8, 'mute': False, 'source': 1}
+    coordinator.async_set_updated_data({1: saved, 2: saved, 3: saved})
+    coordinator.async_take_snapshot()
+
+    # an announcement changed zone 1's volume and turned zone 3 off
+    coordinator.async_set_updated_data(
+        {1: {**saved, 'volume': 0.3}, 2: saved, 3: {'power': False}}
+    )
+    mock_amp.reset_mock()
+    mock_amp.send_command.return_value = 'P3P1'
+    await coordinator.async_restore_snapshot()
+
+    # zone 3 is on before anything else is sent; saved levels are not clamped
+    assert [call[0] for call in mock_amp.method_calls[:3]] == [
+        'set_power',
+        'send_command',
+        'set_volume',
+    ]
+    mock_amp.send_command.assert_awaited_once_with(
+        'power_status', {'zone': 3}, wait_for_reply=True
+    )
+    assert mock_amp.set_volume.await_args_list[0].args == (1, 0.8)
+    assert [call[0] for call in mock_amp.method_calls if call[1][0] == 3] == [
+        'set_power',
+        'set_source',
+        'set_volume',
+        'set_mute',
+        'zone_status',
+    ]
+    assert not [call for call in mock_amp.method_calls if call[1][0] == 2]
+    assert mock_amp.zone_status.await_count == 2
+
+
+async def test_coordinator_restore_without_snapshot(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test restoring before a snapshot was taken is an error."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+
+    with pytest.raises(HomeAssistantError):
+        coordinator.async_take_snapshot()
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_restore_snapshot()
+
+
+async def test_coordinator_batch_sends_one_burst(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a batch holds the link for all commands and reads each zone once."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_connect()
+
+    with patch.object(
+        coordinator.scheduler, 'slot', wraps=coordinator.scheduler.slot
+    ) as mock_slot:
+        await coordinator.async_batch(
+            [(1, 'power', False), (2, 'power', False), (2, 'volume', 0.9)]
+        )
+
+    assert [call[0] for call in mock_amp.method_calls] == [
+        'set_power',
+        'set_power',
+        'set_volume',
+        'zone_status',
+        'zone_status',
+    ]
+    # clamped to the volume limit
+    assert mock_amp.set_volume.await_args.args == (2, DEFAULT_MAX_VOLUME)
+    assert mock_slot.call_count == 2
+
+
+async def test_coordinator_batch_powers_on_first(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a zone turned on by a batch gets its settings once it is on."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_connect()
+    mock_amp.send_command.return_value = 'P2P1'
+
+    await coordinator.async_batch(
+        [(2, 'power', True), (2, 'source', 3), (2, 'volume', 0.4)]
+    )
+
+    assert [call[0] for call in mock_amp.method_calls] == [
+        'set_power',
+        'send_command',
+        'set_source',
+        'set_volume',
+        'zone_status',
+    ]
+    mock_amp.set_power.assert_awaited_once_with(2, True)
+
+
+async def test_coordinator_batch_failure(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a failed batch raises and skips the refresh."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_connect()
+    mock_amp.set_mute.side_effect = OSError('port closed')
+
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_batch([(1, 'mute', True)])
+
+    mock_amp.zone_status.assert_not_called()
+
+
+async def test_coordinator_group_follows_leader(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test joined zones are synced to the leader and follow its changes."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.reset_mock()
+
+    await coordinator.async_join(1, [2, 3])
+
+    assert coordinator.group(3) == [1, 2, 3]
+    assert [call[0] for call in mock_amp.method_calls[:6]] == [
+        'set_source',
+        'set_volume',
+        'set_mute',
+        'set_source',
+        'set_volume',
+        'set_mute',
+    ]
+
+    mock_amp.reset_mock()
+    await coordinator.async_set_source(1, 3)
+
+    assert [call.args for call in mock_amp.set_source.await_args_list] == [
+        (1, 3),
+        (2, 3),
+        (3, 3),
+    ]
+    assert mock_amp.zone_status.await_count == 3
+
+    # a step moves every zone from its own volume
+    mock_amp.reset_mock()
+    await coordinator.async_volume_down(1)
+
+    assert [call.args for call in mock_amp.set_volume.await_args_list] == [
+        (zone, pytest.approx(0.5 - VOLUME_STEP)) for zone in (1, 2, 3)
+    ]
+    mock_amp.volume_down.assert_not_called()
+
+    # a burst of leader levels collapses into the newest, sent to every zone
+    mock_amp.reset_mock()
+    mock_amp.set_volume.side_effect = _slow_write
+    await asyncio.gather(
+        *(coordinator.async_set_volume(1, level) for level in (0.3, 0.35, 0.4))
+    )
+
+    assert [call.args for call in mock_amp.set_volume.await_args_list] == [
+        (zone, level) for level in (0.3, 0.4) for zone in (1, 2, 3)
+    ]
+
+    coordinator.async_unjoin(2)
+    assert coordinator.group(1) == [1, 3]
+    coordinator.async_unjoin(1)
+    assert coordinator.group(3) == []
+
+
+async def test_coordinator_ramps_volume(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a ramp sends clamped levels along the curve and reads the zone once."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.reset_mock()
+
+    with patch(
+        'custom_components.anthemav_serial.coordinator.RAMP_STEP_INTERVAL', 0.01
+    ):
+        await coordinator.async_ramp_volume(1, 0.9, 0.04, 'ease_in')
+        # the service call returns once the ramp is scheduled
+        mock_amp.set_volume.assert_not_awaited()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    levels = [call.args[1] for call in mock_amp.set_volume.await_args_list]
+    assert levels == pytest.approx([0.50625, 0.525, 0.55625, DEFAULT_MAX_VOLUME])
+    mock_amp.zone_status.assert_awaited_once_with(1)
+
+
+async def test_coordinator_ramp_skips_repeated_settings(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a slow ramp sends each 0.5 dB setting once, not every step."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.reset_mock()
+
+    with patch(
+        'custom_components.anthemav_serial.coordinator.RAMP_STEP_INTERVAL', 0.01
+    ):
+        await coordinator.async_ramp_volume(1, 0.5 + 3 * VOLUME_STEP, 0.2)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # 20 steps over three settings above the starting -48 dB
+    levels = [call.args[1] for call in mock_amp.set_volume.await_args_list]
+    assert [volume_to_db(level) for level in levels] == [-47.5, -47.0, -46.5]
+
+
+async def test_coordinator_ramp_cancelled_by_command(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a user command for the zone stops a running ramp."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+
+    await coordinator.async_ramp_volume(1, 0.0, 1)
+    await asyncio.sleep(0.05)
+    await coordinator.async_set_mute(1, True)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert mock_amp.set_volume.await_count == 1
+    await coordinator.async_disconnect()
+
+
+@pytest.mark.parametrize(
+    'mock_config_entry',
+    [{CONF_PRESETS: 'KEXP: FM 90.3\nCBC Radio One: AM 690'}],
+    indirect=True,
+)
+async def test_coordinator_tuner_presets(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_get_async_amp_controller: AsyncMock,
+    mock_amp: MagicMock,
+    mock_device_config: dict,
+) -> None:
+    """Test a preset only tunes or switches the source when it has to."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    await coordinator.async_refresh()
+    mock_amp.reset_mock()
+    mock_amp.zone_status.return_value = {**mock_amp.zone_status.return_value}
+    mock_amp.zone_status.return_value['source'] = 2
+
+    await coordinator.async_select_preset(1, 'KEXP')
+    mock_amp.send_command.assert_awaited_once_with('fm_tune', {'channel': 90.3})
+    mock_amp.set_source.assert_awaited_once_with(1, 2)
+    assert coordinator.active_preset == 'KEXP'
+
+    # already on the tuner and still tuned: only the tuner is read
+    mock_amp.reset_mock()
+    mock_amp.send_command.return_value = 'TFT090.3'
+    await coordinator.async_select_preset(1, 'KEXP')
+    mock_amp.send_command.assert_awaited_once_with(
+        'tuner_frequeny', {}, wait_for_reply=True
+    )
+    mock_amp.set_source.assert_not_called()
+
+    # another station on the tuner only retunes, and rewrites the zone
+    mock_amp.reset_mock()
+    await coordinator.async_select_preset(1, 'CBC Radio One')
+    mock_amp.send_command.assert_awaited_once_with('am_tune', {'channel': 690})
+    mock_amp.set_source.assert_not_called()
+    assert coordinator.zone_changed(1)
+    assert coordinator.active_preset == 'CBC Radio One'
@@ -0,0 +1,62 @@
+"""Tests for the shared device configuration index."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+import pytest
+
+from custom_components.anthemav_serial.device_index import (
+    build_series_index,
+    clear_series_indexes,
+    get_series_index,
+)
+
+DEVICE_CONFIG = {
+    'd2v': {
+        'sources': {
+            '1': {'name': 'CD'},
+            2: 'Tuner',
+            3: {'name': 'Video 1'},
+            4: {'label': 'no name'},
+            'd': 'DVD 2',
+        }
+    },
+}
+
+
+def test_build_series_index() -> None:
+    """Test sources are normalized into immutable lookups in both directions."""
+    index = build_series_index('d2v', DEVICE_CONFIG['d2v'])
+
+    assert index.source_names == {1: 'CD', 2: 'Tuner', 3: 'Video 1', 'd': 'DVD 2'}
+    assert index.source_ids == {'CD': 1, 'Tuner': 2, 'Video 1': 3, 'DVD 2': 'd'}
+    assert index.source_list == ('CD', 'Tuner', 'Video 1', 'DVD 2')
+    assert index.zones == (1, 2, 3)
+    assert index.tuner_source == 2
+    assert isinstance(index.source_names, MappingProxyType)
+    with pytest.raises(TypeError):
+        index.source_names[5] = 'Aux'  # type: ignore[index]
+
+
+def test_generic_source_names() -> None:
+    """Test unknown source ids round-trip through their generic name."""
+    index = build_series_index('d2v', DEVICE_CONFIG['d2v'])
+
+    assert index.source_name(7) == 'Source 7'
+    assert index.source_id('Source 7') == 7
+    assert index.source_id('Tuner') == 2
+    assert index.source_name('e') == 'Source e'
+    assert index.source_id('Source e') == 'e'
+    assert index.source_id('Radio') is None
+
+
+def test_index_is_shared_per_series() -> None:
+    """Test the index of a series is built once and shared."""
+    clear_series_indexes()
+
+    first = get_series_index('d2v', DEVICE_CONFIG)
+
+    assert get_series_index('d2v', DEVICE_CONFIG) is first
+    assert get_series_index('d2', DEVICE_CONFIG).source_names == {}
+    clear_series_indexes()
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import timedelta
-from typing import Any
 from unittest.mock import MagicMock
 
 from homeassistant.config_entries import ConfigEntry
@@ -12,6 +12,7 @@ from homeassistant.core import HomeAssistant
 import pytest
 
 from custom_components.anthemav_serial.const import (
+    CONF_DISCOVERED_ZONES,
     CONF_SERIAL_NUMBER,
     DOMAIN,
 )
@@ -40,21 +41,13 @@ def mock_coordinator() -> MagicMock:
 async def test_diagnostics_redacts_sensitive_data(
     hass: HomeAssistant,
     mock_coordinator: MagicMock,
-    mock_config_entry_data: dict[str, Any],
-    mock_config_entry_options: dict[str, Any],
+    config_entry_factory: Callable[..., ConfigEntry],
 ) -> None:
     """Test diagnostics redacts sensitive information."""
-    entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title='Test Anthem',
-        data=mock_config_entry_data,
-        source='user',
-        options=mock_config_entry_options,
-        unique_id='/dev/ttyUSB0_123456',
-        entry_id='test_entry_id',
+    entry = config_entry_factory(
+        data={CONF_DISCOVERED_ZONES: {'/dev/ttyUSB0|d2v': [1, 2]}}
     )
+    mock_coordinator.discovered_zones = [1, 2]
 
     hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
 
@@ -63,30 +56,21 @@ async def test_diagnostics_redacts_sensitive_data(
     # check that sensitive keys are redacted
     assert diagnostics['config_entry']['data'][CONF_PORT] == '**REDACTED**'
     assert diagnostics['config_entry']['data'][CONF_SERIAL_NUMBER] == '**REDACTED**'
+    # the zone cache is keyed by the port
+    assert diagnostics['config_entry']['data'][CONF_DISCOVERED_ZONES] == '**REDACTED**'
+    assert diagnostics['coordinator']['discovered_zones'] == [1, 2]
+    assert '/dev/ttyUSB0' not in str(diagnostics)
 
 
 async def test_diagnostics_includes_coordinator_info(
     hass: HomeAssistant,
     mock_coordinator: MagicMock,
-    mock_config_entry_data: dict[str, Any],
-    mock_config_entry_options: dict[str, Any],
+    mock_config_entry: ConfigEntry,
 ) -> None:
     """Test diagnostics includes coordinator information."""
-    entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title='Test Anthem',
-        data=mock_config_entry_data,
-        source='user',
-        options=mock_config_entry_options,
-        unique_id='/dev/ttyUSB0_123456',
-        entry_id='test_entry_id',
-    )
-
-    hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_coordinator}
 
-    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
 
     assert diagnostics['coordinator']['series'] == 'd2v'
     assert diagnostics['coordinator']['is_connected'] is True
@@ -97,25 +81,12 @@ async def test_diagnostics_includes_coordinator_info(
 async def test_diagnostics_includes_zone_data(
     hass: HomeAssistant,
     mock_coordinator: MagicMock,
-    mock_config_entry_data: dict[str, Any],
-    mock_config_entry_options: dict[str, Any],
+    mock_config_entry: ConfigEntry,
 ) -> None:
     """Test diagnostics includes zone data."""
-    entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title='Test Anthem',
-        data=mock_config_entry_data,
-        source='user',
-        options=mock_config_entry_options,
-        unique_id='/dev/ttyUSB0_123456',
-        entry_id='test_entry_id',
-    )
-
-    hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_coordinator}
 
-    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
 
     assert 1 in diagnostics['zone_data']
     assert diagnostics['zone_data'][1]['power'] is True
@@ -0,0 +1,83 @@
+"""Import-time benchmark for the integration.
+
+Loading the integration (for example to show the config flow) must not import
+the anthemav_serial library or pyserial; they are loaded when a receiver first
+connects. The import times of the integration's own modules and of the
+deferred libraries are recorded as test properties (e.g. in the JUnit XML
+report).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# modules that must only be imported once a coordinator connects
+LAZY_MODULES = ('anthemav_serial', 'serial', 'serial_asyncio')
+
+# time the integration's own module bodies may take, excluding the modules of
+# Home Assistant they import, in microseconds
+OWN_IMPORT_BUDGET_US = 50_000
+
+
+def _import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Import a module in a fresh interpreter and return its import times.
+
+    Maps every module imported to its (self, cumulative) microseconds, as
+    reported by ``python -X importtime``.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative, name = line.removeprefix('import time:').split('|')
+        times[name.strip()] = (int(self_us), int(cumulative))
+    return times
+
+
+@pytest.mark.parametrize(
+    'module',
+    [
+        'custom_components.anthemav_serial',
+        'custom_components.anthemav_serial.config_flow',
+        'custom_components.anthemav_serial.media_player',
+    ],
+)
+def test_import_does_not_load_serial_library(
+    module: str, record_property: Callable[[str, object], None]
+) -> None:
+    """Test importing the integration leaves the serial library unloaded."""
+    times = _import_times(module)
+    own = sum(
+        self_us
+        for name, (self_us, _) in times.items()
+        if name.startswith('custom_components.anthemav_serial')
+    )
+
+    record_property('import_ms', times[module][1] / 1000)
+    record_property('own_import_ms', own / 1000)
+    assert not [name for name in LAZY_MODULES if name in times]
+    assert own < OWN_IMPORT_BUDGET_US
+
+
+def test_deferred_library_import_time(
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Record the import time moved from loading the integration to connecting."""
+    pytest.importorskip('anthemav_serial')
+    times = _import_times('anthemav_serial.config')
+
+    record_property('deferred_import_ms', times['anthemav_serial.config'][1] / 1000)
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.components.media_player import MediaPlayerState
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.anthemav_serial.const import (
     DEFAULT_MAX_VOLUME,
     DOMAIN,
 )
 from custom_components.anthemav_serial.coordinator import AnthemAVSerialCoordinator
+from custom_components.anthemav_serial.device_index import build_series_index
 from custom_components.anthemav_serial.media_player import AnthemAVSerialMediaPlayer
+from custom_components.anthemav_serial.presets import parse_presets
 
 
 @pytest.fixture
@@ -24,6 +29,11 @@ def mock_coordinator(
     """Create a mock coordinator."""
     coordinator = MagicMock(spec=AnthemAVSerialCoordinator)
     coordinator.sources = {1: 'CD', 2: 'Tuner', 3: 'Video 1'}
+    coordinator.index = build_series_index(
+        'd2v', {'sources': {1: {'name': 'CD'}, 2: 'Tuner', 3: {'name': 'Video 1'}}}
+    )
+    coordinator.presets = {}
+    coordinator.active_preset = None
     coordinator.zones = [1, 2, 3]
     coordinator.series = 'd2v'
     coordinator.data = {
@@ -37,6 +47,7 @@ def mock_coordinator(
     coordinator.async_volume_down = AsyncMock()
     coordinator.async_set_mute = AsyncMock()
     coordinator.async_set_source = AsyncMock()
+    coordinator.async_select_preset = AsyncMock()
     return coordinator
 
 
@@ -116,6 +127,17 @@ def test_media_player_source_list(media_player: AnthemAVSerialMediaPlayer) -> No
     assert 'Video 1' in sources
 
 
+def test_media_player_unknown_source(
+    media_player: AnthemAVSerialMediaPlayer,
+) -> None:
+    """Test an unknown source gets a generic name without changing the index."""
+    media_player.coordinator.data[1]['source'] = 7
+
+    assert media_player.source == 'Source 7'
+    assert 7 not in media_player.coordinator.index.source_names
+    assert 'Source 7' not in media_player.source_list
+
+
 async def test_media_player_turn_on(media_player: AnthemAVSerialMediaPlayer) -> None:
     """Test turn on calls coordinator."""
     await media_player.async_turn_on()
@@ -171,9 +193,127 @@ async def test_media_player_select_source(
     media_player.coordinator.async_set_source.assert_called_once_with(1, 2)
 
 
+async def test_media_player_tuner_presets(
+    media_player: AnthemAVSerialMediaPlayer,
+) -> None:
+    """Test presets follow the sources and show as the source while tuned."""
+    coordinator = media_player.coordinator
+    coordinator.presets = parse_presets('KEXP: FM 90.3\nCBC Radio One: AM 690')
+
+    assert media_player.source_list == [
+        'CD',
+        'Tuner',
+        'Video 1',
+        'KEXP',
+        'CBC Radio One',
+    ]
+
+    await media_player.async_select_source('KEXP')
+    coordinator.async_select_preset.assert_called_once_with(1, 'KEXP')
+    coordinator.async_set_source.assert_not_called()
+
+    coordinator.data[1]['source'] = 2
+    assert media_player.source == 'Tuner'
+    coordinator.active_preset = 'KEXP'
+    assert media_player.source == 'KEXP'
+
+
 async def test_media_player_select_invalid_source(
     media_player: AnthemAVSerialMediaPlayer,
 ) -> None:
     """Test select invalid source does not call coordinator."""
     await media_player.async_select_source('Invalid Source')
     media_player.coordinator.async_set_source.assert_not_called()
+
+
+def test_media_player_skips_unchanged_state_write(
+    media_player: AnthemAVSerialMediaPlayer,
+) -> None:
+    """Test no state is written when the zone did not change."""
+    media_player.coordinator.zone_changed.return_value = False
+
+    with patch.object(media_player, 'async_write_ha_state') as mock_write:
+        media_player._handle_coordinator_update()
+
+    mock_write.assert_not_called()
+    media_player.coordinator.async_record_state_write.assert_called_once_with(False)
+
+
+def test_media_player_writes_changed_state(
+    media_player: AnthemAVSerialMediaPlayer,
+) -> None:
+    """Test state is written when the zone changed."""
+    media_player.coordinator.zone_changed.return_value = True
+
+    with patch.object(media_player, 'async_write_ha_state') as mock_write:
+        media_player._handle_coordinator_update()
+
+    mock_write.assert_called_once()
+    media_player.coordinator.zone_changed.assert_called_once_with(1)
+
+
+async def test_media_player_restores_last_state(
+    media_player: AnthemAVSerialMediaPlayer,
+) -> None:
+    """Test the saved state is shown until the coordinator has polled."""
+    media_player.coordinator.data = None
+    last_state = State(
+        'media_player.main_zone',
+        'on',
+        {'volume_level': 0.4, 'is_volume_muted': False, 'source': 'Tuner'},
+    )
+
+    with patch.object(
+        media_player, 'async_get_last_state', AsyncMock(return_value=last_state)
+    ):
+        await media_player._async_restore_last_state()
+
+    assert media_player.state == MediaPlayerState.ON
+    assert media_player.volume_level == 0.4
+    assert media_player.is_volume_muted is False
+    assert media_player.source == 'Tuner'
+
+    # once polled, the device state replaces the restored one
+    media_player.coordinator.data = {1: {'power': False}}
+    assert media_player.state == MediaPlayerState.OFF
+    assert media_player.source is None
+
+
+async def test_media_player_group_members_from_own_entry(
+    hass: HomeAssistant,
+    media_player: AnthemAVSerialMediaPlayer,
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test group members are the zones registered by this receiver's entry."""
+    own_entry = MockConfigEntry(domain=DOMAIN, entry_id='own_entry')
+    other_entry = MockConfigEntry(domain=DOMAIN, entry_id='other_entry')
+    own_entry.add_to_hass(hass)
+    other_entry.add_to_hass(hass)
+    mock_coordinator.config_entry = own_entry
+    mock_coordinator.group.return_value = [1, 2, 3]
+
+    entity_registry = er.async_get(hass)
+    for zone_id, name in ((1, 'living_room'), (2, 'kitchen')):
+        entity_registry.async_get_or_create(
+            'media_player',
+            DOMAIN,
+            f'{DOMAIN}_123456_{zone_id}',
+            config_entry=own_entry,
+            suggested_object_id=name,
+        )
+    # zone 3 is only registered by another receiver
+    entity_registry.async_get_or_create(
+        'media_player',
+        DOMAIN,
+        f'{DOMAIN}_123456_3',
+        config_entry=other_entry,
+        suggested_object_id='patio',
+    )
+    media_player.hass = hass
+
+    assert media_player.group_members == [
+        'media_player.living_room',
+        'media_player.kitchen',
+    ]
+    with pytest.raises(ServiceValidationError):
+        await media_player.async_join_players(['media_player.patio'])
@@ -0,0 +1,74 @@
+"""Tests for the amp link metrics."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.anthemav_serial.metrics import (
+    RECENT_SAMPLES,
+    LinkMetrics,
+    OperationStats,
+)
+
+
+def test_durations_fall_into_fixed_buckets() -> None:
+    """Test durations are counted in the bucket of their upper bound."""
+    stats = OperationStats()
+
+    for duration in (3.0, 5.0, 7.0, 9000.0):
+        stats.record(duration, None)
+
+    summary = stats.as_dict()
+    assert summary['buckets_ms']['le_5'] == 2
+    assert summary['buckets_ms']['le_10'] == 1
+    assert summary['buckets_ms']['overflow'] == 1
+    assert summary['max_ms'] == 9000.0
+    assert summary['count'] == 4
+
+
+def test_percentile_reports_bucket_bound() -> None:
+    """Test the percentile is the bound of the bucket reaching the rank."""
+    stats = OperationStats()
+    assert stats.percentile(0.95) is None
+
+    for _ in range(19):
+        stats.record(20.0, None)
+    stats.record(400.0, None)
+
+    assert stats.percentile(0.5) == 25.0
+    assert stats.percentile(0.95) == 25.0
+    assert stats.percentile(1.0) == 500.0
+
+
+def test_measure_counts_outcomes() -> None:
+    """Test successes, timeouts and errors are counted with the last error."""
+    metrics = LinkMetrics()
+
+    with metrics.measure('set_power'):
+        pass
+    with pytest.raises(TimeoutError), metrics.measure('set_power'):
+        raise TimeoutError
+    with pytest.raises(OSError), metrics.measure('set_power'):
+        raise OSError('port closed')
+
+    stats = metrics.get('set_power')
+    assert (stats.success, stats.timeout, stats.error) == (1, 1, 1)
+    assert stats.last_error == 'port closed'
+    assert metrics.as_dict()['set_power']['last_error_at'] is not None
+    assert metrics.get('set_mute') is None
+
+
+def test_recent_command_percentile_is_bounded() -> None:
+    """Test the rolling percentile covers only the last commands sent."""
+    metrics = LinkMetrics()
+    assert metrics.recent_command_percentile(0.95) is None
+
+    for _ in range(RECENT_SAMPLES):
+        metrics.record('set_power', 1000.0)
+    for duration in range(1, RECENT_SAMPLES + 1):
+        operation = 'set_mute' if duration % 2 else 'set_volume'
+        metrics.record(operation, float(duration))
+    metrics.record('refresh', 5000.0)
+
+    assert metrics.recent_command_percentile(0.95) == 95.0
+    assert metrics.recent_command_percentile(0.5) == 50.0
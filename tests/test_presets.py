@@ -0,0 +1,36 @@
+"""Tests for parsing tuner presets."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.anthemav_serial.presets import TunerPreset, parse_presets
+
+
+def test_parse_presets() -> None:
+    """Test presets are parsed in order, skipping blank lines."""
+    presets = parse_presets('KEXP: FM 90.3\n\n  CBC Radio One : am 690 \n')
+
+    assert list(presets) == ['KEXP', 'CBC Radio One']
+    assert presets['KEXP'] == TunerPreset('KEXP', 'fm', 90.3)
+    assert presets['KEXP'].command == 'fm_tune'
+    assert presets['CBC Radio One'].channel == 690
+    assert parse_presets('') == {}
+
+
+@pytest.mark.parametrize(
+    'text',
+    [
+        'FM 90.3',
+        ': FM 90.3',
+        'KEXP: XM 90.3',
+        'KEXP: FM',
+        'KEXP: FM 190.3',
+        'KEXP: AM 90.3',
+        'KEXP: FM 90.3\nKEXP: FM 90.5',
+    ],
+)
+def test_parse_invalid_presets(text: str) -> None:
+    """Test a preset without a name, band or valid frequency is rejected."""
+    with pytest.raises(ValueError, match='Invalid preset'):
+        parse_presets(text)
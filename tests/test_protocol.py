@@ -0,0 +1,342 @@
+"""Tests for the native Anthem Gen1 protocol client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import socket
+import time
+
+import pytest
+
+from custom_components.anthemav_serial.protocol import (
+    TUNER_ZONE,
+    AnthemGen1Client,
+    AnthemGen1Protocol,
+    async_open_client,
+    db_to_volume,
+    decode_status_line,
+    format_command,
+    is_network_port,
+    parse_network_port,
+    volume_to_db,
+)
+
+# 9600 baud, 8N1: 10 bits per byte
+BYTE_TIME = 10 / 9600
+# one-way delay added by the USB-serial adapter (latency timer) or bridge
+LINK_LATENCY = 0.04
+# time the amp needs to process a query before it starts answering
+DEVICE_PROCESSING = 0.005
+
+ZONE_RESPONSES = {
+    1: b'P1S5V-35.5M0\n',
+    2: b'Zone2 Off\n',
+    3: b'P3S0V-40.0M1\n',
+}
+POWER_RESPONSES = {
+    1: b'P1P1\n',
+    2: b'P2P0\n',
+    3: b'P3P1\n',
+}
+
+
+class SlowLinkTransport(asyncio.WriteTransport):
+    """Stand-in for a slow RS232 link to a Gen1 amp.
+
+    Each direction of the link transfers one byte at a time and adds a fixed
+    adapter delay; the simulated amp processes one query at a time.
+    """
+
+    def __init__(
+        self, protocol: AnthemGen1Protocol, silent_zones: set[int] | None = None
+    ) -> None:
+        """Initialize the transport."""
+        super().__init__()
+        self._protocol = protocol
+        self._silent_zones = silent_zones or set()
+        self._loop = asyncio.get_running_loop()
+        self._uplink_free = 0.0
+        self._device_free = 0.0
+        self._downlink_free = 0.0
+        self._closing = False
+        self.writes: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        """Schedule a response for every query in the written data."""
+        self.writes.append(data)
+        now = self._loop.time()
+        for line in data.split(b'\n'):
+            if not line:
+                continue
+            zone = int(line[1:2])
+            if line.endswith(b'P?'):
+                response = POWER_RESPONSES[zone]
+            else:
+                response = ZONE_RESPONSES[zone]
+            self._uplink_free = (
+                max(now, self._uplink_free) + (len(line) + 1) * BYTE_TIME
+            )
+            arrival = self._uplink_free + LINK_LATENCY
+            self._device_free = max(arrival, self._device_free) + DEVICE_PROCESSING
+            if zone in self._silent_zones:
+                continue
+            self._downlink_free = (
+                max(self._device_free, self._downlink_free) + len(response) * BYTE_TIME
+            )
+            self._loop.call_at(
+                self._downlink_free + LINK_LATENCY,
+                self._protocol.data_received,
+                response,
+            )
+
+    def is_closing(self) -> bool:
+        """Return whether the transport is closing."""
+        return self._closing
+
+    def close(self) -> None:
+        """Close the transport."""
+        self._closing = True
+
+
+def _make_client(
+    silent_zones: set[int] | None = None, timeout: float = 1.0
+) -> tuple[AnthemGen1Client, SlowLinkTransport]:
+    """Create a client wired to a slow link stand-in."""
+    client = AnthemGen1Client(timeout=timeout)
+    protocol = AnthemGen1Protocol(client)
+    transport = SlowLinkTransport(protocol, silent_zones)
+    protocol.connection_made(transport)
+    return client, transport
+
+
+def test_format_command() -> None:
+    """Test commands are encoded with the line terminator."""
+    assert format_command('zone_status', zone=2) == b'P2?\n'
+    assert format_command('power_on', zone=1) == b'P1P1\n'
+    assert format_command('fm_tune', channel=90.3) == b'TFT090.3\n'
+    assert format_command('am_tune', channel=690) == b'TAT0690\n'
+    assert format_command('tuner_status') == b'TT?\n'
+
+
+def test_decode_zone_status() -> None:
+    """Test a full zone status line is decoded."""
+    zone, status = decode_status_line('P1S5V-35.5M0')
+    assert zone == 1
+    assert status == {
+        'zone': 1,
+        'power': True,
+        'source': 5,
+        'volume': db_to_volume(-35.5),
+        'mute': False,
+    }
+
+
+def test_volume_level_conversion() -> None:
+    """Test 0-1 levels map onto the dB range on the 0.5 dB grid and back."""
+    assert volume_to_db(0.0) == -95.5
+    assert volume_to_db(1.0) == 0.0
+    assert volume_to_db(0.4) == -57.5
+    assert volume_to_db(1.5) == 0.0
+    assert db_to_volume(-95.5) == 0.0
+    assert db_to_volume(0.0) == 1.0
+    assert db_to_volume(10.0) == 1.0
+    assert volume_to_db(db_to_volume(-40.0)) == -40.0
+    assert format_command('set_volume', zone=1, volume=-57.5) == b'P1VM-57.5\n'
+
+
+def test_decode_zone_off() -> None:
+    """Test zone off responses are decoded."""
+    assert decode_status_line('Zone3 Off') == (3, {'zone': 3, 'power': False})
+    assert decode_status_line('garbage') is None
+
+
+async def test_zone_status_many_single_write() -> None:
+    """Test all zone queries go out in one write."""
+    client, transport = _make_client()
+
+    results = await client.zone_status_many([1, 2, 3])
+
+    assert transport.writes == [b'P1?\nP2?\nP3?\n']
+    assert results[1]['volume'] == db_to_volume(-35.5)
+    assert results[2] == {'zone': 2, 'power': False}
+    assert results[3]['mute'] is True
+
+
+async def test_zone_status_many_isolates_missing_zone() -> None:
+    """Test a zone that never answers does not fail the other zones."""
+    client, _ = _make_client(silent_zones={2}, timeout=0.3)
+
+    results = await client.zone_status_many([1, 2, 3])
+
+    assert results[1]['power'] is True
+    assert isinstance(results[2], TimeoutError)
+    assert results[3]['power'] is True
+
+
+async def test_zone_status_many_not_connected() -> None:
+    """Test every zone reports the connection error when the link is down."""
+    client = AnthemGen1Client()
+
+    results = await client.zone_status_many([1, 2])
+
+    assert isinstance(results[1], ConnectionError)
+    assert isinstance(results[2], ConnectionError)
+
+
+async def test_pipelined_poll_benchmark(
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmark a three zone poll cycle over a simulated 9600 baud link."""
+    zones = [1, 2, 3]
+
+    client, _ = _make_client()
+    start = time.perf_counter()
+    for zone in zones:
+        await client.zone_status(zone)
+    sequential = time.perf_counter() - start
+
+    client, _ = _make_client()
+    start = time.perf_counter()
+    await client.zone_status_many(zones)
+    pipelined = time.perf_counter() - start
+
+    record_property('sequential_poll_ms', sequential * 1000)
+    record_property('pipelined_poll_ms', pipelined * 1000)
+    # one link round trip is saved for every zone after the first
+    assert pipelined < sequential * 0.6
+
+
+def test_decode_partial_status() -> None:
+    """Test the partial lines transmitted on setting changes are decoded."""
+    assert decode_status_line('P2VM-30.0') == (
+        2,
+        {'zone': 2, 'volume': db_to_volume(-30.0)},
+    )
+    assert decode_status_line('P1M1') == (1, {'zone': 1, 'mute': True})
+    assert decode_status_line('P3Sd') == (3, {'zone': 3, 'source': 'd'})
+
+
+def test_decode_tuner_status() -> None:
+    """Test tuner lines decode to the tuner zone with band and frequency."""
+    assert decode_status_line('TFT090.3') == (
+        TUNER_ZONE,
+        {'zone': TUNER_ZONE, 'band': 'fm', 'frequency': 90.3},
+    )
+    assert decode_status_line('TAT0690') == (
+        TUNER_ZONE,
+        {'zone': TUNER_ZONE, 'band': 'am', 'frequency': 690.0},
+    )
+
+
+async def test_unsolicited_status_goes_to_listeners() -> None:
+    """Test status lines that answer no query are handed to listeners."""
+    client, _ = _make_client()
+    received: list[tuple[int, dict]] = []
+    unsub = client.add_listener(lambda zone, status: received.append((zone, status)))
+
+    client.handle_line('P1VM-20.5')
+    client.handle_line('Zone2 Off')
+    unsub()
+    client.handle_line('P1M1')
+
+    assert received == [
+        (1, {'zone': 1, 'volume': db_to_volume(-20.5)}),
+        (2, {'zone': 2, 'power': False}),
+    ]
+
+
+async def test_partial_status_does_not_answer_query() -> None:
+    """Test a partial line arriving mid-query is not taken as the reply."""
+    client, _ = _make_client()
+    received: list[int] = []
+    client.add_listener(lambda zone, status: received.append(zone))
+
+    task = asyncio.ensure_future(client.zone_status(1))
+    await asyncio.sleep(0)
+    client.handle_line('P1M1')
+    status = await task
+
+    assert received == [1]
+    assert status['volume'] == db_to_volume(-35.5)
+
+
+async def test_connection_lost_notifies_listeners() -> None:
+    """Test disconnect listeners run when the link goes away."""
+    client, _ = _make_client()
+    lost: list[bool] = []
+    client.add_disconnect_listener(lambda: lost.append(True))
+
+    client.connection_lost(None)
+
+    assert lost == [True]
+    assert not client.is_connected
+
+
+async def test_query_many_mixes_power_and_status_queries() -> None:
+    """Test power probes and full queries share one write and match by kind."""
+    client, transport = _make_client()
+
+    results = await client.query_many({1: 'zone_status', 2: 'power_status'})
+
+    assert transport.writes == [b'P1?\nP2P?\n']
+    assert results[1]['source'] == 5
+    assert results[2] == {'zone': 2, 'power': False}
+
+
+async def test_power_status_accepts_power_on_line() -> None:
+    """Test a power-on line answers a power query but not a status query."""
+    client, _ = _make_client()
+
+    status = await client.power_status(3)
+
+    assert status == {'zone': 3, 'power': True}
+
+
+def test_parse_network_port() -> None:
+    """Test network bridge URLs are recognized and split."""
+    assert is_network_port('socket://10.0.0.5:4999')
+    assert is_network_port('rfc2217://bridge.local:2217')
+    assert not is_network_port('/dev/ttyUSB0')
+    assert not is_network_port('COM3')
+    assert parse_network_port('socket://10.0.0.5:4999') == ('socket', '10.0.0.5', 4999)
+    with pytest.raises(ValueError):
+        parse_network_port('socket://10.0.0.5')
+
+
+async def test_socket_port_keeps_one_connection() -> None:
+    """Test socket:// ports use one tuned TCP connection for all queries."""
+    connections: list[asyncio.StreamWriter] = []
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer zone status queries like a serial-to-Ethernet bridge."""
+        connections.append(writer)
+        while line := await reader.readline():
+            zone = int(line[1:2])
+            writer.write(ZONE_RESPONSES[zone])
+            await writer.drain()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    try:
+        client = await async_open_client(f'socket://{host}:{port}', {})
+        sock = client._transport.get_extra_info('socket')
+
+        assert (await client.zone_status(1))['volume'] == db_to_volume(-35.5)
+        assert (await client.zone_status_many([2, 3]))[3]['mute'] is True
+        assert len(connections) == 1
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+
+        # the bridge dropping the connection is reported to the coordinator
+        lost: list[bool] = []
+        client.add_disconnect_listener(lambda: lost.append(True))
+        connections[0].close()
+        await asyncio.sleep(0.1)
+        assert lost == [True]
+        assert not client.is_connected
+    finally:
+        server.close()
+        await server.wait_closed()
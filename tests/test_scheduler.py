@@ -0,0 +1,65 @@
+"""Tests for the Anthem AV Serial link scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.anthemav_serial.scheduler import LinkScheduler, Priority
+
+
+async def test_scheduler_grants_by_priority() -> None:
+    """Test waiters are served by priority, then in arrival order."""
+    scheduler = LinkScheduler()
+    order: list[str] = []
+
+    async def use(name: str, priority: Priority) -> None:
+        async with scheduler.slot(priority):
+            order.append(name)
+
+    async with scheduler.slot(Priority.POLL):
+        tasks = [
+            asyncio.create_task(use('poll', Priority.POLL)),
+            asyncio.create_task(use('refresh', Priority.REFRESH)),
+            asyncio.create_task(use('command 1', Priority.COMMAND)),
+            asyncio.create_task(use('command 2', Priority.COMMAND)),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 4
+
+    await asyncio.gather(*tasks)
+
+    assert order == ['command 1', 'command 2', 'refresh', 'poll']
+    assert scheduler.queue_depth == 0
+
+
+async def test_scheduler_cancelled_waiter_is_skipped() -> None:
+    """Test a cancelled waiter does not keep the link busy."""
+    scheduler = LinkScheduler()
+
+    async def use() -> None:
+        async with scheduler.slot(Priority.COMMAND):
+            pass
+
+    async with scheduler.slot(Priority.POLL):
+        task = asyncio.create_task(use())
+        await asyncio.sleep(0)
+        task.cancel()
+
+    async with asyncio.timeout(1):
+        async with scheduler.slot(Priority.POLL):
+            pass
+
+    assert scheduler.stats()['busy'] is False
+
+
+async def test_scheduler_stats() -> None:
+    """Test wait statistics are recorded per priority class."""
+    scheduler = LinkScheduler()
+
+    async with scheduler.slot(Priority.COMMAND):
+        pass
+
+    stats = scheduler.stats()
+    assert stats['queue_depth'] == 0
+    assert stats['wait']['command']['granted'] == 1
+    assert stats['wait']['poll']['granted'] == 0
@@ -0,0 +1,111 @@
+"""Tests for Anthem AV Serial link health sensors."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.anthemav_serial import sensor
+from custom_components.anthemav_serial.const import DOMAIN
+from custom_components.anthemav_serial.coordinator import AnthemAVSerialCoordinator
+from custom_components.anthemav_serial.sensor import SENSORS, AnthemAVSerialSensor
+
+
+@pytest.fixture
+def mock_coordinator() -> MagicMock:
+    """Create a mock coordinator with link statistics."""
+    coordinator = MagicMock(spec=AnthemAVSerialCoordinator)
+    coordinator.last_update_success = False
+    coordinator.last_poll_duration = 42.5
+    coordinator.command_latency_p95 = 18.0
+    coordinator.consecutive_failures = 3
+    coordinator.reconnects = 2
+    coordinator.serial_bytes_per_minute = None
+    return coordinator
+
+
+def _sensors(coordinator: MagicMock) -> dict[str, AnthemAVSerialSensor]:
+    """Create every sensor for the coordinator, keyed by description key."""
+    return {
+        description.key: AnthemAVSerialSensor(
+            coordinator, 'test_entry_id', '123456', description
+        )
+        for description in SENSORS
+    }
+
+
+def test_sensor_values(mock_coordinator: MagicMock) -> None:
+    """Test each sensor reports its coordinator statistic."""
+    sensors = _sensors(mock_coordinator)
+
+    assert sensors['last_poll_duration'].native_value == 42.5
+    assert sensors['command_latency_p95'].native_value == 18.0
+    assert sensors['consecutive_failures'].native_value == 3
+    assert sensors['reconnects'].native_value == 2
+    assert sensors['serial_bytes_per_minute'].native_value is None
+
+
+def test_sensor_available_while_device_unreachable(
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test link health stays reported when polling fails."""
+    sensor = _sensors(mock_coordinator)['consecutive_failures']
+
+    assert sensor.available is True
+    assert sensor.entity_category is EntityCategory.DIAGNOSTIC
+    assert sensor.unique_id == 'anthemav_serial_test_entry_id_consecutive_failures'
+
+
+async def test_sensor_unique_ids_differ_per_entry(
+    hass: HomeAssistant,
+    config_entry_factory: Callable[..., ConfigEntry],
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test receivers sharing the default serial number get distinct sensors."""
+    unique_ids = []
+    for number in (1, 2):
+        entry = config_entry_factory(
+            entry_id=f'entry_{number}', unique_id=f'/dev/ttyUSB{number}_000000'
+        )
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = mock_coordinator
+        added: list[AnthemAVSerialSensor] = []
+        await sensor.async_setup_entry(hass, entry, added.extend)
+        unique_ids.append({entity.unique_id for entity in added})
+
+    assert len(unique_ids[0]) == len(SENSORS)
+    assert unique_ids[0].isdisjoint(unique_ids[1])
+
+
+async def test_sensor_counts_each_failed_connect(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test every failed connect pushes the new failure count to the sensor."""
+    coordinator = AnthemAVSerialCoordinator(hass, mock_config_entry)
+    description = next(d for d in SENSORS if d.key == 'consecutive_failures')
+    failures = AnthemAVSerialSensor(
+        coordinator, mock_config_entry.entry_id, '123456', description
+    )
+    seen: list[int] = []
+    coordinator.async_add_listener(lambda: seen.append(failures.native_value))
+
+    with patch(
+        'custom_components.anthemav_serial.coordinator.get_async_amp_controller',
+        new_callable=AsyncMock,
+        side_effect=OSError('No such device'),
+    ):
+        for attempt in range(3):
+            with patch(
+                'custom_components.anthemav_serial.coordinator.time.monotonic',
+                return_value=time.monotonic() + 120 * attempt,
+            ):
+                assert await coordinator.async_connect() is False
+
+    assert seen == [1, 2, 3]
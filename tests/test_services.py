@@ -0,0 +1,58 @@
+"""Tests for Anthem AV Serial services."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from homeassistant.exceptions import ServiceValidationError
+import pytest
+
+from custom_components.anthemav_serial.coordinator import AnthemAVSerialCoordinator
+from custom_components.anthemav_serial.device_index import build_series_index
+from custom_components.anthemav_serial.services import (
+    BATCH_SCHEMA,
+    _batch_operations,
+)
+
+
+@pytest.fixture
+def mock_coordinator() -> MagicMock:
+    """Create a mock coordinator with two zones."""
+    coordinator = MagicMock(spec=AnthemAVSerialCoordinator)
+    coordinator.series = 'd2v'
+    coordinator.zones = [1, 2]
+    coordinator.index = build_series_index(
+        'd2v', {'sources': {1: {'name': 'CD'}, 2: {'name': 'Tuner'}}}
+    )
+    return coordinator
+
+
+def test_batch_expands_commands(mock_coordinator: MagicMock) -> None:
+    """Test commands expand to operations in setting order, all zones by default."""
+    data = BATCH_SCHEMA(
+        {
+            'commands': [
+                {'power': False},
+                {'zone': '2', 'volume': 0.4, 'source': 'Tuner', 'power': True},
+            ]
+        }
+    )
+
+    assert _batch_operations(mock_coordinator, data['commands']) == [
+        (1, 'power', False),
+        (2, 'power', False),
+        (2, 'power', True),
+        (2, 'source', 2),
+        (2, 'volume', 0.4),
+    ]
+
+
+@pytest.mark.parametrize(
+    'command', [{'zone': 3, 'power': True}, {'zone': 1, 'source': 'Phono'}]
+)
+def test_batch_rejects_invalid_commands(
+    mock_coordinator: MagicMock, command: dict
+) -> None:
+    """Test disabled zones and unknown sources are rejected before sending."""
+    with pytest.raises(ServiceValidationError):
+        _batch_operations(mock_coordinator, [command])
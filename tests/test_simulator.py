@@ -0,0 +1,388 @@
+"""Tests against the pty-backed Gen1 simulator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PORT
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.anthemav_serial.const import (
+    CONF_DISCOVERED_ZONES,
+    CONF_PIPELINED_POLLING,
+    CONF_PRESETS,
+    CONF_PUSH_UPDATES,
+)
+from custom_components.anthemav_serial.coordinator import AnthemAVSerialCoordinator
+from custom_components.anthemav_serial.protocol import (
+    AnthemGen1Client,
+    async_open_client,
+    db_to_volume,
+    volume_to_db,
+)
+
+from .simulator import Gen1Simulator
+
+pytest.importorskip('serial_asyncio')
+
+
+@pytest.fixture
+def simulator_config_entry(
+    anthem_simulator: Gen1Simulator,
+    config_entry_factory: Callable[..., ConfigEntry],
+) -> ConfigEntry:
+    """Create a config entry for the simulated receiver, its zones already probed."""
+    port = anthem_simulator.port
+    return config_entry_factory(
+        data={
+            CONF_PORT: port,
+            CONF_DISCOVERED_ZONES: {f'{port}|d2v': list(anthem_simulator.zones)},
+        },
+        options={CONF_PIPELINED_POLLING: True},
+    )
+
+
+async def _open(simulator: Gen1Simulator, timeout: float = 1.0) -> AnthemGen1Client:
+    """Open the native client on the simulator's pty."""
+    return await async_open_client(simulator.port, {'baudrate': 9600}, timeout)
+
+
+async def test_simulator_answers_status_queries(
+    anthem_simulator: Gen1Simulator,
+) -> None:
+    """Test status queries and commands round-trip over the pty."""
+    anthem_simulator.zones[1].power = True
+    client = await _open(anthem_simulator)
+    try:
+        assert (await client.zone_status(2)) == {'zone': 2, 'power': False}
+
+        await client.set_source(1, 3)
+        await client.set_mute(1, True)
+        status = await client.zone_status(1)
+    finally:
+        await client.close()
+
+    assert status == {
+        'zone': 1,
+        'power': True,
+        'source': 3,
+        'volume': db_to_volume(-40.0),
+        'mute': True,
+    }
+    assert anthem_simulator.received == ['P2?', 'P1S3', 'P1M1', 'P1?']
+
+
+async def test_simulator_volume_level(anthem_simulator: Gen1Simulator) -> None:
+    """Test a 0-1 volume level is sent in dB and read back as a level."""
+    anthem_simulator.zones[1].power = True
+    client = await _open(anthem_simulator)
+    try:
+        await client.set_volume(1, 0.4)
+        status = await client.zone_status(1)
+    finally:
+        await client.close()
+
+    assert anthem_simulator.received[0] == 'P1VM-57.5'
+    assert anthem_simulator.zones[1].volume == -57.5
+    assert status['volume'] == db_to_volume(-57.5)
+    assert 0.0 <= status['volume'] <= 1.0
+
+
+@pytest.mark.parametrize(
+    'anthem_simulator',
+    [{'chunk_size': 3, 'latency': 0.02, 'jitter': 0.01}],
+    indirect=True,
+)
+async def test_simulator_partial_reads(anthem_simulator: Gen1Simulator) -> None:
+    """Test replies split across several reads are framed correctly."""
+    for state in anthem_simulator.zones.values():
+        state.power = True
+    client = await _open(anthem_simulator)
+    try:
+        results = await client.zone_status_many([1, 2, 3])
+    finally:
+        await client.close()
+
+    assert all(results[zone]['power'] is True for zone in (1, 2, 3))
+
+
+@pytest.mark.parametrize('anthem_simulator', [{'drop_rate': 1.0}], indirect=True)
+async def test_simulator_dropped_bytes(anthem_simulator: Gen1Simulator) -> None:
+    """Test a reply lost on the line times out only its own zone."""
+    client = await _open(anthem_simulator, timeout=0.2)
+    try:
+        results = await client.zone_status_many([1, 2])
+    finally:
+        await client.close()
+
+    assert isinstance(results[1], TimeoutError)
+    assert isinstance(results[2], TimeoutError)
+
+
+async def test_simulator_unsolicited_status(anthem_simulator: Gen1Simulator) -> None:
+    """Test front panel changes reach the client's listeners."""
+    client = await _open(anthem_simulator)
+    received: list[tuple[int, dict[str, Any]]] = []
+    client.add_listener(lambda zone, status: received.append((zone, status)))
+    try:
+        anthem_simulator.front_panel(1, power=True, volume=-30.0)
+        await client.zone_status(1)
+    finally:
+        await client.close()
+
+    assert received == [
+        (1, {'zone': 1, 'power': True}),
+        (1, {'zone': 1, 'volume': db_to_volume(-30.0)}),
+    ]
+
+
+@pytest.mark.parametrize('anthem_simulator', [{'zones': (1, 2)}], indirect=True)
+async def test_coordinator_against_simulator(
+    hass: HomeAssistant,
+    anthem_simulator: Gen1Simulator,
+    config_entry_factory: Callable[..., ConfigEntry],
+    mock_device_config: dict,
+) -> None:
+    """Test discovery and pipelined polling against the simulated receiver."""
+    anthem_simulator.zones[1].power = True
+    entry = config_entry_factory(
+        data={CONF_PORT: anthem_simulator.port},
+        options={CONF_PIPELINED_POLLING: True},
+    )
+    coordinator = AnthemAVSerialCoordinator(hass, entry)
+
+    try:
+        with patch.object(hass.config_entries, 'async_update_entry'):
+            data = await coordinator._async_update_data()
+        await coordinator.async_set_volume(1, 0.4)
+    finally:
+        await coordinator.async_disconnect()
+
+    assert coordinator.zones == [1, 2]
+    assert data[1]['source'] == 1
+    assert data[2] == {'zone': 2, 'power': False}
+    assert anthem_simulator.zones[1].volume == -57.5
+    assert coordinator.data[1]['volume'] == db_to_volume(-57.5)
+
+
+async def test_coordinator_wake_up_against_simulator(
+    hass: HomeAssistant,
+    anthem_simulator: Gen1Simulator,
+    simulator_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test a zone woken in standby is read with one status query per poll."""
+    coordinator = AnthemAVSerialCoordinator(hass, simulator_config_entry)
+
+    try:
+        await coordinator.async_refresh()
+        anthem_simulator.zones[2].power = True
+        anthem_simulator.received.clear()
+        await coordinator.async_refresh()
+    finally:
+        await coordinator.async_disconnect()
+
+    # one round trip per zone, the woken zone included
+    assert anthem_simulator.received == ['P1?', 'P2?']
+    assert coordinator.data[1]['power'] is False
+    assert coordinator.data[2]['power'] is True
+    assert coordinator.data[2]['volume'] == db_to_volume(-40.0)
+
+
+async def test_coordinator_volume_steps_against_simulator(
+    hass: HomeAssistant,
+    anthem_simulator: Gen1Simulator,
+    simulator_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test quick volume steps move the zone by whole dB steps from where it is."""
+    anthem_simulator.zones[1].power = True
+    coordinator = AnthemAVSerialCoordinator(hass, simulator_config_entry)
+
+    try:
+        await coordinator.async_refresh()
+        await asyncio.gather(
+            coordinator.async_volume_down(1), coordinator.async_volume_down(1)
+        )
+    finally:
+        await coordinator.async_disconnect()
+
+    assert anthem_simulator.zones[1].volume == -41.0
+    assert coordinator.data[1]['volume'] == db_to_volume(-41.0)
+
+
+@pytest.mark.parametrize(
+    'anthem_simulator', [{'zones': (1, 2), 'power_on_delay': 0.2}], indirect=True
+)
+async def test_coordinator_restore_waits_for_power_on(
+    hass: HomeAssistant,
+    anthem_simulator: Gen1Simulator,
+    simulator_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test a zone turned on by a restore gets its settings once it is ready."""
+    anthem_simulator.zones[2].power = True
+    anthem_simulator.zones[2].source = 3
+    anthem_simulator.zones[2].volume = -30.0
+    coordinator = AnthemAVSerialCoordinator(hass, simulator_config_entry)
+
+    try:
+        await coordinator.async_refresh()
+        coordinator.async_take_snapshot()
+        await coordinator.async_set_power(2, False)
+        with patch(
+            'custom_components.anthemav_serial.coordinator.POWER_ON_POLL_INTERVAL',
+            0.05,
+        ):
+            await coordinator.async_restore_snapshot()
+    finally:
+        await coordinator.async_disconnect()
+
+    zone = anthem_simulator.zones[2]
+    assert (zone.power, zone.source, zone.volume) == (True, 3, -30.0)
+    assert coordinator.data[2]['volume'] == db_to_volume(-30.0)
+
+
+@pytest.mark.parametrize(
+    'anthem_simulator', [{'zones': (1, 2), 'power_on_delay': 0.2}], indirect=True
+)
+async def test_coordinator_party_mode_against_simulator(
+    hass: HomeAssistant,
+    anthem_simulator: Gen1Simulator,
+    simulator_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test a batch turning zones on sets their source and volume once ready."""
+    coordinator = AnthemAVSerialCoordinator(hass, simulator_config_entry)
+
+    try:
+        await coordinator.async_refresh()
+        with patch(
+            'custom_components.anthemav_serial.coordinator.POWER_ON_POLL_INTERVAL',
+            0.05,
+        ):
+            await coordinator.async_batch(
+                (zone, setting, value)
+                for zone in (1, 2)
+                for setting, value in (('power', True), ('source', 3), ('volume', 0.4))
+            )
+    finally:
+        await coordinator.async_disconnect()
+
+    for zone in anthem_simulator.zones.values():
+        assert (zone.power, zone.source, zone.volume) == (True, 3, -57.5)
+    assert coordinator.data[2]['source'] == 3
+
+
+@pytest.mark.parametrize(
+    'anthem_simulator', [{'zones': (1, 2), 'power_on_delay': 0.2}], indirect=True
+)
+async def test_coordinator_group_against_simulator(
+    hass: HomeAssistant,
+    anthem_simulator: Gen1Simulator,
+    simulator_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test a joined zone is turned on at the leader's volume and steps with it."""
+    # the leader was turned up past the volume limit on the front panel
+    anthem_simulator.zones[1].power = True
+    anthem_simulator.zones[1].source = 3
+    anthem_simulator.zones[1].volume = -30.0
+    coordinator = AnthemAVSerialCoordinator(hass, simulator_config_entry)
+
+    try:
+        await coordinator.async_refresh()
+        with patch(
+            'custom_components.anthemav_serial.coordinator.POWER_ON_POLL_INTERVAL',
+            0.05,
+        ):
+            await coordinator.async_join(1, [2])
+        await coordinator.async_volume_down(1)
+    finally:
+        await coordinator.async_disconnect()
+
+    for zone in anthem_simulator.zones.values():
+        assert (zone.power, zone.source, zone.volume) == (True, 3, -30.5)
+
+
+async def test_coordinator_ramp_against_simulator(
+    hass: HomeAssistant,
+    anthem_simulator: Gen1Simulator,
+    simulator_config_entry: ConfigEntry,
+    mock_device_config: dict,
+) -> None:
+    """Test a fade moves the zone steadily from its volume to the target."""
+    anthem_simulator.zones[1].power = True
+    coordinator = AnthemAVSerialCoordinator(hass, simulator_config_entry)
+
+    try:
+        await coordinator.async_refresh()
+        with patch(
+            'custom_components.anthemav_serial.coordinator.RAMP_STEP_INTERVAL', 0.02
+        ):
+            await coordinator.async_ramp_volume(1, 0.3, 0.1)
+            await hass.async_block_till_done(wait_background_tasks=True)
+    finally:
+        await coordinator.async_disconnect()
+
+    levels = [
+        float(line[4:]) for line in anthem_simulator.received if line.startswith('P1VM')
+    ]
+    assert len(levels) == 5
+    assert levels == sorted(levels, reverse=True)
+    assert -40.0 > levels[0] > -50.0
+    assert levels[-1] == volume_to_db(0.3) == anthem_simulator.zones[1].volume
+
+
+@pytest.mark.parametrize('push', [False, True])
+async def test_coordinator_reads_tuner_against_simulator(
+    hass: HomeAssistant,
+    anthem_simulator: Gen1Simulator,
+    simulator_config_entry: ConfigEntry,
+    config_entry_factory: Callable[..., ConfigEntry],
+    mock_device_config: dict,
+    push: bool,
+) -> None:
+    """Test the tuner station is read on connect and, when polling, before a skip.
+
+    With push updates the retune is reported by the amp, so the station is
+    only read on connect.
+    """
+    entry = config_entry_factory(
+        data=simulator_config_entry.data,
+        options={
+            **simulator_config_entry.options,
+            CONF_PRESETS: 'KEXP: FM 90.3\nCBC Radio One: AM 690',
+            CONF_PUSH_UPDATES: push,
+        },
+    )
+    anthem_simulator.zones[1].power = True
+    anthem_simulator.zones[1].source = 2
+    anthem_simulator.tuner = ('am', 690.0)
+    coordinator = AnthemAVSerialCoordinator(hass, entry)
+
+    try:
+        await coordinator.async_refresh()
+        assert coordinator.active_preset == 'CBC Radio One'
+
+        await coordinator.async_select_preset(1, 'KEXP')
+        assert anthem_simulator.tuner == ('fm', 90.3)
+
+        # retuned from the front panel
+        anthem_simulator.retune('fm', 101.5)
+        await asyncio.sleep(0.05)
+        assert coordinator.active_preset == ('KEXP' if not push else None)
+
+        await coordinator.async_select_preset(1, 'KEXP')
+    finally:
+        await coordinator.async_disconnect()
+
+    assert anthem_simulator.tuner == ('fm', 90.3)
+    assert coordinator.active_preset == 'KEXP'
+    assert anthem_simulator.received.count('TFT090.3') == 2
+    assert anthem_simulator.received.count('TT?') == (2 if not push else 1)